@@ -3,6 +3,8 @@ from uuid import UUID
 
 from ports.constraint_port import ConstraintManagementPort
 from infrastructure.auth_client import AuthClient, BaseClient
+from infrastructure.http_clients import http_clients
+from infrastructure.upstream_decoding import upstream_decoder
 from schemas.enums import Authority
 from schemas.api import ApiException
 from domain.external.dss.constraints import ChangeConstraintReferenceResponse
@@ -13,16 +15,20 @@ class ConstraintManagementAdapter(ConstraintManagementPort):
     """Adapter for constraint management operations - direct implementation"""
 
     def __init__(self):
-        # Direct DSS client for constraint deletion
-        settings = Settings()
+        self.settings = Settings()
 
-        self.dss_client = AuthClient(
-            base_url=settings.BRUTM_BASE_URL,
-            aud=settings.DSS_AUDIENCE,
+    @property
+    def dss_client(self) -> AuthClient:
+        """Pooled DSS client for constraint deletion"""
+        return http_clients.get_auth_client(
+            self.settings.BRUTM_BASE_URL, aud=self.settings.DSS_AUDIENCE
         )
 
-        self.geoawareness_client = BaseClient(
-            base_url=f"{settings.BRUTM_BASE_URL}/geoawareness",
+    @property
+    def geoawareness_client(self) -> BaseClient:
+        """Pooled geoawareness utility client"""
+        return http_clients.get_client(
+            f"{self.settings.BRUTM_BASE_URL}/geoawareness"
         )
 
     async def create_constraint(self, constraint_data: dict):
@@ -55,6 +61,6 @@ class ConstraintManagementAdapter(ConstraintManagementPort):
                 f"Error deleting constraint reference: {response.text}"
             )
 
-        return ChangeConstraintReferenceResponse.model_validate(
-            response.json()
+        return await upstream_decoder.decode(
+            response, ChangeConstraintReferenceResponse
         )
@@ -4,6 +4,7 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 from bson import ObjectId
 
+from infrastructure.collection_versions import collection_versions
 from infrastructure.mongodb_client import mongodb_client
 from ports.drone_mapping_repository import DroneMappingRepository
 from domain.drone_mapping import DroneMapping
@@ -39,6 +40,7 @@ class DroneMappingMongoDBAdapter(DroneMappingRepository):
         doc.pop("_id", None)  # Remove _id to let MongoDB generate it
 
         result = await self.collection.insert_one(doc)
+        await collection_versions.bump(self.collection_name)
         drone_mapping._id = str(result.inserted_id)
         return drone_mapping
 
@@ -89,6 +91,7 @@ class DroneMappingMongoDBAdapter(DroneMappingRepository):
         )
 
         if result.modified_count > 0:
+            await collection_versions.bump(self.collection_name)
             return await self.get_by_id(mapping_id)
         return None
 
@@ -105,6 +108,8 @@ class DroneMappingMongoDBAdapter(DroneMappingRepository):
                 }
             },
         )
+        if result.modified_count > 0:
+            await collection_versions.bump(self.collection_name)
         return result.modified_count > 0
 
     async def restore(self, mapping_id: str) -> bool:
@@ -113,6 +118,8 @@ class DroneMappingMongoDBAdapter(DroneMappingRepository):
             {"id": mapping_id, "deleted_at": {"$ne": None}},
             {"$unset": {"deleted_at": "", "deleted_by": ""}},
         )
+        if result.modified_count > 0:
+            await collection_versions.bump(self.collection_name)
         return result.modified_count > 0
 
     async def bulk_create(
@@ -129,6 +136,7 @@ class DroneMappingMongoDBAdapter(DroneMappingRepository):
             docs.append(doc)
 
         result = await self.collection.insert_many(docs)
+        await collection_versions.bump(self.collection_name)
 
         # Update the drone mappings with their new IDs
         for i, inserted_id in enumerate(result.inserted_ids):
@@ -150,3 +158,6 @@ class DroneMappingMongoDBAdapter(DroneMappingRepository):
         })
         return self._from_document(doc) if doc else None
 
+    async def get_version(self) -> int:
+        """Data version, increased on every write to drone mappings"""
+        return await collection_versions.get(self.collection_name)
@@ -1,5 +1,6 @@
 # DSS Adapter - Direct implementation with all infrastructure logic
-from typing import List
+from typing import Awaitable, Callable, Dict, Hashable, List, Tuple
+import asyncio
 import logging
 
 from ports.airspace_port import AirspaceReferencesDataPort
@@ -20,135 +21,304 @@ from domain.external.dss.operational_intents import (
 from domain.external.dss.remoteid import (
     SearchIdentificationServiceAreasResponse,
 )
+from infrastructure.airspace_cache import subscription_coverage
 from infrastructure.auth_client import AuthClient
+from infrastructure.cache import LRUCache
+from infrastructure.fan_out import fan_out
+from infrastructure.http_clients import http_clients
+from infrastructure.spatial_tiles import (
+    Tile,
+    bucket_time_window,
+    reference_grid,
+    reference_tiles,
+    tile_volume,
+)
+from infrastructure.upstream_decoding import upstream_decoder
 from schemas.enums import Authority, RIDAuthority
 from config.config import Settings
 
+# Areas remembered for the untiled error fallback
+_LAST_REFERENCES_MAX_ENTRIES = 256
+
 
 class DSSAdapter(AirspaceReferencesDataPort):
     """Adapter for DSS - contains all infrastructure logic"""
 
     def __init__(self):
-        settings = Settings()
-        self.client = AuthClient(
-            base_url=settings.BRUTM_BASE_URL,
-            aud=settings.DSS_AUDIENCE,
+        self.settings = Settings()
+
+        # Last answer per kind and area, to ride out DSS errors on untiled
+        # queries; keyed by area since the adapter serves every user
+        self._last_references = LRUCache(
+            max_entries=_LAST_REFERENCES_MAX_ENTRIES
         )
 
-        # Simple caching to handle DSS errors
-        self._last_constraints = []
-        self._last_operational_intents = []
-        self._last_isas = []
+        # Tile queries currently running, shared by concurrent requests
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    @property
+    def client(self) -> AuthClient:
+        """Pooled DSS client shared across requests"""
+        return http_clients.get_auth_client(
+            self.settings.BRUTM_BASE_URL, self.settings.DSS_AUDIENCE
+        )
 
     async def get_constraint_references(
         self, area: Volume4D
     ) -> List[ConstraintReference]:
-        """Get constraint references from DSS - direct implementation"""
-        try:
-            params = QueryConstraintReferenceParameters(area_of_interest=area)
+        """Get constraint references from DSS through the tile cache"""
+        return await self._query_tiled(
+            "constraints", area, self._query_constraint_references
+        )
+
+    async def get_operational_intent_references(
+        self, area: Volume4D
+    ) -> List[OperationalIntentReference]:
+        """Get operational intent references from DSS through the tile cache"""
+        return await self._query_tiled(
+            "operational_intents",
+            area,
+            self._query_operational_intent_references,
+        )
+
+    async def get_identification_service_areas(
+        self, area: Volume4D
+    ) -> List[IdentificationServiceArea]:
+        """Get identification service areas from DSS through the tile cache"""
+        return await self._query_tiled(
+            "isas", area, self._query_identification_service_areas
+        )
 
-            response = await self.client.request(
-                "POST",
-                "/dss/v1/constraint_references/query",
-                json=params.model_dump(mode="json"),
-                scope=Authority.CONSTRAINT_PROCESSING,
+    async def _query_tiled(
+        self,
+        kind: str,
+        area: Volume4D,
+        query: Callable[[Volume4D], Awaitable[list]],
+    ) -> list:
+        """
+        Answer an area query from per-tile cached DSS results.
+
+        The area is split into fixed grid tiles and only tiles missing from
+        the cache are queried. Results are merged, de-duplicated by id and
+        limited to the requested time window. Areas too large for the grid
+        are queried directly, and so are areas with many uncached tiles,
+        which are filled a few at a time alongside the direct query.
+        """
+        tiles = reference_grid.tiles_for_volume(area.volume)
+        if not tiles or len(tiles) > self.settings.DSS_TILE_MAX_TILES:
+            return await self._query_untiled(kind, area, query)
+
+        time_start, time_end = bucket_time_window(
+            area, self.settings.DSS_TILE_TIME_BUCKET_SECONDS
+        )
+        keys = {
+            tile: self._tile_key(kind, tile, area, time_start, time_end)
+            for tile in tiles
+        }
+
+        cached = {tile: reference_tiles.get(keys[tile]) for tile in tiles}
+        missing = [tile for tile in tiles if cached[tile] is None]
+
+        def query_tile(tile: Tile) -> Awaitable[list]:
+            return self._query_tile(
+                keys[tile],
+                lambda: query(tile_volume(tile, area, time_start, time_end)),
+            )
+
+        max_missing = self.settings.DSS_TILE_MAX_MISSING
+        if len(missing) > max_missing:
+            # A cold area costs one DSS call, not one per tile; tiles
+            # warm up a few per request for later overlapping views
+            references, *_ = await asyncio.gather(
+                self._query_untiled(kind, area, query),
+                *[query_tile(tile) for tile in missing[:max_missing]],
+                return_exceptions=True,
             )
+            return references
+
+        results = await asyncio.gather(
+            *[query_tile(tile) for tile in missing],
+            return_exceptions=True,
+        )
 
-            if response.status_code != 200:
-                raise ValueError(
-                    f"Error querying constraint references: {response.text}"
+        for tile, result in zip(missing, results):
+            if isinstance(result, Exception):
+                logging.error(
+                    f"Querying {kind} for tile {tile.x},{tile.y} from DSS:"
+                    f" {result}"
                 )
+                # Fall back to the last known answer for the tile, if any
+                result = reference_tiles.get_stale(keys[tile]) or []
+            cached[tile] = result
 
-            query_response = QueryConstraintReferencesResponse.model_validate(
-                response.json()
-            )
-            self._last_constraints = query_response.constraint_references
-            return query_response.constraint_references
+        # Tiles span whole time buckets, so trim to the requested window
+        window = (
+            area.time_start.value.timestamp(),
+            area.time_end.value.timestamp(),
+        )
+        references = []
+        seen = set()
+        for tile in tiles:
+            for reference in cached[tile]:
+                if not self._in_window(reference, window):
+                    continue
+                if reference.id is not None:
+                    if reference.id in seen:
+                        continue
+                    seen.add(reference.id)
+                references.append(reference)
+
+        return references
+
+    async def _query_tile(
+        self, key: Hashable, query: Callable[[], Awaitable[list]]
+    ) -> list:
+        """Query a single tile, joining an identical query already running"""
+        references = reference_tiles.get(key)
+        if references is not None:
+            return references
+
+        task = self._inflight.get(key)
+        if task is None:
+            host = fan_out.host_of(self.settings.BRUTM_BASE_URL)
+            task = asyncio.create_task(fan_out.run(host, query))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        references = await asyncio.shield(task)
+        reference_tiles.set(key, references, ttl_seconds=self._tile_ttl(key))
+        return references
+
+    def _tile_ttl(self, key) -> float:
+        """Tiles kept fresh by a DSS subscription can live much longer"""
+        kind, x, y = key[:3]
+        tile = Tile(x=x, y=y, size=reference_grid.tile_degrees)
+        if subscription_coverage.covers(kind, tile.bounds):
+            return self.settings.DSS_SUBSCRIBED_TILE_TTL
+        return self.settings.DSS_TILE_TTL
 
+    @staticmethod
+    def _in_window(reference, window: Tuple[float, float]) -> bool:
+        """Whether a reference's time range overlaps the window"""
+        start, end = window
+        if reference.time_start and reference.time_start.value:
+            if reference.time_start.value.timestamp() > end:
+                return False
+        if reference.time_end and reference.time_end.value:
+            if reference.time_end.value.timestamp() < start:
+                return False
+        return True
+
+    @staticmethod
+    def _tile_key(kind, tile: Tile, area: Volume4D, time_start, time_end):
+        return (
+            kind,
+            tile.x,
+            tile.y,
+            time_start,
+            time_end,
+            area.volume.altitude_lower.value,
+            area.volume.altitude_upper.value,
+        )
+
+    async def _query_untiled(
+        self,
+        kind: str,
+        area: Volume4D,
+        query: Callable[[Volume4D], Awaitable[list]],
+    ) -> list:
+        """Query the whole area, falling back to the last result for it"""
+        key = (kind, area.model_dump_json())
+        try:
+            references = await query(area)
+            self._last_references.set(key, references)
+            return references
         except Exception as e:
-            logging.error(f"Querying constraints from DSS: {e}")
-            return self._last_constraints
+            logging.error(f"Querying {kind} from DSS: {e}")
+            return self._last_references.get(key) or []
 
-    async def get_operational_intent_references(
+    async def _query_constraint_references(
         self, area: Volume4D
-    ) -> List[OperationalIntentReference]:
-        """Get operational intent references from DSS - direct implementation"""
-        try:
-            params = QueryOperationalIntentReferenceParameters(
-                area_of_interest=area
-            )
+    ) -> List[ConstraintReference]:
+        """Query constraint references from DSS - direct implementation"""
+        params = QueryConstraintReferenceParameters(area_of_interest=area)
+
+        response = await self.client.request(
+            "POST",
+            "/dss/v1/constraint_references/query",
+            json=params.model_dump(mode="json"),
+            scope=Authority.CONSTRAINT_PROCESSING,
+        )
 
-            response = await self.client.request(
-                "POST",
-                "/dss/v1/operational_intent_references/query",
-                json=params.model_dump(mode="json"),
-                scope=Authority.STRATEGIC_COORDINATION,
+        if response.status_code != 200:
+            raise ValueError(
+                f"Error querying constraint references: {response.text}"
             )
 
-            if response.status_code != 200:
-                raise ValueError(
-                    "Error querying operational intent references:"
-                    f" {response.text}"
-                )
+        query_response = await upstream_decoder.decode(
+            response, QueryConstraintReferencesResponse
+        )
+        return query_response.constraint_references
 
-            query_response = (
-                QueryOperationalIntentReferenceResponse.model_validate(
-                    response.json()
-                )
-            )
-            self._last_operational_intents = (
-                query_response.operational_intent_references
+    async def _query_operational_intent_references(
+        self, area: Volume4D
+    ) -> List[OperationalIntentReference]:
+        """Query OI references from DSS - direct implementation"""
+        params = QueryOperationalIntentReferenceParameters(
+            area_of_interest=area
+        )
+
+        response = await self.client.request(
+            "POST",
+            "/dss/v1/operational_intent_references/query",
+            json=params.model_dump(mode="json"),
+            scope=Authority.STRATEGIC_COORDINATION,
+        )
+
+        if response.status_code != 200:
+            raise ValueError(
+                "Error querying operational intent references:"
+                f" {response.text}"
             )
-            return query_response.operational_intent_references
 
-        except Exception as e:
-            logging.error(f"Error querying operational intents from DSS: {e}")
-            return self._last_operational_intents
+        query_response = await upstream_decoder.decode(
+            response, QueryOperationalIntentReferenceResponse
+        )
+        return query_response.operational_intent_references
 
-    async def get_identification_service_areas(
+    async def _query_identification_service_areas(
         self, area: Volume4D
     ) -> List[IdentificationServiceArea]:
-        """Get identification service areas from DSS - direct implementation"""
-        try:
-            if not hasattr(area.volume, "outline_polygon"):
-                return []
-
-            area_string = ",".join([
-                f"{vertex.lat},{vertex.lng}"
-                for vertex in area.volume.outline_polygon.vertices
-            ])
-
-            response = await self.client.request(
-                "GET",
-                "/rid/v2/dss/identification_service_areas",
-                params={
-                    "area": area_string,
-                    "earliest_time": (
-                        area.time_start.value.isoformat("T").replace(
-                            "+00:00", ""
-                        )
-                        + "Z"
-                    ),
-                    "latest_time": (
-                        area.time_end.value.isoformat("T").replace(
-                            "+00:00", ""
-                        )
-                        + "Z"
-                    ),
-                },
-                scope=RIDAuthority.DISPLAY_PROVIDER,
-            )
+        """Query ISAs from DSS - direct implementation"""
+        if not area.volume.outline_polygon:
+            return []
 
-            if response.status_code != 200:
-                raise ValueError(f"Error querying ISAs: {response.text}")
+        area_string = ",".join([
+            f"{vertex.lat},{vertex.lng}"
+            for vertex in area.volume.outline_polygon.vertices
+        ])
 
-            search_response = (
-                SearchIdentificationServiceAreasResponse.model_validate(
-                    response.json()
-                )
-            )
-            self._last_isas = search_response.service_areas
-            return search_response.service_areas
+        response = await self.client.request(
+            "GET",
+            "/rid/v2/dss/identification_service_areas",
+            params={
+                "area": area_string,
+                "earliest_time": (
+                    area.time_start.value.isoformat("T").replace("+00:00", "")
+                    + "Z"
+                ),
+                "latest_time": (
+                    area.time_end.value.isoformat("T").replace("+00:00", "")
+                    + "Z"
+                ),
+            },
+            scope=RIDAuthority.DISPLAY_PROVIDER,
+        )
 
-        except Exception as e:
-            return self._last_isas
+        if response.status_code != 200:
+            raise ValueError(f"Error querying ISAs: {response.text}")
+
+        search_response = await upstream_decoder.decode(
+            response, SearchIdentificationServiceAreasResponse
+        )
+        return search_response.service_areas
@@ -0,0 +1,135 @@
+# DSS Subscription Adapter - strategic coordination subscriptions
+from typing import Optional
+
+from config.config import Settings
+from domain.external.dss import remoteid
+from domain.external.dss.subscriptions import (
+    PutSubscriptionParameters,
+    PutSubscriptionResponse,
+    Subscription,
+)
+from infrastructure.auth_client import AuthClient
+from infrastructure.http_clients import http_clients
+from infrastructure.upstream_decoding import upstream_decoder
+from ports.subscription_port import (
+    AirspaceSubscriptionPort,
+    RemoteIDSubscriptionPort,
+)
+from schemas.enums import Authority, RIDAuthority
+
+
+class _DSSClientMixin:
+    """Pooled DSS client shared by the subscription adapters"""
+
+    def __init__(self):
+        self.settings = Settings()
+
+    @property
+    def client(self) -> AuthClient:
+        """Pooled DSS client shared across requests"""
+        return http_clients.get_auth_client(
+            self.settings.BRUTM_BASE_URL, self.settings.DSS_AUDIENCE
+        )
+
+
+class DSSSubscriptionAdapter(_DSSClientMixin, AirspaceSubscriptionPort):
+    """Adapter for DSS subscriptions - contains all infrastructure logic"""
+
+    @staticmethod
+    def _scope(params: PutSubscriptionParameters) -> Authority:
+        if params.notify_for_operational_intents:
+            return Authority.STRATEGIC_COORDINATION
+        return Authority.CONSTRAINT_PROCESSING
+
+    async def put_subscription(
+        self,
+        subscription_id: str,
+        params: PutSubscriptionParameters,
+        version: Optional[str] = None,
+    ) -> Subscription:
+        """Create a subscription, or renew it when a version is given"""
+        path = f"/dss/v1/subscriptions/{subscription_id}"
+        if version:
+            path = f"{path}/{version}"
+
+        response = await self.client.request(
+            "PUT",
+            path,
+            json=params.model_dump(mode="json"),
+            scope=self._scope(params),
+        )
+
+        if response.status_code != 200:
+            raise ValueError(f"Error putting subscription: {response.text}")
+
+        put_response = await upstream_decoder.decode(
+            response, PutSubscriptionResponse
+        )
+        return put_response.subscription
+
+    async def delete_subscription(
+        self, subscription_id: str, version: str, for_constraints: bool
+    ) -> None:
+        """Delete a subscription from the DSS"""
+        response = await self.client.request(
+            "DELETE",
+            f"/dss/v1/subscriptions/{subscription_id}/{version}",
+            scope=(
+                Authority.CONSTRAINT_PROCESSING
+                if for_constraints
+                else Authority.STRATEGIC_COORDINATION
+            ),
+        )
+
+        if response.status_code not in (200, 404):
+            raise ValueError(
+                f"Error deleting subscription: {response.text}"
+            )
+
+
+class DSSRemoteIDSubscriptionAdapter(
+    _DSSClientMixin, RemoteIDSubscriptionPort
+):
+    """Adapter for Remote ID subscriptions held as a display provider"""
+
+    async def put_subscription(
+        self,
+        subscription_id: str,
+        params: remoteid.CreateSubscriptionParameters,
+        version: Optional[str] = None,
+    ) -> remoteid.PutSubscriptionResponse:
+        """Create a subscription, or renew it when a version is given"""
+        path = f"/rid/v2/dss/subscriptions/{subscription_id}"
+        if version:
+            path = f"{path}/{version}"
+
+        response = await self.client.request(
+            "PUT",
+            path,
+            json=params.model_dump(mode="json"),
+            scope=RIDAuthority.DISPLAY_PROVIDER,
+        )
+
+        if response.status_code != 200:
+            raise ValueError(
+                f"Error putting RID subscription: {response.text}"
+            )
+
+        return await upstream_decoder.decode(
+            response, remoteid.PutSubscriptionResponse
+        )
+
+    async def delete_subscription(
+        self, subscription_id: str, version: str
+    ) -> None:
+        """Delete a Remote ID subscription from the DSS"""
+        response = await self.client.request(
+            "DELETE",
+            f"/rid/v2/dss/subscriptions/{subscription_id}/{version}",
+            scope=RIDAuthority.DISPLAY_PROVIDER,
+        )
+
+        if response.status_code not in (200, 404):
+            raise ValueError(
+                f"Error deleting RID subscription: {response.text}"
+            )
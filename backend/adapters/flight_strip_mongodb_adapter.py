@@ -9,6 +9,7 @@ import logging
 from ports.flight_strip_port import FlightStripRepositoryPort
 from domain.flight_strip import FlightStrip
 from schemas.requests.flight_strip import FlightArea
+from infrastructure.collection_versions import collection_versions
 from infrastructure.mongodb_client import mongodb_client
 
 
@@ -69,6 +70,7 @@ class FlightStripMongoDBAdapter(FlightStripRepositoryPort):
 
             doc = self._to_document(flight_strip)
             result = await self.collection.insert_one(doc)
+            await collection_versions.bump(self.collection_name)
 
             # Retrieve the created document to get the generated ID
             created_doc = await self.collection.find_one(
@@ -127,6 +129,7 @@ class FlightStripMongoDBAdapter(FlightStripRepositoryPort):
                     f"Flight strip with ID {flight_strip.name} not found"
                 )
 
+            await collection_versions.bump(self.collection_name)
             return flight_strip
 
         except Exception as e:
@@ -141,6 +144,8 @@ class FlightStripMongoDBAdapter(FlightStripRepositoryPort):
             result = await self.collection.delete_one(
                 {"name": flight_strip_name}
             )
+            if result.deleted_count > 0:
+                await collection_versions.bump(self.collection_name)
             return result.deleted_count > 0
         except Exception as e:
             logging.error(
@@ -258,6 +263,8 @@ class FlightStripMongoDBAdapter(FlightStripRepositoryPort):
                     }
                 },
             )
+            if result.modified_count > 0:
+                await collection_versions.bump(self.collection_name)
             return result.modified_count > 0
         except Exception as e:
             logging.error(
@@ -286,6 +293,8 @@ class FlightStripMongoDBAdapter(FlightStripRepositoryPort):
                     "$unset": {"deleted_at": "", "deleted_by": ""},
                 },
             )
+            if result.modified_count > 0:
+                await collection_versions.bump(self.collection_name)
             return result.modified_count > 0
         except Exception as e:
             logging.error(
@@ -326,3 +335,7 @@ class FlightStripMongoDBAdapter(FlightStripRepositoryPort):
                 f"Error checking flight strip existence {flight_strip_id}: {e}"
             )
             return False
+
+    async def get_version(self) -> int:
+        """Data version, increased on every write to flight strips"""
+        return await collection_versions.get(self.collection_name)
@@ -1,20 +1,51 @@
 # Flights Adapter - Direct implementation with all infrastructure logic
-from typing import List, Tuple
+from typing import (
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
 from datetime import datetime, timedelta, timezone
+from dataclasses import dataclass
 from pydantic import HttpUrl
+import asyncio
+import time
 
 from ports.flights_port import FlightDataPort
-from domain.flights import Flight
+from domain.flights import BatchFlight, Flight
 from schemas.requests.flights import QueryFlightsRequest
 from domain.external.dss.remoteid import (
+    IdentificationServiceArea,
     SearchIdentificationServiceAreasResponse,
 )
 from config.config import Settings
 from infrastructure.auth_client import AuthClient, BaseClient
+from infrastructure.cache import flight_details_cache
+from infrastructure.fan_out import fan_out
+from infrastructure.http_clients import http_clients
+from infrastructure.live_isas import live_isas
+from infrastructure.spatial_tiles import (
+    Bounds,
+    Tile,
+    distance_km,
+    isa_grid,
+    isa_tiles,
+)
+from infrastructure.upstream_decoding import upstream_decoder
 from schemas.enums import Authority, RIDAuthority
 import logging
 
 
+@dataclass
+class _IsaTile:
+    """ISAs found in one tile and when to refresh them in the background"""
+
+    isas: List[IdentificationServiceArea]
+    refresh_at: float
+
+
 class FlightsAdapter(FlightDataPort):
     """Adapter for flight data - contains all infrastructure logic"""
 
@@ -30,10 +61,28 @@ class FlightsAdapter(FlightDataPort):
         if not self.api_key:
             raise ValueError("BRUTM_KEY must be set in environment variables")
 
-        self.client = BaseClient(base_url=self.base_url)
-        self.dss_client = AuthClient(
-            base_url=self.base_url,
-            aud=settings.DSS_AUDIENCE,
+        self.dss_audience = settings.DSS_AUDIENCE
+        self.max_view_diagonal_km = settings.RID_MAX_VIEW_DIAGONAL_KM
+        self.isa_deadline = settings.RID_ISA_DEADLINE_SECONDS
+
+        # ISA discovery cache
+        self.isa_cache_ttl = settings.RID_ISA_CACHE_TTL
+        self.isa_refresh_ahead = settings.RID_ISA_REFRESH_AHEAD
+        self.isa_max_tiles = settings.RID_ISA_MAX_TILES
+        self.isa_lookahead = timedelta(seconds=settings.RID_ISA_CACHE_TTL)
+        self._isa_inflight: Dict[Hashable, asyncio.Task] = {}
+        self._details_inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+
+    @property
+    def client(self) -> BaseClient:
+        """Pooled BR-UTM client shared across requests"""
+        return http_clients.get_client(self.base_url)
+
+    @property
+    def dss_client(self) -> AuthClient:
+        """Pooled DSS client shared across requests"""
+        return http_clients.get_auth_client(
+            self.base_url, aud=self.dss_audience
         )
 
     async def get_active_flights(
@@ -41,8 +90,126 @@ class FlightsAdapter(FlightDataPort):
     ) -> Tuple[List[Flight], List[dict]]:
         """Get active flights in the specified area - direct implementation"""
 
-        # Build query parameters for the area
-        query_params = {
+        # ISAs covering the area, mostly served from the ISA tile cache
+        isas, _ = await self._get_isas(area)
+
+        # Get flights from every ISA concurrently
+        view = self._build_view(area)
+        results = await self._gather_isa_flights(
+            [(isa, view) for isa in isas]
+        )
+
+        flights: List[Flight] = []
+        errors = []
+        for result, error in results:
+            flights.extend(result)
+            if error is not None:
+                errors.append(error)
+
+        return flights, errors
+
+    async def get_active_flights_batch(
+        self, areas: List[QueryFlightsRequest]
+    ) -> Tuple[List[BatchFlight], List[dict]]:
+        """Get active flights for several rectangles with one ISA search"""
+        union = QueryFlightsRequest(
+            north=max(area.north for area in areas),
+            east=max(area.east for area in areas),
+            south=min(area.south for area in areas),
+            west=min(area.west for area in areas),
+        )
+
+        # A single ISA lookup over the union covers every rectangle
+        isas, coverage = await self._get_isas(union)
+
+        # Ask each USS once, even if it serves several ISAs
+        providers: Dict[str, List[IdentificationServiceArea]] = {}
+        for isa in isas:
+            providers.setdefault(isa.uss_base_url, []).append(isa)
+
+        # USSs reject views larger than the RID limit, so only merge the
+        # rectangles into a single view when the union is small enough
+        if self._view_diagonal_km(union) <= self.max_view_diagonal_km:
+            views = [(union, list(range(len(areas))))]
+        else:
+            views = [(area, [index]) for index, area in enumerate(areas)]
+
+        requests = [
+            (uss_isas[0], view, indices)
+            for uss_isas in providers.values()
+            for view, indices in views
+        ]
+        results = await self._gather_isa_flights(
+            [(isa, self._build_view(view)) for isa, view, _ in requests]
+        )
+
+        flights: Dict[str, BatchFlight] = {}
+        errors = []
+
+        for (isa, _, indices), (result, error) in zip(requests, results):
+            if error is not None:
+                errors.append(error)
+            uss_isas = providers[isa.uss_base_url]
+            for flight in result:
+                if len(uss_isas) > 1:
+                    flight = flight.model_copy(
+                        update={
+                            "identification_service_area": self._isa_at(
+                                flight, uss_isas, coverage
+                            )
+                        }
+                    )
+                rectangles = (
+                    self._rectangles_containing(flight, areas) or indices
+                )
+                existing = flights.get(flight.id)
+                if existing is not None:
+                    existing.rectangles = sorted(
+                        set(existing.rectangles) | set(rectangles)
+                    )
+                    continue
+                flights[flight.id] = BatchFlight(
+                    **dict(flight), rectangles=rectangles
+                )
+
+        return list(flights.values()), errors
+
+    async def _gather_isa_flights(
+        self, requests: List[Tuple[IdentificationServiceArea, str]]
+    ) -> List[Tuple[List[Flight], Optional[dict]]]:
+        """
+        Query every (ISA, view) pair concurrently, each under its own
+        deadline, so a slow USS only loses its own flights. A failed or
+        late ISA answers no flights along with its error.
+        """
+        deadline = self.isa_deadline
+
+        async def query(isa: IdentificationServiceArea, view: str):
+            try:
+                flight_data = await asyncio.wait_for(
+                    self._search_isa_flights(isa, view), timeout=deadline
+                )
+            except asyncio.TimeoutError:
+                error = TimeoutError(f"No response within {deadline}s")
+                return [], self._isa_error(isa, error)
+            except Exception as e:
+                return [], self._isa_error(isa, e)
+            return self._build_flights(isa, flight_data), None
+
+        return await asyncio.gather(
+            *[query(isa, view) for isa, view in requests]
+        )
+
+    @staticmethod
+    def _isa_error(isa: IdentificationServiceArea, error: Exception) -> dict:
+        logging.error(
+            f"Error querying flights for ISA {isa.uss_base_url}: {error}"
+        )
+        return {"error": str(error), "service_area": isa.uss_base_url}
+
+    def _build_query_params(self, area: QueryFlightsRequest) -> dict:
+        """Corner query parameters for a rectangle, clockwise from NW"""
+        return {
             "apikey": self.api_key,
             "lat1": str(area.north),
             "lng1": str(area.west),
@@ -54,32 +221,201 @@ class FlightsAdapter(FlightDataPort):
             "lng4": str(area.west),
         }
 
-        # Query ISAs from DSS
-        isas = await self._query_identification_service_areas(query_params)
+    @staticmethod
+    def _build_view(area: QueryFlightsRequest) -> str:
+        """RID view string from the NW and SE corners of a rectangle"""
+        return ",".join(
+            str(value)
+            for value in (area.north, area.west, area.south, area.east)
+        )
+
+    @staticmethod
+    def _view_diagonal_km(area: QueryFlightsRequest) -> float:
+        return distance_km(area.north, area.west, area.south, area.east)
 
-        # Get flights from each ISA
-        flights: List[Flight] = []
-        errors = []
+    @staticmethod
+    def _isa_at(
+        flight: Flight,
+        isas: List[IdentificationServiceArea],
+        coverage: Dict[str, List[Bounds]],
+    ) -> IdentificationServiceArea:
+        """
+        The ISA of one USS found where the flight is. ISA searches carry
+        no geometry, so each ISA covers the cells it was found in.
+        """
+        if flight.current_state is not None:
+            position = flight.current_state.position
+            for isa in isas:
+                for south, west, north, east in coverage.get(isa.id, []):
+                    if (
+                        south <= position.lat <= north
+                        and west <= position.lng <= east
+                    ):
+                        return isa
+        return isas[0]
 
-        for isa in isas.service_areas:
+    @staticmethod
+    def _rectangles_containing(
+        flight: Flight, areas: List[QueryFlightsRequest]
+    ) -> List[int]:
+        """Indices of the rectangles holding the flight's current position"""
+        if flight.current_state is None:
+            return []
+
+        position = flight.current_state.position
+        return [
+            index
+            for index, area in enumerate(areas)
+            if area.south <= position.lat <= area.north
+            and area.west <= position.lng <= area.east
+        ]
+
+    async def _get_isas(
+        self, area: QueryFlightsRequest
+    ) -> Tuple[List[IdentificationServiceArea], Dict[str, List[Bounds]]]:
+        """
+        ISAs active over an area, answered from per-tile cached searches,
+        along with the bounds of the cells each ISA was found in.
+
+        Areas inside our Remote ID subscriptions are answered from the
+        live ISA set kept by notifications. Elsewhere only tiles missing
+        from the cache reach the DSS; tiles close to expiry are refreshed
+        in the background while the cached answer is served. Areas too
+        large for the grid are searched directly.
+        """
+        bounds = (area.south, area.west, area.north, area.east)
+        subscribed = live_isas.lookup(bounds)
+        if subscribed is not None:
+            return self._merge_cells(
+                (cell.bounds, isas) for cell, isas in subscribed.items()
+            )
+
+        tiles = isa_grid.tiles_for_bounds(bounds)
+        if len(tiles) > self.isa_max_tiles:
             try:
-                isa_flights = await self._get_flights_from_isa(
-                    isa, query_params
+                isas = await self._query_identification_service_areas(
+                    self._build_query_params(area), self.isa_lookahead
                 )
-                flights.extend(isa_flights)
             except Exception as e:
+                logging.error(f"Error querying ISAs from DSS: {e}")
+                return [], {}
+            return self._merge_cells([(bounds, isas)])
+
+        cached: Dict[Tile, Optional[_IsaTile]] = {
+            tile: isa_tiles.get(self._isa_tile_key(tile)) for tile in tiles
+        }
+
+        for tile, entry in cached.items():
+            if entry is not None and time.monotonic() >= entry.refresh_at:
+                self._start_isa_tile_query(tile)
+
+        missing = [tile for tile, entry in cached.items() if entry is None]
+        results = await asyncio.gather(
+            *[
+                asyncio.shield(self._start_isa_tile_query(tile))
+                for tile in missing
+            ],
+            return_exceptions=True,
+        )
+
+        for tile, result in zip(missing, results):
+            if isinstance(result, Exception):
                 logging.error(
-                    f"Error querying flights for ISA {isa.uss_base_url}: {e}"
+                    f"Error querying ISAs for tile {tile.x},{tile.y}: {result}"
                 )
-                errors.append(
-                    {"error": str(e), "service_area": isa.uss_base_url}
+                # Fall back to the last known ISAs for the tile, if any
+                result = isa_tiles.get_stale(self._isa_tile_key(tile))
+            cached[tile] = result
+
+        return self._merge_cells(
+            (tile.bounds, entry.isas)
+            for tile, entry in cached.items()
+            if entry is not None
+        )
+
+    def _merge_cells(
+        self, cells: Iterable[Tuple[Bounds, List[IdentificationServiceArea]]]
+    ) -> Tuple[List[IdentificationServiceArea], Dict[str, List[Bounds]]]:
+        """Active ISAs of several cells and the cells each was found in"""
+        isas: Dict[str, IdentificationServiceArea] = {}
+        coverage: Dict[str, List[Bounds]] = {}
+        for bounds, cell_isas in cells:
+            for isa in cell_isas:
+                isas.setdefault(isa.id, isa)
+                coverage.setdefault(isa.id, []).append(bounds)
+
+        return self._active_isas(list(isas.values())), coverage
+
+    def _start_isa_tile_query(self, tile: Tile) -> asyncio.Task:
+        """Search a tile for ISAs, joining a search already running"""
+        key = self._isa_tile_key(tile)
+        task = self._isa_inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._query_isa_tile(tile))
+            self._isa_inflight[key] = task
+            task.add_done_callback(
+                lambda task: self._on_isa_tile_done(key, task)
+            )
+        return task
+
+    def _on_isa_tile_done(self, key, task: asyncio.Task) -> None:
+        self._isa_inflight.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            logging.debug(f"ISA tile refresh failed: {task.exception()}")
+
+    async def _query_isa_tile(self, tile: Tile) -> "_IsaTile":
+        """Search the DSS for the ISAs of one tile and cache the answer"""
+        south, west, north, east = tile.bounds
+        isas = await self._query_identification_service_areas(
+            self._build_query_params(
+                QueryFlightsRequest(
+                    north=north, east=east, south=south, west=west
                 )
+            ),
+            self.isa_lookahead,
+        )
 
-        return flights, errors
+        # Never keep a tile past the end of the first ISA to expire
+        now = datetime.now(timezone.utc)
+        ttl = self.isa_cache_ttl
+        for isa in isas:
+            remaining = self._utc(isa.time_end.value) - now
+            ttl = min(ttl, remaining.total_seconds())
+        ttl = max(ttl, 1.0)
+
+        entry = _IsaTile(
+            isas=isas,
+            refresh_at=time.monotonic() + max(ttl - self.isa_refresh_ahead, 0),
+        )
+        isa_tiles.set(self._isa_tile_key(tile), entry, ttl_seconds=ttl)
+        return entry
+
+    @staticmethod
+    def _isa_tile_key(tile: Tile):
+        return ("isas", tile.x, tile.y)
+
+    @staticmethod
+    def _utc(value: datetime) -> datetime:
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
+
+    def _active_isas(
+        self, isas: List[IdentificationServiceArea]
+    ) -> List[IdentificationServiceArea]:
+        """ISAs whose time window covers the current poll"""
+        now = datetime.now(timezone.utc)
+        horizon = now + timedelta(seconds=10)
+        return [
+            isa
+            for isa in isas
+            if self._utc(isa.time_start.value) <= horizon
+            and self._utc(isa.time_end.value) >= now
+        ]
 
     async def _query_identification_service_areas(
-        self, query_params: dict
-    ) -> SearchIdentificationServiceAreasResponse:
+        self, query_params: dict, lookahead: timedelta
+    ) -> List[IdentificationServiceArea]:
         """Query ISAs from DSS - moved from DSSRemoteIDService"""
         area = ",".join([
             query_params["lat1"],
@@ -94,104 +430,151 @@ class FlightsAdapter(FlightDataPort):
 
         now = datetime.now(timezone.utc)
         earliest_time = now.isoformat().replace("+00:00", "") + "Z"
-        latest_time = (now + timedelta(seconds=10)).isoformat().replace(
+        latest_time = (now + lookahead).isoformat().replace(
             "+00:00", ""
         ) + "Z"
 
-        try:
-            response = await self.dss_client.request(
-                "GET",
-                "/rid/v2/dss/identification_service_areas",
-                params={
-                    "area": area,
-                    "earliest_time": earliest_time,
-                    "latest_time": latest_time,
-                },
-                scope=RIDAuthority.DISPLAY_PROVIDER,
-            )
+        response = await self.dss_client.request(
+            "GET",
+            "/rid/v2/dss/identification_service_areas",
+            params={
+                "area": area,
+                "earliest_time": earliest_time,
+                "latest_time": latest_time,
+            },
+            scope=RIDAuthority.DISPLAY_PROVIDER,
+        )
 
-            if response.status_code != 200:
-                raise ValueError(f"Error querying ISAs: {response.text}")
+        if response.status_code != 200:
+            raise ValueError(f"Error querying ISAs: {response.text}")
 
-            return SearchIdentificationServiceAreasResponse.model_validate(
-                response.json()
-            )
+        search_response = await upstream_decoder.decode(
+            response, SearchIdentificationServiceAreasResponse
+        )
+        return search_response.service_areas
 
-        except Exception:
-            return SearchIdentificationServiceAreasResponse(service_areas=[])
+    @staticmethod
+    def _uss_client(isa: IdentificationServiceArea) -> AuthClient:
+        """Pooled USS client for the provider of an ISA"""
+        return http_clients.get_auth_client(
+            isa.uss_base_url, aud=HttpUrl(isa.uss_base_url).host
+        )
 
-    async def _get_flights_from_isa(
-        self, isa, query_params: dict
-    ) -> List[Flight]:
-        """Get flights from a specific ISA - moved from USSRemoteIDService logic"""
+    async def _search_isa_flights(
+        self, isa: IdentificationServiceArea, view: str
+    ) -> List[dict]:
+        """Search the provider of an ISA for the flights in a view"""
         if not isa.uss_base_url:
             return []
 
-        # Create USS client for this specific ISA
-        uss_client = AuthClient(
-            base_url=isa.uss_base_url, aud=HttpUrl(isa.uss_base_url).host
+        response = await self._uss_client(isa).request(
+            "GET",
+            "/uss/flights",
+            params={"view": view, "recent_positions_duration": 0},
+            scope=RIDAuthority.DISPLAY_PROVIDER,
         )
 
-        # Search for flights in the area
-        view = ",".join([
-            query_params["lat1"],
-            query_params["lng1"],
-            query_params["lat3"],
-            query_params["lng3"],
-        ])
+        if response.status_code != 200:
+            raise ValueError(f"Error searching flights: {response.text}")
 
-        try:
-            response = await uss_client.request(
-                "GET",
-                "/uss/flights",
-                params={"view": view, "recent_positions_duration": 0},
-                scope=RIDAuthority.DISPLAY_PROVIDER,
-            )
+        flight_response = await upstream_decoder.decode_raw(response)
+        return flight_response.get("flights") or []
 
-            if response.status_code != 200:
-                raise ValueError(f"Error searching flights: {response.text}")
-
-            flight_response = response.json()
-            if not flight_response.get("flights"):
-                return []
-
-            flights = []
-            for flight_data in flight_response["flights"]:
-                # Get flight details
-                details_response = None
-                try:
-                    response = await uss_client.request(
-                        "GET",
-                        f"/uss/flights/{flight_data['id']}/details",
-                        scope=RIDAuthority.DISPLAY_PROVIDER,
-                    )
-                    if response.status_code == 200:
-                        details_response = response.json()
-                except Exception:
-                    pass
-
-                # Create flight object
-                flight_obj = Flight(
-                    id=flight_data["id"],
-                    aircraft_type=flight_data.get("aircraft_type"),
-                    current_state=flight_data.get("current_state"),
-                    operating_area=flight_data.get("operating_area"),
-                    simulated=flight_data.get("simulated", False),
-                    recent_positions=flight_data.get("recent_positions", []),
-                    identification_service_area=isa,
-                    details=(
-                        details_response.get("details")
-                        if details_response
-                        else None
-                    ),
-                )
+    def _build_flights(
+        self, isa: IdentificationServiceArea, flight_data: List[dict]
+    ) -> List[Flight]:
+        """
+        Flights found in an ISA with the details cached so far. Details
+        rarely change during a flight, so those of flights seen for the
+        first time are fetched in the background for the next polls,
+        keeping a slow details endpoint out of the response.
+        """
+        details = {}
+        missing = []
+        for flight in flight_data:
+            cached = flight_details_cache.get((isa.uss_base_url, flight["id"]))
+            if cached is not None:
+                details[flight["id"]] = cached
+            else:
+                missing.append(flight["id"])
+        self._start_details_fetch(isa, missing)
 
-                flights.append(flight_obj)
+        return [
+            Flight(
+                id=flight["id"],
+                aircraft_type=flight.get("aircraft_type"),
+                current_state=flight.get("current_state"),
+                operating_area=flight.get("operating_area"),
+                simulated=flight.get("simulated", False),
+                recent_positions=flight.get("recent_positions", []),
+                identification_service_area=isa,
+                details=details.get(flight["id"]),
+            )
+            for flight in flight_data
+        ]
 
-            return flights
+    def _start_details_fetch(
+        self, isa: IdentificationServiceArea, flight_ids: List[str]
+    ) -> None:
+        """Fetch missing details, skipping flights already being fetched"""
+        uss_base_url = isa.uss_base_url
+        flight_ids = [
+            flight_id
+            for flight_id in flight_ids
+            if (uss_base_url, flight_id) not in self._details_inflight
+        ]
+        if not flight_ids:
+            return
 
-        except Exception as e:
-            logging.error(
-                f"Error getting flights from ISA {isa.uss_base_url}: {e}"
+        task = asyncio.create_task(
+            self._fetch_flights_details(
+                self._uss_client(isa), uss_base_url, flight_ids
             )
-            return []
+        )
+        keys = [(uss_base_url, flight_id) for flight_id in flight_ids]
+        for key in keys:
+            self._details_inflight[key] = task
+        task.add_done_callback(lambda task: self._on_details_done(keys, task))
+
+    def _on_details_done(
+        self, keys: List[Tuple[str, str]], task: asyncio.Task
+    ) -> None:
+        for key in keys:
+            self._details_inflight.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            logging.debug(f"Flight details fetch failed: {task.exception()}")
+
+    async def _fetch_flights_details(
+        self, uss_client: AuthClient, uss_base_url: str, flight_ids: List[str]
+    ) -> None:
+        """Fetch the details of several flights, each cached on arrival"""
+        results = await fan_out.map(
+            lambda flight_id: self._fetch_flight_details(
+                uss_client, uss_base_url, flight_id
+            ),
+            flight_ids,
+            host=lambda _: uss_base_url,
+        )
+
+        for flight_id, result in zip(flight_ids, results):
+            if isinstance(result, Exception):
+                logging.debug(
+                    f"Error getting details of flight {flight_id}: {result}"
+                )
+
+    async def _fetch_flight_details(
+        self, uss_client: AuthClient, uss_base_url: str, flight_id: str
+    ) -> Optional[dict]:
+        """Fetch the details of a single flight from its USS and cache them"""
+        response = await uss_client.request(
+            "GET",
+            f"/uss/flights/{flight_id}/details",
+            scope=RIDAuthority.DISPLAY_PROVIDER,
+        )
+        if response.status_code != 200:
+            raise ValueError(f"Error getting flight details: {response.text}")
+        flight_details = await upstream_decoder.decode_raw(response)
+        details = flight_details.get("details")
+        if details is not None:
+            flight_details_cache.set((uss_base_url, flight_id), details)
+        return details
@@ -0,0 +1,121 @@
+# Live traffic adapter - serves flight queries from the shared poller
+from typing import Dict, List, Optional, Tuple
+
+from domain.flights import BatchFlight, Flight
+from infrastructure.live_traffic import LiveTrafficPoller, live_traffic
+from infrastructure.spatial_tiles import Tile
+from ports.flights_port import FlightDataPort
+from schemas.requests.flights import QueryFlightsRequest
+
+
+class LiveTrafficAdapter(FlightDataPort):
+    """
+    Flight data port that answers from the shared tile poller, so
+    upstream load follows the watched geography instead of the number
+    of clients. Areas spanning too many tiles go straight upstream.
+    """
+
+    def __init__(
+        self,
+        flight_port: FlightDataPort,
+        poller: Optional[LiveTrafficPoller] = None,
+    ):
+        self.flight_port = flight_port
+        self.poller = poller or live_traffic
+
+    async def get_active_flights(
+        self, area: QueryFlightsRequest
+    ) -> Tuple[List[Flight], List[dict]]:
+        """Get active flights in an area from the tile snapshots"""
+        tiles = self._tiles(area)
+        if len(tiles) > self.poller.max_tiles:
+            return await self.flight_port.get_active_flights(area)
+
+        snapshots = await self.poller.snapshots(tiles, self._fetch_tiles)
+
+        flights: Dict[str, Flight] = {}
+        errors = []
+        for snapshot in snapshots.values():
+            errors.extend(
+                error for error in snapshot.errors if error not in errors
+            )
+            for flight in snapshot.flights:
+                if self._contains(area, flight):
+                    flights.setdefault(flight.id, flight)
+
+        return list(flights.values()), errors
+
+    async def get_active_flights_batch(
+        self, areas: List[QueryFlightsRequest]
+    ) -> Tuple[List[BatchFlight], List[dict]]:
+        """Get active flights for several areas from the tile snapshots"""
+        tiles = list(
+            dict.fromkeys(tile for area in areas for tile in self._tiles(area))
+        )
+        if len(tiles) > self.poller.max_tiles:
+            return await self.flight_port.get_active_flights_batch(areas)
+
+        snapshots = await self.poller.snapshots(tiles, self._fetch_tiles)
+
+        flights: Dict[str, BatchFlight] = {}
+        errors = []
+        for snapshot in snapshots.values():
+            errors.extend(
+                error for error in snapshot.errors if error not in errors
+            )
+            for flight in snapshot.flights:
+                if flight.id in flights:
+                    continue
+                rectangles = [
+                    index
+                    for index, area in enumerate(areas)
+                    if self._contains(area, flight)
+                ]
+                if rectangles:
+                    flights[flight.id] = BatchFlight(
+                        **{**dict(flight), "rectangles": rectangles}
+                    )
+
+        return list(flights.values()), errors
+
+    async def _fetch_tiles(
+        self, tiles: List[Tile]
+    ) -> Tuple[Dict[Tile, list], List[dict]]:
+        """
+        Poll several tiles with one batched upstream query, which looks
+        ISAs up once and asks each USS once for all of them.
+        """
+        flights, errors = await self.flight_port.get_active_flights_batch(
+            [self._tile_area(tile) for tile in tiles]
+        )
+
+        by_tile: Dict[Tile, list] = {tile: [] for tile in tiles}
+        for flight in flights:
+            for index in flight.rectangles:
+                by_tile[tiles[index]].append(flight)
+
+        return by_tile, errors
+
+    def _tiles(self, area: QueryFlightsRequest) -> List[Tile]:
+        return self.poller.grid.tiles_for_bounds(
+            (area.south, area.west, area.north, area.east)
+        )
+
+    @staticmethod
+    def _tile_area(tile: Tile) -> QueryFlightsRequest:
+        south, west, north, east = tile.bounds
+        return QueryFlightsRequest(
+            north=north, east=east, south=south, west=west
+        )
+
+    @staticmethod
+    def _contains(area: QueryFlightsRequest, flight: Flight) -> bool:
+        """Whether the flight's current position lies inside the area"""
+        if flight.current_state is None:
+            return False
+
+        position = flight.current_state.position
+        return (
+            area.south <= position.lat <= area.north
+            and area.west <= position.lng <= area.east
+        )
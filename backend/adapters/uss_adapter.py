@@ -1,4 +1,6 @@
 # USS Adapter - Factory pattern for dynamic USS clients with direct implementation
+from typing import Awaitable, Callable, Hashable, Optional, TypeVar
+
 from pydantic import HttpUrl
 
 from domain.external.dss.common import (
@@ -19,15 +21,20 @@ from domain.external.uss.remoteid import (
     GetIdentificationServiceAreaDetailsResponse,
 )
 from infrastructure.auth_client import AuthClient
+from infrastructure.cache import detail_cache, detail_key
+from infrastructure.http_clients import http_clients
+from infrastructure.upstream_decoding import upstream_decoder
 from ports.airspace_port import AirspaceDetailsDataPort
 from schemas.enums import Authority, RIDAuthority
 
+T = TypeVar("T")
+
 
 class USSAdapter(AirspaceDetailsDataPort):
     """Adapter using factory pattern for dynamic USS clients - direct implementation"""
 
     def _create_auth_client(self, base_url: str) -> AuthClient:
-        """Factory method to create USS-specific authenticated clients"""
+        """Factory method to get pooled USS-specific authenticated clients"""
 
         host = HttpUrl(base_url).host
 
@@ -36,13 +43,36 @@ class USSAdapter(AirspaceDetailsDataPort):
                 "Invalid USS base URL provided to the USS Adapter."
             )
 
-        return AuthClient(
-            base_url=base_url,
-            aud=host,
-        )
+        return http_clients.get_auth_client(base_url, aud=host)
+
+    async def _cached(
+        self, key: Optional[Hashable], fetch: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Serve details from the cache unless the reference version moved"""
+        if key is not None:
+            cached = detail_cache.get(key)
+            if cached is not None:
+                return cached
+
+        value = await fetch()
+
+        if key is not None:
+            detail_cache.set(key, value)
+        return value
 
     async def get_constraint_details(
         self, reference: ConstraintReference
+    ) -> Constraint:
+        """Get constraint details, reusing them while unchanged"""
+        return await self._cached(
+            detail_key(
+                "constraint", reference.id, reference.version, reference.ovn
+            ),
+            lambda: self._fetch_constraint_details(reference),
+        )
+
+    async def _fetch_constraint_details(
+        self, reference: ConstraintReference
     ) -> Constraint:
         """Get constraint details using factory-created client - direct implementation"""
         if not reference.uss_base_url:
@@ -63,13 +93,27 @@ class USSAdapter(AirspaceDetailsDataPort):
                 f"Error getting constraint details: {response.text}"
             )
 
-        constraint_response = GetConstraintDetailsResponse.model_validate(
-            response.json()
+        constraint_response = await upstream_decoder.decode(
+            response, GetConstraintDetailsResponse
         )
         return constraint_response.constraint
 
     async def get_operational_intent_details(
         self, reference: OperationalIntentReference
+    ) -> OperationalIntent:
+        """Get operational intent details, reusing them while unchanged"""
+        return await self._cached(
+            detail_key(
+                "operational_intent",
+                reference.id,
+                reference.version,
+                reference.ovn,
+            ),
+            lambda: self._fetch_operational_intent_details(reference),
+        )
+
+    async def _fetch_operational_intent_details(
+        self, reference: OperationalIntentReference
     ) -> OperationalIntent:
         """Get operational intent details using factory-created client - direct implementation"""
         if not reference.uss_base_url:
@@ -91,13 +135,24 @@ class USSAdapter(AirspaceDetailsDataPort):
                 f"Error getting operational intent details: {response.text}"
             )
 
-        oi_response = GetOperationalIntentDetailsResponse.model_validate(
-            response.json()
+        oi_response = await upstream_decoder.decode(
+            response, GetOperationalIntentDetailsResponse
         )
         return oi_response.operational_intent
 
     async def get_identification_service_area_details(
         self, reference: IdentificationServiceArea
+    ) -> IdentificationServiceAreaFull:
+        """Get ISA details, reusing them while unchanged"""
+        return await self._cached(
+            detail_key("isa", reference.id, reference.version),
+            lambda: self._fetch_identification_service_area_details(
+                reference
+            ),
+        )
+
+    async def _fetch_identification_service_area_details(
+        self, reference: IdentificationServiceArea
     ) -> IdentificationServiceAreaFull:
         """Get ISA details using factory-created client - direct implementation"""
         if not reference.uss_base_url:
@@ -117,10 +172,8 @@ class USSAdapter(AirspaceDetailsDataPort):
         if response.status_code != 200:
             raise ValueError(f"Error getting ISA details: {response.text}")
 
-        isa_response = (
-            GetIdentificationServiceAreaDetailsResponse.model_validate(
-                response.json()
-            )
+        isa_response = await upstream_decoder.decode(
+            response, GetIdentificationServiceAreaDetailsResponse
         )
 
         return IdentificationServiceAreaFull(
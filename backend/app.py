@@ -1,7 +1,6 @@
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-from starlette.responses import StreamingResponse
 
 
 from routes.airspace import router as AirspaceRouter
@@ -9,33 +8,68 @@ from routes.constraints import router as ConstraintsRouter
 from routes.health import router as HealthRouter
 from routes.flight_strips import router as FlightStripsRouter
 from routes.drone_mappings import router as DroneMappingsRouter
-from infrastructure.mongodb_client import mongodb_client
-from infrastructure.event_service import EventService
-from infrastructure.correlation import (
-    setup_correlation_logging,
-    CorrelationIdManager,
+from routes.uss_notifications import (
+    router as USSNotificationsRouter,
+    rid_router as USSRemoteIDNotificationsRouter,
+    get_airspace_subscription_use_case,
+    get_remote_id_subscription_use_case,
 )
-from middleware.correlation import CorrelationIdMiddleware
+from infrastructure.mongodb_client import mongodb_client
+from infrastructure.event_service import event_service
+from infrastructure.http_clients import http_clients
+from infrastructure.live_traffic import live_traffic
+from infrastructure.log_queue import log_queue, setup_logging
+from infrastructure.auth_client import AuthService
+from middleware.request_context import RequestContextMiddleware
+from middleware.request_logging import RequestLoggingMiddleware
 from config.config import Settings
-from config.event_mappings import get_event_stream_for_request
-from schemas.api import ApiException
+from schemas.enums import Authority, RIDAuthority
 import logging
 
-# Global settings and event service instances
+# Global settings instance
 settings = Settings()
-event_service = EventService(settings)
+
+
+async def prewarm_tokens() -> None:
+    """Fetch tokens for the DSS and known USS audiences before traffic"""
+    try:
+        auth = AuthService.get_instance()
+    except ValueError as e:
+        logging.warning(f"Skipping token pre-warm: {e}")
+        return
+
+    await auth.prewarm(
+        audiences=[
+            settings.DSS_AUDIENCE,
+            *settings.AUTH_PREWARM_USS_AUDIENCES,
+        ],
+        scopes=[
+            Authority.CONSTRAINT_PROCESSING,
+            Authority.STRATEGIC_COORDINATION,
+            RIDAuthority.DISPLAY_PROVIDER,
+        ],
+    )
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Lifespan event for the FastAPI application.
-    Manages MongoDB connection lifecycle.
+    Manages MongoDB connection, pooled HTTP client and poller lifecycles.
     """
+    # Structured logs written from a background thread, started here so
+    # importing the app does not spawn the writer
+    setup_logging(settings)
+
     # Startup
     try:
         await mongodb_client.connect()
         await mongodb_client.create_indexes()
+        await http_clients.start()
+        await prewarm_tokens()
+        await event_service.start()
+        await get_airspace_subscription_use_case().start()
+        await get_remote_id_subscription_use_case().start()
         logging.info("Application startup completed")
 
         # Log event service configuration
@@ -50,16 +84,25 @@ async def lifespan(app: FastAPI):
 
     except Exception as e:
         logging.error(f"Failed to initialize application: {e}")
+        log_queue.stop()
         raise
 
     yield
 
     # Shutdown
     try:
+        await get_airspace_subscription_use_case().aclose()
+        await get_remote_id_subscription_use_case().aclose()
+        await live_traffic.aclose()
+        # Drain queued events while the pooled clients are still open
+        await event_service.aclose()
+        await http_clients.aclose()
         await mongodb_client.disconnect()
         logging.info("Application shutdown completed")
     except Exception as e:
         logging.error(f"Error during application shutdown: {e}")
+    finally:
+        log_queue.stop()
 
 
 app = FastAPI(
@@ -73,90 +116,22 @@ app = FastAPI(
     root_path="/api",
 )
 
-logging.basicConfig(
-    level=logging.DEBUG,
+# Log requests inside the correlation middleware so lines carry its id
+app.add_middleware(
+    RequestLoggingMiddleware,
+    sample_rate=settings.REQUEST_LOG_SAMPLE_RATE,
+    max_body_bytes=settings.REQUEST_LOG_MAX_BODY_BYTES,
+    redact_headers=settings.REQUEST_LOG_REDACT_HEADERS,
+    exclude_paths=settings.REQUEST_LOG_EXCLUDE_PATHS,
 )
 
-logging.getLogger("pymongo").setLevel(logging.INFO)
-logging.getLogger("motor").setLevel(logging.INFO)
-
-setup_correlation_logging()
-
-
-@app.middleware("http")
-async def dispatch_events_middleware(request: Request, call_next):
-    """
-    Middleware to dispatch events to external event API based on route mappings
-    """
-    # Process the request first
-    response = await call_next(request)
-
-    # Only dispatch events for successful responses (2xx status codes)
-    if settings.EVENT_DISPATCH_ENABLED and 200 <= response.status_code < 300:
-        try:
-            # Get the event stream for this request
-            event_stream = get_event_stream_for_request(
-                method=request.method, path=request.url.path
-            )
-
-            if event_stream:
-                # Dispatch event asynchronously (correlation ID will be automatically retrieved from context)
-                event_service.dispatch_event_async(event_stream)
-
-                logging.debug(
-                    f"Event dispatched: {event_stream} for"
-                    f" {request.method} {request.url.path}"
-                )
-            else:
-                logging.debug(
-                    "No event mapping found for"
-                    f" {request.method} {request.url.path}"
-                )
-
-        except Exception as e:
-            # Don't let event dispatch errors affect the main response
-            logging.error(f"Error in event dispatch middleware: {str(e)}")
-
-    return response
-
-
-@app.middleware("http")
-async def catch_exceptions_middleware(request: Request, call_next):
-    try:
-        # Get correlation ID for logging (will be available from correlation middleware)
-        correlation_id = CorrelationIdManager.get_correlation_id()
-
-        logging.info(
-            f"[API REQUEST] {request.method} {request.url.path} - "
-            f"Headers: {request.headers}, "
-            f"Body: {await request.body()}"
-        )
-        response = await call_next(request)
-        body = b"".join([chunk async for chunk in response.body_iterator])
-        logging.info(
-            f"[API RESPONSE] {request.method} {request.url.path} - Status:"
-            f" {response.status_code}, Headers: {response.headers}, Body:"
-            f"{body}"
-        )
-        return StreamingResponse(
-            iter([body]),
-            status_code=response.status_code,
-            headers=response.headers,
-            media_type=response.media_type,
-            background=response.background,
-        )
-    except Exception as e:
-        if hasattr(e, "status_code"):
-            raise e
-
-        raise ApiException(
-            status_code=500,
-            message=str(e),
-        )
-
-
-# Add correlation ID middleware (should be added early in the middleware stack)
-app.add_middleware(CorrelationIdMiddleware)
+# Correlation ids, error mapping and event emission in a single layer,
+# outside request logging so log lines carry the correlation id
+app.add_middleware(
+    RequestContextMiddleware,
+    event_service=event_service,
+    dispatch_events=settings.EVENT_DISPATCH_ENABLED,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -164,6 +139,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Lets the browser read ETags to send back in If-None-Match
+    expose_headers=["ETag"],
 )
 
 app.include_router(AirspaceRouter, tags=["Airspace"])
@@ -171,3 +148,7 @@ app.include_router(ConstraintsRouter, tags=["Constraints"])
 app.include_router(HealthRouter, tags=["Health"])
 app.include_router(FlightStripsRouter, tags=["Flight Strips"])
 app.include_router(DroneMappingsRouter, tags=["Drone Mappings"])
+app.include_router(USSNotificationsRouter, tags=["USS Notifications"])
+app.include_router(
+    USSRemoteIDNotificationsRouter, tags=["USS Notifications"]
+)
@@ -0,0 +1,190 @@
+# Application layer - DSS subscriptions and USS notification handling
+from http import HTTPStatus
+from typing import List, Optional, Tuple
+import logging
+
+from application.cell_subscriptions import (
+    CellSubscription,
+    CellSubscriptions,
+    subscription_extents,
+)
+from config.config import Settings
+from domain.base import Volume4D
+from domain.external.dss.common import SubscriptionState
+from domain.external.dss.subscriptions import PutSubscriptionParameters
+from domain.external.uss.constraints import PutConstraintDetailsParameters
+from domain.external.uss.operational_intents import (
+    PutOperationalIntentDetailsParameters,
+)
+from infrastructure.airspace_cache import (
+    subscription_coverage,
+    update_details,
+    update_reference_tiles,
+)
+from infrastructure.spatial_tiles import Tile, TileGrid, volume_bounds
+from ports.subscription_port import AirspaceSubscriptionPort
+from schemas.api import ApiException
+
+# Subscribed kinds: one DSS subscription per kind, since each needs its
+# own scope when it is created
+OPERATIONAL_INTENTS = "operational_intents"
+CONSTRAINTS = "constraints"
+
+
+class AirspaceSubscriptionUseCase:
+    """
+    Keeps DSS subscriptions over the grid cells clients are watching and
+    applies the resulting USS notifications to the reference and detail
+    caches, so watched areas stay fresh without polling the DSS.
+    """
+
+    def __init__(self, subscription_port: AirspaceSubscriptionPort):
+        settings = Settings()
+        self.subscription_port = subscription_port
+        self.uss_base_url = settings.USS_BASE_URL
+        self.grid = TileGrid(settings.SCD_SUBSCRIPTION_CELL_DEGREES)
+        self.max_cells = settings.SCD_SUBSCRIPTION_MAX_CELLS
+
+        self.subscriptions: CellSubscriptions[Tuple[Tile, str]] = (
+            CellSubscriptions(
+                put=self._put,
+                delete=self._delete,
+                duration=settings.SCD_SUBSCRIPTION_DURATION,
+                renew_before=settings.SCD_SUBSCRIPTION_RENEW_BEFORE,
+                idle_timeout=settings.SCD_SUBSCRIPTION_IDLE_TIMEOUT,
+            )
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Subscriptions need a public base URL for the DSS to call back"""
+        return bool(self.uss_base_url)
+
+    def watch(self, area: Volume4D) -> None:
+        """Record interest in an area, subscribing to its cells if needed"""
+        if not self.enabled:
+            return
+
+        bounds = volume_bounds(area.volume)
+        if bounds is None:
+            return
+
+        cells = self.grid.tiles_for_bounds(bounds)
+        if len(cells) > self.max_cells:
+            # Too large to subscribe to; the area keeps being polled
+            return
+
+        self.subscriptions.watch(
+            (cell, kind)
+            for cell in cells
+            for kind in (OPERATIONAL_INTENTS, CONSTRAINTS)
+        )
+
+    async def _put(
+        self,
+        key: Tuple[Tile, str],
+        subscription_id: str,
+        version: Optional[str],
+    ) -> Optional[str]:
+        """Create or renew the subscription of one kind over a cell"""
+        cell, kind = key
+        duration = self.subscriptions.duration
+        params = PutSubscriptionParameters(
+            extents=subscription_extents(cell, duration),
+            uss_base_url=self.uss_base_url,
+            notify_for_operational_intents=kind == OPERATIONAL_INTENTS,
+            notify_for_constraints=kind == CONSTRAINTS,
+        )
+
+        try:
+            subscription = await self.subscription_port.put_subscription(
+                subscription_id, params, version=version
+            )
+        except Exception as e:
+            logging.error(
+                f"Error subscribing to {kind} on cell {cell.x},{cell.y}: {e}"
+            )
+            return None
+
+        subscription_coverage.add(
+            subscription_id, kind, cell.bounds, duration
+        )
+        return subscription.version
+
+    async def _delete(
+        self, key: Tuple[Tile, str], subscription: CellSubscription
+    ) -> None:
+        _, kind = key
+        subscription_coverage.remove(subscription.id)
+        if not subscription.version:
+            return
+
+        try:
+            await self.subscription_port.delete_subscription(
+                subscription.id,
+                subscription.version,
+                for_constraints=kind == CONSTRAINTS,
+            )
+        except Exception as e:
+            logging.error(
+                f"Error deleting subscription {subscription.id}: {e}"
+            )
+
+    async def start(self) -> None:
+        """Start the background subscription maintenance"""
+        if self.enabled:
+            await self.subscriptions.start()
+
+    async def aclose(self) -> None:
+        """Stop maintenance and remove every subscription from the DSS"""
+        await self.subscriptions.aclose()
+
+    def _check_subscriptions(self, states: List[SubscriptionState]) -> None:
+        """Reject notifications that are not for one of our subscriptions"""
+        if not any(
+            subscription_coverage.owns(state.subscription_id)
+            for state in states
+        ):
+            raise ApiException(
+                status_code=HTTPStatus.BAD_REQUEST,
+                message="Notification is not for an active subscription",
+                details={
+                    "subscriptions": [
+                        str(state.subscription_id) for state in states
+                    ]
+                },
+            )
+
+    async def notify_operational_intent(
+        self, params: PutOperationalIntentDetailsParameters
+    ) -> None:
+        """Apply a changed or removed operational intent to the caches"""
+        self._check_subscriptions(params.subscriptions)
+
+        operational_intent = params.operational_intent
+        update_details(
+            "operational_intent",
+            params.operational_intent_id,
+            operational_intent,
+        )
+        update_reference_tiles(
+            OPERATIONAL_INTENTS,
+            params.operational_intent_id,
+            operational_intent.reference if operational_intent else None,
+            operational_intent.details.volumes if operational_intent else None,
+        )
+
+    async def notify_constraint(
+        self, params: PutConstraintDetailsParameters
+    ) -> None:
+        """Apply a changed or removed constraint to the caches"""
+        self._check_subscriptions(params.subscriptions)
+
+        constraint = params.constraint
+        update_details("constraint", params.constraint_id, constraint)
+        update_reference_tiles(
+            CONSTRAINTS,
+            params.constraint_id,
+            constraint.reference if constraint else None,
+            constraint.details.volumes if constraint else None,
+        )
@@ -1,19 +1,36 @@
 # Application layer - use cases that orchestrate domain logic
 from http import HTTPStatus
-from typing import List
+from typing import AsyncIterator, List, Optional
 from datetime import datetime
 from config.config import Settings
+import asyncio
 import logging
 
-from domain.airspace import AirspaceAllocations, AirspaceFlights
+from domain.airspace import (
+    AirspaceAllocations,
+    AirspaceFlights,
+    AirspaceFlightsBatch,
+    AirspaceFlightsDelta,
+)
 from mock.flight_data import generate_flight_mock_data
 from ports.airspace_port import (
     AirspaceDetailsDataPort,
     AirspaceReferencesDataPort,
 )
 from ports.flights_port import FlightDataPort
+from application.airspace_subscription_use_case import (
+    AirspaceSubscriptionUseCase,
+)
+from application.remote_id_subscription_use_case import (
+    RemoteIDSubscriptionUseCase,
+)
+from infrastructure.cache import detail_key, simplified_cache
+from infrastructure.fan_out import fan_out
+from infrastructure.flight_deltas import flight_deltas
+from infrastructure.spatial_tiles import Bounds, volume_bounds
 from domain.base import Volume4D
-from domain.flights import Flight
+from domain.geometry import simplify_volume, tolerance_bucket
+from domain.flights import BatchFlight, Flight
 from schemas.api import ApiException
 from schemas.requests.flights import QueryFlightsRequest
 from domain.external.uss.common import OperationalIntent, Constraint
@@ -30,37 +47,83 @@ class AirspaceQueryUseCase:
         airspace_references_port: AirspaceReferencesDataPort,
         airspace_details_port: AirspaceDetailsDataPort,
         flight_port: FlightDataPort,
+        subscriptions: Optional[AirspaceSubscriptionUseCase] = None,
+        rid_subscriptions: Optional[RemoteIDSubscriptionUseCase] = None,
     ):
         self.airspace_reference_port = airspace_references_port
         self.airspace_details_port = airspace_details_port
         self.flight_port = flight_port
+        self.subscriptions = subscriptions
+        self.rid_subscriptions = rid_subscriptions
 
     async def get_airspace_allocations(
-        self, area_of_interest: Volume4D
+        self, area_of_interest: Volume4D, tolerance: Optional[float] = None
     ) -> AirspaceAllocations:
-        """Get complete airspace snapshot for given area"""
+        """
+        Get complete airspace snapshot for given area, with volume
+        outlines simplified to `tolerance` metres when one is given
+        """
+
+        # Keep DSS subscriptions on watched areas so their cached
+        # references are refreshed by notifications
+        if self.subscriptions is not None:
+            self.subscriptions.watch(area_of_interest)
 
         # Fetch references from DSS
-        constraint_refs = (
-            await self.airspace_reference_port.get_constraint_references(
-                area_of_interest
+        constraint_refs, operational_intent_refs, isa_refs = (
+            await asyncio.gather(
+                self.airspace_reference_port.get_constraint_references(
+                    area_of_interest
+                ),
+                self.airspace_reference_port.get_operational_intent_references(
+                    area_of_interest
+                ),
+                self.airspace_reference_port.get_identification_service_areas(
+                    area_of_interest
+                ),
             )
         )
 
-        operational_intent_refs = await self.airspace_reference_port.get_operational_intent_references(
-            area_of_interest
+        # Fetch detailed information from USS
+        constraints, operational_intents, identification_service_areas = (
+            await asyncio.gather(
+                self._get_constraint_details(constraint_refs),
+                self._get_operational_intent_details(
+                    operational_intent_refs
+                ),
+                self._get_isa_details(isa_refs),
+            )
         )
 
-        isa_refs = await self.airspace_reference_port.get_identification_service_areas(
-            area_of_interest
-        )
+        # References are matched per tile, so entities just outside the
+        # area can come back; keep those whose volumes reach into it
+        area_bounds = volume_bounds(area_of_interest.volume)
+        constraints = [
+            entity
+            for entity in constraints
+            if self._overlaps(entity, area_bounds)
+        ]
+        operational_intents = [
+            entity
+            for entity in operational_intents
+            if self._overlaps(entity, area_bounds)
+        ]
+        identification_service_areas = [
+            entity
+            for entity in identification_service_areas
+            if self._overlaps(entity, area_bounds)
+        ]
 
-        # Fetch detailed information from USS
-        constraints = await self._get_constraint_details(constraint_refs)
-        operational_intents = await self._get_operational_intent_details(
-            operational_intent_refs
-        )
-        identification_service_areas = await self._get_isa_details(isa_refs)
+        if tolerance is not None:
+            bucket = tolerance_bucket(tolerance)
+            constraints = [
+                self._simplified("constraint", entity, bucket)
+                for entity in constraints
+            ]
+            operational_intents = [
+                self._simplified("operational_intent", entity, bucket)
+                for entity in operational_intents
+            ]
 
         return AirspaceAllocations(
             timestamp=datetime.now(),
@@ -75,6 +138,11 @@ class AirspaceQueryUseCase:
     ) -> AirspaceFlights:
         """Get active flights in a given area"""
 
+        # Keep Remote ID subscriptions on watched areas so their ISAs are
+        # pushed to us instead of searched for on every poll
+        if self.rid_subscriptions is not None:
+            self.rid_subscriptions.watch(area)
+
         flights, errors = await self.flight_port.get_active_flights(area)
 
         if not flights and errors:
@@ -95,53 +163,168 @@ class AirspaceQueryUseCase:
             flights=flights,
         )
 
-    async def _get_constraint_details(self, references) -> List[Constraint]:
-        """Fetch constraint details with error handling"""
-        constraints = []
-        for ref in references:
+    async def get_active_flights_delta(
+        self, area: QueryFlightsRequest, since: Optional[str]
+    ) -> AirspaceFlightsDelta:
+        """Get the changes to the active flights in an area since a cursor"""
+        snapshot = await self.get_active_flights(area)
+        return flight_deltas.diff(since, snapshot.flights, snapshot.timestamp)
+
+    async def stream_active_flights(
+        self, area: QueryFlightsRequest, interval: float
+    ) -> AsyncIterator[AirspaceFlights]:
+        """Poll active flights in an area every `interval` seconds"""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            started = loop.time()
+            snapshot = None
             try:
-                if ref.uss_base_url and ref.id:
-                    constraint = await self.airspace_details_port.get_constraint_details(
-                        ref
-                    )
-                    constraints.append(constraint)
+                snapshot = await self.get_active_flights(area)
+            except ApiException as e:
+                logging.warning(f"Flight stream poll failed: {e.message}")
             except Exception as e:
-                logging.error(f"Fetching constraint {ref.id}: {e}")
-                continue
-        return constraints
+                logging.error(f"Flight stream poll failed: {e}")
+
+            if snapshot is not None:
+                yield snapshot
+
+            await asyncio.sleep(max(interval - (loop.time() - started), 0))
+
+    async def get_active_flights_batch(
+        self, areas: List[QueryFlightsRequest]
+    ) -> AirspaceFlightsBatch:
+        """Get active flights in several areas with shared upstream calls"""
+        if self.rid_subscriptions is not None:
+            for area in areas:
+                self.rid_subscriptions.watch(area)
+
+        flights, errors = await self.flight_port.get_active_flights_batch(
+            areas
+        )
+
+        if not flights and errors:
+            raise ApiException(
+                status_code=HTTPStatus.PARTIAL_CONTENT,
+                message="Errors fetching flight data",
+                details={
+                    "errors": errors,
+                    "flights_retrieved": len(flights),
+                },
+            )
+
+        if Settings().ENV == "dev":
+            flights = flights + [
+                BatchFlight(**dict(flight), rectangles=[])
+                for flight in generate_flight_mock_data()
+            ]
+
+        return AirspaceFlightsBatch(
+            timestamp=datetime.now(),
+            flights=flights,
+        )
+
+    @staticmethod
+    def _overlaps(entity, area_bounds: Optional[Bounds]) -> bool:
+        """Whether any volume of an entity overlaps the area's bounds"""
+        volumes = list(entity.details.volumes or [])
+        volumes += getattr(entity.details, "off_nominal_volumes", None) or []
+        if area_bounds is None or not volumes:
+            return True
+
+        south, west, north, east = area_bounds
+        for volume in volumes:
+            bounds = volume_bounds(volume.volume)
+            if bounds is None or not (
+                bounds[2] < south
+                or bounds[0] > north
+                or bounds[3] < west
+                or bounds[1] > east
+            ):
+                return True
+        return False
+
+    @staticmethod
+    def _simplified(kind: str, entity, tolerance: float):
+        """
+        Copy of a constraint or operational intent with simplified volume
+        outlines, cached per entity version and tolerance bucket. The
+        cached details themselves are never modified.
+        """
+        key = detail_key(
+            kind,
+            entity.reference.id,
+            entity.reference.version,
+            entity.reference.ovn,
+        )
+        if key is not None:
+            key = (*key, tolerance)
+            cached = simplified_cache.get(key)
+            if cached is not None:
+                return cached
+
+        details = entity.details
+        update = {
+            "volumes": [
+                simplify_volume(volume, tolerance)
+                for volume in details.volumes
+            ]
+        }
+        if getattr(details, "off_nominal_volumes", None):
+            update["off_nominal_volumes"] = [
+                simplify_volume(volume, tolerance)
+                for volume in details.off_nominal_volumes
+            ]
+
+        simplified = entity.model_copy(
+            update={"details": details.model_copy(update=update)}
+        )
+        if key is not None:
+            simplified_cache.set(key, simplified)
+        return simplified
+
+    async def _get_constraint_details(self, references) -> List[Constraint]:
+        """Fetch constraint details with error handling"""
+        return await self._fetch_details(
+            references,
+            self.airspace_details_port.get_constraint_details,
+            "constraint",
+        )
 
     async def _get_operational_intent_details(
         self, references
     ) -> List[OperationalIntent]:
         """Fetch operational intent details with error handling"""
-        operational_intents = []
-        for ref in references:
-            try:
-                if ref.uss_base_url and ref.id:
-                    oi = await self.airspace_details_port.get_operational_intent_details(
-                        ref
-                    )
-                    operational_intents.append(oi)
-            except Exception as e:
-                logging.error(
-                    f"Error fetching operational intent {ref.id}: {e}"
-                )
-                continue
-        return operational_intents
+        return await self._fetch_details(
+            references,
+            self.airspace_details_port.get_operational_intent_details,
+            "operational intent",
+        )
 
     async def _get_isa_details(
         self, references
     ) -> List[IdentificationServiceAreaFull]:
         """Fetch ISA details with error handling"""
-        isas = []
-        for ref in references:
-            try:
-                if ref.uss_base_url and ref.id:
-                    isa = await self.airspace_details_port.get_identification_service_area_details(
-                        ref
-                    )
-                    isas.append(isa)
-            except Exception as e:
-                logging.error(f"Error fetching ISA {ref.id}: {e}")
+        return await self._fetch_details(
+            references,
+            self.airspace_details_port.get_identification_service_area_details,
+            "ISA",
+        )
+
+    async def _fetch_details(self, references, fetch, kind: str) -> list:
+        """Fetch details for every reference concurrently, skipping failures"""
+        references = [
+            ref for ref in references if ref.uss_base_url and ref.id
+        ]
+
+        results = await fan_out.map(
+            fetch, references, host=lambda ref: ref.uss_base_url
+        )
+
+        details = []
+        for ref, result in zip(references, results):
+            if isinstance(result, Exception):
+                logging.error(f"Error fetching {kind} {ref.id}: {result}")
                 continue
-        return isas
+            details.append(result)
+        return details
@@ -0,0 +1,161 @@
+# Application layer - upkeep of DSS subscriptions over watched grid cells
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Optional,
+    TypeVar,
+)
+from uuid import uuid4
+import asyncio
+import time
+
+from domain.base import Altitude, Time, Volume3D, Volume4D
+from infrastructure.spatial_tiles import Tile
+from schemas.enums import AltitudeReference, AltitudeUnits
+
+K = TypeVar("K", bound=Hashable)
+
+# Subscriptions cover every altitude a UTM volume or Remote ID flight can
+# reasonably use
+SUBSCRIPTION_ALTITUDE_LOWER = -1000.0
+SUBSCRIPTION_ALTITUDE_UPPER = 10000.0
+
+
+@dataclass
+class CellSubscription:
+    """Our DSS subscription over one grid cell"""
+
+    id: str
+    version: Optional[str] = None
+    expires_at: float = 0.0
+    last_watched: float = field(default_factory=time.monotonic)
+
+
+def _altitude(value: float) -> Altitude:
+    return Altitude(
+        value=value,
+        reference=AltitudeReference.W84,
+        units=AltitudeUnits.M,
+    )
+
+
+def subscription_extents(cell: Tile, duration: float) -> Volume4D:
+    """Extents of a subscription over a whole cell, starting now"""
+    now = datetime.now(timezone.utc)
+    return Volume4D(
+        volume=Volume3D(
+            outline_polygon=cell.polygon(),
+            altitude_lower=_altitude(SUBSCRIPTION_ALTITUDE_LOWER),
+            altitude_upper=_altitude(SUBSCRIPTION_ALTITUDE_UPPER),
+        ),
+        time_start=Time(value=now),
+        time_end=Time(value=now + timedelta(seconds=duration)),
+    )
+
+
+# (key, subscription id, current version) -> new version, None on failure
+PutSubscription = Callable[[K, str, Optional[str]], Awaitable[Optional[str]]]
+DeleteSubscription = Callable[[K, CellSubscription], Awaitable[None]]
+
+
+class CellSubscriptions(Generic[K]):
+    """
+    Our DSS subscriptions keyed by watched grid cell. Subscribes on first
+    interest, renews subscriptions still watched before they expire and
+    deletes abandoned ones; talking to the DSS is left to `put` and
+    `delete`.
+    """
+
+    def __init__(
+        self,
+        put: PutSubscription,
+        delete: DeleteSubscription,
+        duration: float,
+        renew_before: float,
+        idle_timeout: float,
+    ):
+        self._put_subscription = put
+        self._delete_subscription = delete
+        self.duration = duration
+        self.renew_before = renew_before
+        self.idle_timeout = idle_timeout
+
+        self._subscriptions: Dict[K, CellSubscription] = {}
+        self._pending: Dict[K, asyncio.Task] = {}
+        self._maintainer: Optional[asyncio.Task] = None
+
+    def watch(self, keys: Iterable[K]) -> None:
+        """Record interest in cells, subscribing to new ones"""
+        now = time.monotonic()
+        for key in keys:
+            subscription = self._subscriptions.get(key)
+            if subscription is not None:
+                subscription.last_watched = now
+            else:
+                self._schedule_put(key)
+
+    def _schedule_put(self, key: K) -> None:
+        if key in self._pending:
+            return
+
+        task = asyncio.create_task(self._put(key))
+        self._pending[key] = task
+        task.add_done_callback(lambda _: self._pending.pop(key, None))
+
+    async def _put(self, key: K) -> None:
+        """Create or renew the subscription of one cell"""
+        current = self._subscriptions.get(key)
+        subscription_id = current.id if current else str(uuid4())
+
+        version = await self._put_subscription(
+            key, subscription_id, current.version if current else None
+        )
+        if version is None:
+            return
+
+        entry = current or CellSubscription(id=subscription_id)
+        entry.version = version
+        entry.expires_at = time.monotonic() + self.duration
+        self._subscriptions[key] = entry
+
+    async def _delete(self, key: K) -> None:
+        subscription = self._subscriptions.pop(key, None)
+        if subscription is not None:
+            await self._delete_subscription(key, subscription)
+
+    async def _maintain(self) -> None:
+        """Renew watched subscriptions and drop abandoned ones"""
+        interval = max(min(self.renew_before, self.idle_timeout) / 2, 1.0)
+        while True:
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+
+            for key, subscription in list(self._subscriptions.items()):
+                if now - subscription.last_watched > self.idle_timeout:
+                    await self._delete(key)
+                elif subscription.expires_at - now < self.renew_before:
+                    self._schedule_put(key)
+
+    async def start(self) -> None:
+        """Start the background subscription maintenance"""
+        if self._maintainer is None:
+            self._maintainer = asyncio.create_task(self._maintain())
+
+    async def aclose(self) -> None:
+        """Stop maintenance and delete every subscription"""
+        if self._maintainer is not None:
+            self._maintainer.cancel()
+            try:
+                await self._maintainer
+            except asyncio.CancelledError:
+                pass
+            self._maintainer = None
+
+        for key in list(self._subscriptions):
+            await self._delete(key)
@@ -178,3 +178,6 @@ class DroneMappingUseCase:
             "deleted_count": deleted_count,
         }
 
+    async def get_data_version(self) -> int:
+        """Data version used to validate cached responses"""
+        return await self.repository.get_version()
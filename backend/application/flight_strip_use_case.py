@@ -347,3 +347,7 @@ class FlightStripUseCase:
                 message="Failed to search flight strips",
                 details=str(e),
             )
+
+    async def get_data_version(self) -> int:
+        """Data version used to validate cached responses"""
+        return await self.repository.get_version()
@@ -0,0 +1,147 @@
+# Application layer - Remote ID subscriptions and ISA notification handling
+from http import HTTPStatus
+from typing import Optional
+import logging
+
+from application.cell_subscriptions import (
+    CellSubscription,
+    CellSubscriptions,
+    subscription_extents,
+)
+from config.config import Settings
+from domain.external.dss.remoteid import CreateSubscriptionParameters
+from domain.external.uss.remoteid import (
+    PutIdentificationServiceAreaNotificationParameters,
+)
+from infrastructure.live_isas import LiveIsaSet, live_isas
+from infrastructure.spatial_tiles import Tile
+from ports.subscription_port import RemoteIDSubscriptionPort
+from schemas.api import ApiException
+from schemas.requests.flights import QueryFlightsRequest
+
+
+class RemoteIDSubscriptionUseCase:
+    """
+    Keeps Remote ID subscriptions over the grid cells clients are watching
+    flights in, seeding the live ISA set from each subscription and keeping
+    it current from ISA notifications, so flight queries there never have
+    to search the DSS for ISAs.
+    """
+
+    def __init__(
+        self,
+        subscription_port: RemoteIDSubscriptionPort,
+        isas: Optional[LiveIsaSet] = None,
+    ):
+        settings = Settings()
+        self.subscription_port = subscription_port
+        self.isas = isas or live_isas
+        self.uss_base_url = settings.USS_BASE_URL
+        self.max_cells = settings.RID_SUBSCRIPTION_MAX_CELLS
+
+        self.subscriptions: CellSubscriptions[Tile] = CellSubscriptions(
+            put=self._put,
+            delete=self._delete,
+            duration=settings.RID_SUBSCRIPTION_DURATION,
+            renew_before=settings.RID_SUBSCRIPTION_RENEW_BEFORE,
+            idle_timeout=settings.RID_SUBSCRIPTION_IDLE_TIMEOUT,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Subscriptions need a public base URL for the DSS to call back"""
+        return bool(self.uss_base_url)
+
+    def watch(self, area: QueryFlightsRequest) -> None:
+        """Record interest in an area, subscribing to its cells if needed"""
+        if not self.enabled:
+            return
+
+        cells = self.isas.grid.tiles_for_bounds(
+            (area.south, area.west, area.north, area.east)
+        )
+        if len(cells) > self.max_cells:
+            # Too large to subscribe to; ISAs keep being searched
+            return
+
+        self.subscriptions.watch(cells)
+
+    async def _put(
+        self, cell: Tile, subscription_id: str, version: Optional[str]
+    ) -> Optional[str]:
+        """Create or renew the subscription over a cell"""
+        duration = self.subscriptions.duration
+        params = CreateSubscriptionParameters(
+            extents=subscription_extents(cell, duration),
+            uss_base_url=self.uss_base_url,
+        )
+
+        try:
+            response = await self.subscription_port.put_subscription(
+                subscription_id, params, version=version
+            )
+        except Exception as e:
+            logging.error(
+                f"Error subscribing to ISAs on cell {cell.x},{cell.y}: {e}"
+            )
+            return None
+
+        # The response lists every ISA in the cell, which seeds its set
+        self.isas.activate(
+            cell,
+            subscription_id,
+            response.service_areas or [],
+            duration,
+        )
+        return response.subscription.version
+
+    async def _delete(
+        self, cell: Tile, subscription: CellSubscription
+    ) -> None:
+        self.isas.deactivate(cell)
+        if not subscription.version:
+            return
+
+        try:
+            await self.subscription_port.delete_subscription(
+                subscription.id, subscription.version
+            )
+        except Exception as e:
+            logging.error(
+                f"Error deleting RID subscription {subscription.id}: {e}"
+            )
+
+    async def start(self) -> None:
+        """Start the background subscription maintenance"""
+        if self.enabled:
+            await self.subscriptions.start()
+
+    async def aclose(self) -> None:
+        """Stop maintenance and remove every subscription from the DSS"""
+        await self.subscriptions.aclose()
+
+    async def notify_identification_service_area(
+        self,
+        isa_id: str,
+        params: PutIdentificationServiceAreaNotificationParameters,
+    ) -> None:
+        """Apply a changed or removed ISA to the live ISA set"""
+        subscription_ids = [
+            state.subscription_id for state in params.subscriptions
+        ]
+        if not any(
+            self.isas.owns(subscription) for subscription in subscription_ids
+        ):
+            raise ApiException(
+                status_code=HTTPStatus.BAD_REQUEST,
+                message="Notification is not for an active subscription",
+                details={
+                    "subscriptions": [
+                        str(subscription) for subscription in subscription_ids
+                    ]
+                },
+            )
+
+        self.isas.apply(
+            subscription_ids, isa_id, params.service_area, params.extents
+        )
@@ -0,0 +1,191 @@
+"""
+Per-request overhead of the middleware chain, before and after collapsing
+it into RequestContextMiddleware.
+
+The "before" chain re-creates the three BaseHTTPMiddleware layers the app
+used to stack (event dispatch, exception catching and correlation ids).
+Both chains wrap the same endpoints and are driven directly through ASGI,
+so the numbers exclude any network or HTTP client cost.
+
+Run from the backend directory:
+
+    python -m benchmarks.middleware_overhead [requests]
+"""
+
+import asyncio
+import logging
+import statistics
+import sys
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from config.config import Settings
+from config.event_mappings import get_event_stream_for_request
+from infrastructure.correlation import CorrelationIdManager
+from infrastructure.event_service import EventService
+from middleware.request_context import RequestContextMiddleware
+from schemas.api import ApiException
+
+PAYLOAD = {
+    "flights": [
+        {"id": str(i), "lat": -23.5, "lng": -46.6} for i in range(50)
+    ]
+}
+STREAM_CHUNKS = 50
+
+
+def _endpoints(app: FastAPI) -> FastAPI:
+    @app.post("/airspace/flights")
+    async def flights():
+        return PAYLOAD
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for _ in range(STREAM_CHUNKS):
+                yield b"x" * 1024
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    return app
+
+
+def bare_app() -> FastAPI:
+    return _endpoints(FastAPI())
+
+
+def before_app(event_service: EventService) -> FastAPI:
+    """The previous chain of three BaseHTTPMiddleware layers"""
+    app = _endpoints(FastAPI())
+
+    @app.middleware("http")
+    async def dispatch_events_middleware(request: Request, call_next):
+        response = await call_next(request)
+        if 200 <= response.status_code < 300:
+            event_stream = get_event_stream_for_request(
+                method=request.method, path=request.url.path
+            )
+            if event_stream:
+                event_service.dispatch_event_async(event_stream)
+        return response
+
+    @app.middleware("http")
+    async def catch_exceptions_middleware(request: Request, call_next):
+        try:
+            return await call_next(request)
+        except Exception as e:
+            if hasattr(e, "status_code"):
+                raise e
+            raise ApiException(status_code=500, message=str(e))
+
+    class CorrelationIdMiddleware(BaseHTTPMiddleware):
+        async def dispatch(self, request: Request, call_next):
+            correlation_id = request.headers.get("X-Correlation-ID")
+            if not correlation_id:
+                correlation_id = (
+                    CorrelationIdManager.generate_correlation_id()
+                )
+            CorrelationIdManager.set_correlation_id(correlation_id)
+            response = await call_next(request)
+            response.headers["X-Correlation-ID"] = correlation_id
+            return response
+
+    app.add_middleware(CorrelationIdMiddleware)
+    return app
+
+
+def after_app(event_service: EventService) -> FastAPI:
+    app = _endpoints(FastAPI())
+    app.add_middleware(
+        RequestContextMiddleware, event_service=event_service
+    )
+    return app
+
+
+async def _request(app, method: str, path: str, body: bytes) -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("127.0.0.1", 80),
+    }
+    received = False
+    size = 0
+
+    async def receive():
+        nonlocal received
+        if received:
+            # Let BaseHTTPMiddleware's disconnect listener wait quietly
+            await asyncio.sleep(3600)
+        received = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        nonlocal size
+        if message["type"] == "http.response.body":
+            size += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return size
+
+
+async def _measure(apps: dict, method: str, path: str, requests: int):
+    """Median microseconds per request, interleaving apps across rounds"""
+    body = b"{}" if method == "POST" else b""
+    for app in apps.values():
+        for _ in range(100):
+            await _request(app, method, path, body)
+
+    rounds = {name: [] for name in apps}
+    for _ in range(7):
+        for name, app in apps.items():
+            started = time.perf_counter()
+            for _ in range(requests):
+                await _request(app, method, path, body)
+            elapsed = time.perf_counter() - started
+            rounds[name].append(elapsed / requests * 1e6)
+
+    return {name: statistics.median(times) for name, times in rounds.items()}
+
+
+async def main(requests: int) -> None:
+    # Keep log output out of the measurement
+    logging.disable(logging.INFO)
+
+    # Without EVENT_API_URL dispatch stops right after the mapping lookup
+    settings = Settings(EVENT_API_URL=None)
+    event_service = EventService(settings)
+    apps = {
+        "bare": bare_app(),
+        "before": before_app(event_service),
+        "after": after_app(event_service),
+    }
+
+    for label, method, path in (
+        ("JSON", "POST", "/airspace/flights"),
+        ("stream", "GET", "/stream"),
+    ):
+        results = await _measure(apps, method, path, requests)
+        bare = results["bare"]
+        print(f"{label} ({requests} requests per round)")
+        for name, micros in results.items():
+            overhead = micros - bare
+            print(
+                f"  {name:<7} {micros:8.1f} us/req"
+                f"  overhead {overhead:7.1f} us"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
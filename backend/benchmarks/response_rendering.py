@@ -0,0 +1,183 @@
+"""
+Cost of rendering an allocations snapshot through FastAPI's
+`response_model` handling versus the single-pass ModelResponse.
+
+The snapshot holds 500 operational intents, each with two 4D volumes of
+24-vertex outlines, validated once up front as the use case would. Both
+endpoints return that same snapshot and are driven directly through ASGI,
+after checking that they produce the same JSON document.
+
+Run from the backend directory:
+
+    python -m benchmarks.response_rendering [intents] [requests]
+"""
+
+import asyncio
+import json
+import math
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from fastapi import FastAPI
+
+from domain.airspace import AirspaceAllocations
+from domain.base import Volume4D
+from domain.external.uss.common import OperationalIntent
+from schemas.api import ApiResponse
+from utils.responses import api_response
+
+VERTICES = 24
+VOLUMES = 2
+
+
+def volume_payload(
+    lat: float, lng: float, start: datetime, vertices: int = VERTICES
+) -> dict:
+    """Raw 4D volume with a circular outline, as sent by a USS"""
+    ring = [
+        {
+            "lat": lat + 0.01 * math.sin(2 * math.pi * i / vertices),
+            "lng": lng + 0.01 * math.cos(2 * math.pi * i / vertices),
+        }
+        for i in range(vertices)
+    ]
+    return {
+        "volume": {
+            "outline_polygon": {"vertices": ring},
+            "altitude_lower": {"value": 0, "reference": "W84", "units": "M"},
+            "altitude_upper": {
+                "value": 120,
+                "reference": "W84",
+                "units": "M",
+            },
+        },
+        "time_start": {"value": start.isoformat(), "format": "RFC3339"},
+        "time_end": {
+            "value": (start + timedelta(hours=1)).isoformat(),
+            "format": "RFC3339",
+        },
+    }
+
+
+def intent_payload(index: int, start: datetime) -> dict:
+    """Raw operational intent with its reference and details"""
+    lat = -23.5 + 0.001 * (index % 100)
+    lng = -46.6 + 0.001 * (index // 100)
+    return {
+        "reference": {
+            "id": str(uuid.uuid4()),
+            "manager": "uss1",
+            "uss_availability": "Unknown",
+            "version": 1,
+            "state": "Accepted",
+            "ovn": uuid.uuid4().hex,
+            "time_start": {"value": start.isoformat(), "format": "RFC3339"},
+            "time_end": {
+                "value": (start + timedelta(hours=1)).isoformat(),
+                "format": "RFC3339",
+            },
+            "uss_base_url": "https://uss1.example.com",
+            "subscription_id": str(uuid.uuid4()),
+        },
+        "details": {
+            "volumes": [
+                volume_payload(lat, lng, start) for _ in range(VOLUMES)
+            ],
+            "priority": 0,
+        },
+    }
+
+
+def build_snapshot(intents: int) -> AirspaceAllocations:
+    """Allocations snapshot validated the way the use case builds it"""
+    start = datetime.now(timezone.utc)
+    return AirspaceAllocations(
+        timestamp=start,
+        area_of_interest=Volume4D.model_validate(
+            volume_payload(-23.5, -46.6, start)
+        ),
+        operational_intents=[
+            OperationalIntent.model_validate(intent_payload(index, start))
+            for index in range(intents)
+        ],
+    )
+
+
+def build_app(snapshot: AirspaceAllocations) -> FastAPI:
+    app = FastAPI()
+    message = f"Airspace snapshot retrieved with {snapshot.total_volumes}"
+
+    @app.get("/response_model", response_model=ApiResponse)
+    async def with_response_model():
+        return ApiResponse(message=message, data=snapshot)
+
+    @app.get("/single_pass", response_model=ApiResponse)
+    async def single_pass():
+        return api_response(message, snapshot)
+
+    return app
+
+
+async def _request(app: FastAPI, path: str) -> bytes:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "client": ("127.0.0.1", 1234),
+        "server": ("127.0.0.1", 80),
+    }
+    chunks = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(chunks)
+
+
+async def main(intents: int, requests: int) -> None:
+    snapshot = build_snapshot(intents)
+    app = build_app(snapshot)
+    paths = ("/response_model", "/single_pass")
+
+    bodies = [await _request(app, path) for path in paths]
+    assert json.loads(bodies[0]) == json.loads(bodies[1])
+
+    rounds = {path: [] for path in paths}
+    for _ in range(5):
+        for path in paths:
+            started = time.perf_counter()
+            for _ in range(requests):
+                await _request(app, path)
+            elapsed = time.perf_counter() - started
+            rounds[path].append(elapsed / requests * 1000)
+
+    print(
+        f"{intents} intents, {len(bodies[1]) / 1024:.0f} KiB body"
+        f" ({requests} requests per round)"
+    )
+    for path, times in rounds.items():
+        print(f"  {path[1:]:<15} {statistics.median(times):8.2f} ms/req")
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 500,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+        )
+    )
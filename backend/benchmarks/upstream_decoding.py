@@ -0,0 +1,160 @@
+"""
+Micro-benchmarks for decoding upstream DSS/USS payloads.
+
+Each payload is decoded the previous way (`json.loads`, which is what
+`response.json()` does, followed by `model_validate`) and with
+`validate_json` straight from the bytes. A final case measures the
+longest event loop stall while a ~5 MB constraint set is decoded inline
+versus through the decoder, which moves it to a worker thread.
+
+Run from the backend directory:
+
+    python -m benchmarks.upstream_decoding
+"""
+
+import asyncio
+import json
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import httpx
+from pydantic_core import to_json
+
+from benchmarks.response_rendering import intent_payload, volume_payload
+from domain.external.dss.operational_intents import (
+    QueryOperationalIntentReferenceResponse,
+)
+from domain.external.dss.remoteid import (
+    SearchIdentificationServiceAreasResponse,
+)
+from domain.external.uss.constraints import GetConstraintDetailsResponse
+from domain.external.uss.operational_intents import (
+    GetOperationalIntentDetailsResponse,
+)
+from infrastructure.upstream_decoding import UpstreamDecoder, validate_json
+
+
+def _time(value: datetime) -> dict:
+    return {"value": value.isoformat(), "format": "RFC3339"}
+
+
+def _payloads(start: datetime) -> list:
+    references = [
+        intent_payload(index, start)["reference"] for index in range(1000)
+    ]
+    isas = [
+        {
+            "uss_base_url": "https://uss1.example.com",
+            "owner": "uss1",
+            "time_start": _time(start),
+            "time_end": _time(start + timedelta(hours=1)),
+            "version": uuid.uuid4().hex,
+            "id": str(uuid.uuid4()),
+        }
+        for _ in range(200)
+    ]
+    return [
+        (
+            "1000 intent references",
+            QueryOperationalIntentReferenceResponse,
+            {"operational_intent_references": references},
+        ),
+        (
+            "200 ISAs",
+            SearchIdentificationServiceAreasResponse,
+            {"service_areas": isas},
+        ),
+        (
+            "intent details",
+            GetOperationalIntentDetailsResponse,
+            {"operational_intent": intent_payload(0, start)},
+        ),
+        ("constraint set", GetConstraintDetailsResponse, _constraint(start)),
+    ]
+
+
+def _constraint(start: datetime) -> dict:
+    """Constraint with a ~5 MB volume set"""
+    reference = intent_payload(0, start)["reference"]
+    for field in ("state", "subscription_id"):
+        reference.pop(field)
+    return {
+        "constraint": {
+            "reference": reference,
+            "details": {
+                "volumes": [
+                    volume_payload(-23.5, -46.6, start, vertices=2000)
+                    for _ in range(40)
+                ],
+                "type": "restriction",
+            },
+        }
+    }
+
+
+def _median_ms(function, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        times.append((time.perf_counter() - started) * 1000)
+    return statistics.median(times)
+
+
+async def _max_stall_ms(decode) -> float:
+    """Longest gap seen by a 1 ms ticker while `decode` runs"""
+    stalls = []
+    done = asyncio.Event()
+
+    async def ticker():
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            stalls.append((now - last) * 1000)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    await decode()
+    done.set()
+    await task
+    return max(stalls)
+
+
+async def main() -> None:
+    payloads = _payloads(datetime.now(timezone.utc))
+
+    print(f"{'payload':<24} {'size':>8} {'dict+validate':>14} {'bytes':>8}")
+    for label, model, payload in payloads:
+        content = to_json(payload)
+        repeat = 5 if len(content) > 1_000_000 else 50
+        before = _median_ms(
+            lambda: model.model_validate(json.loads(content)), repeat
+        )
+        after = _median_ms(lambda: validate_json(model, content), repeat)
+        assert model.model_validate(json.loads(content)) == validate_json(
+            model, content
+        )
+        print(
+            f"{label:<24} {len(content) / 1024:6.0f}KB"
+            f" {before:11.2f} ms {after:5.2f} ms"
+        )
+
+    _, model, payload = payloads[-1]
+    response = httpx.Response(200, content=to_json(payload))
+    inline = UpstreamDecoder(thread_threshold=len(response.content) + 1)
+    threaded = UpstreamDecoder(thread_threshold=256 * 1024)
+
+    print("\nlongest event loop stall decoding the constraint set")
+    for label, decoder in (("inline", inline), ("worker thread", threaded)):
+        stall = await _max_stall_ms(
+            lambda: decoder.decode(response, model)
+        )
+        print(f"  {label:<14} {stall:7.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,6 +1,6 @@
 import os
 
-from typing import Optional
+from typing import Dict, List, Optional
 from pydantic_settings import BaseSettings
 from motor.motor_asyncio import AsyncIOMotorClient
 
@@ -12,6 +12,24 @@ class Settings(BaseSettings):
     BRUTM_BASE_URL: Optional[str] = None
     DSS_AUDIENCE: str = "core-service"
 
+    # Public base URL of this USS, used by the DSS and peers to call back
+    USS_BASE_URL: Optional[str] = None
+
+    # Token management
+    AUTH_TOKEN_CLOCK_SKEW: float = 30.0
+    AUTH_TOKEN_REFRESH_AHEAD: float = 120.0
+    AUTH_PREWARM_USS_AUDIENCES: List[str] = []
+
+    # Access tokens sent with incoming USS notifications are verified with
+    # the auth server's JWKS keys or a fixed PEM public key; the audience
+    # defaults to the host of USS_BASE_URL
+    USS_TOKEN_JWKS_URL: Optional[str] = None
+    USS_TOKEN_PUBLIC_KEY: Optional[str] = None
+    USS_TOKEN_AUDIENCE: Optional[str] = None
+    USS_TOKEN_ISSUER: Optional[str] = None
+    USS_TOKEN_ALGORITHMS: List[str] = ["RS256"]
+    USS_TOKEN_LEEWAY: float = 10.0
+
     # MongoDB Configuration
     MONGODB_URL: str = "mongodb://localhost:27017"
     MONGODB_DATABASE: str = "flight_strips_db"
@@ -20,6 +38,121 @@ class Settings(BaseSettings):
     EVENT_API_URL: Optional[str] = None
     EVENT_API_TIMEOUT: float = 5.0
     EVENT_DISPATCH_ENABLED: bool = True
+    # Path on EVENT_API_URL accepting a JSON array of events; without it
+    # each event in a batch is posted to /api/v1/events/ on its own
+    EVENT_API_BATCH_PATH: Optional[str] = None
+    EVENT_QUEUE_SIZE: int = 10000
+    # "drop_oldest" or "drop_newest" when the queue is full
+    EVENT_DROP_POLICY: str = "drop_oldest"
+    EVENT_BATCH_SIZE: int = 50
+    EVENT_BATCH_LINGER: float = 0.1
+    EVENT_MAX_RETRIES: int = 3
+    EVENT_RETRY_BASE_DELAY: float = 0.5
+    EVENT_RETRY_MAX_DELAY: float = 10.0
+    EVENT_DRAIN_TIMEOUT: float = 5.0
+    # Durable MongoDB outbox for events; delivered events are kept for
+    # EVENT_OUTBOX_RETENTION seconds
+    EVENT_OUTBOX_ENABLED: bool = True
+    EVENT_OUTBOX_LEASE: float = 30.0
+    EVENT_OUTBOX_POLL_INTERVAL: float = 1.0
+    # Requests wait at most this long to record an event; after a failed
+    # append events go to memory for EVENT_OUTBOX_RETRY_AFTER seconds
+    EVENT_OUTBOX_APPEND_TIMEOUT: float = 0.25
+    EVENT_OUTBOX_RETRY_AFTER: float = 30.0
+    EVENT_OUTBOX_RETENTION: int = 86400
+
+    # Upstream fan-out limits
+    FAN_OUT_MAX_CONCURRENCY: int = 32
+    FAN_OUT_MAX_PER_HOST: int = 6
+
+    # Pooled upstream HTTP clients
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = 20
+    HTTP_HOST_MAX_CONNECTIONS: Dict[str, int] = {}
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP_CLIENT_IDLE_TTL: float = 600.0
+
+    # Upstream payloads at least this large are validated off the loop
+    UPSTREAM_DECODE_THREAD_BYTES: int = 256 * 1024
+
+    # USS detail cache
+    DETAIL_CACHE_MAX_ENTRIES: int = 5000
+
+    # Simplified allocation outlines, per entity version and tolerance
+    SIMPLIFIED_GEOMETRY_CACHE_MAX_ENTRIES: int = 10000
+
+    # DSS reference tile cache
+    DSS_TILE_DEGREES: float = 0.05
+    DSS_TILE_TIME_BUCKET_SECONDS: float = 300.0
+    DSS_TILE_TTL: float = 15.0
+    DSS_TILE_MAX_TILES: int = 16
+    # Above this many uncached tiles the area is queried in one call and
+    # only this many tiles are filled alongside it
+    DSS_TILE_MAX_MISSING: int = 4
+    DSS_TILE_CACHE_MAX_ENTRIES: int = 10000
+    DSS_SUBSCRIBED_TILE_TTL: float = 300.0
+
+    # DSS subscriptions on watched areas
+    SCD_SUBSCRIPTION_CELL_DEGREES: float = 0.2
+    SCD_SUBSCRIPTION_MAX_CELLS: int = 4
+    SCD_SUBSCRIPTION_DURATION: float = 3600.0
+    SCD_SUBSCRIPTION_RENEW_BEFORE: float = 300.0
+    SCD_SUBSCRIPTION_IDLE_TIMEOUT: float = 600.0
+
+    # Remote ID subscriptions keeping the live ISA set of watched areas
+    RID_SUBSCRIPTION_CELL_DEGREES: float = 0.1
+    RID_SUBSCRIPTION_MAX_CELLS: int = 4
+    RID_SUBSCRIPTION_DURATION: float = 3600.0
+    RID_SUBSCRIPTION_RENEW_BEFORE: float = 300.0
+    RID_SUBSCRIPTION_IDLE_TIMEOUT: float = 600.0
+
+    # Logging: level defaults to DEBUG in dev and INFO elsewhere
+    LOG_LEVEL: Optional[str] = None
+    LOG_FORMAT: str = "json"
+    LOG_QUEUE_SIZE: int = 10000
+
+    # Request logging
+    REQUEST_LOG_LEVEL: str = "INFO"
+    REQUEST_LOG_SAMPLE_RATE: float = 1.0
+    REQUEST_LOG_MAX_BODY_BYTES: int = 2048
+    REQUEST_LOG_REDACT_HEADERS: List[str] = [
+        "authorization",
+        "proxy-authorization",
+        "cookie",
+        "set-cookie",
+        "x-api-key",
+    ]
+    REQUEST_LOG_EXCLUDE_PATHS: List[str] = []
+
+    # Remote ID display provider limits
+    RID_MAX_VIEW_DIAGONAL_KM: float = 7.0
+    RID_ISA_DEADLINE_SECONDS: float = 1.5
+
+    # Remote ID ISA discovery cache
+    RID_ISA_TILE_DEGREES: float = 0.05
+    RID_ISA_CACHE_TTL: float = 60.0
+    RID_ISA_REFRESH_AHEAD: float = 15.0
+    RID_ISA_MAX_TILES: int = 36
+    RID_ISA_CACHE_MAX_ENTRIES: int = 5000
+
+    # Shared live traffic pollers (tiles must fit the RID view limit)
+    LIVE_TRAFFIC_TILE_DEGREES: float = 0.03
+    LIVE_TRAFFIC_INTERVAL: float = 2.0
+    LIVE_TRAFFIC_IDLE_TIMEOUT: float = 30.0
+    LIVE_TRAFFIC_MAX_TILES: int = 16
+
+    # Cursor-based flight deltas
+    FLIGHT_DELTA_MAX_CURSORS: int = 10000
+    FLIGHT_DELTA_CURSOR_TTL: float = 120.0
+
+    # Live flight stream (Server-Sent Events)
+    FLIGHT_STREAM_INTERVAL: float = 2.0
+    FLIGHT_STREAM_HEARTBEAT: float = 15.0
+    FLIGHT_STREAM_RETRY_MS: int = 3000
+
+    # Remote ID flight details cache
+    FLIGHT_DETAILS_CACHE_MAX_ENTRIES: int = 5000
+    FLIGHT_DETAILS_TTL: float = 1800.0
 
     class Config:
         env_file = f".env.{os.getenv('ENV', 'dev')}"
@@ -1,6 +1,6 @@
 """Event mappings for route endpoints to event streams"""
 
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
 
 
@@ -39,6 +39,7 @@ class EventStream(str, Enum):
 ROUTE_EVENT_MAPPINGS: Dict[Tuple[str, str], str] = {
     # Airspace routes
     ("POST", "/api/airspace/flights"): EventStream.MANAGER_AIRSPACE_FLIGHTS,
+    ("POST", "/api/airspace/flights/batch"): EventStream.MANAGER_AIRSPACE_FLIGHTS_LIST,
     # Flight Strip routes
     ("POST", "/api/flight-strips/"): EventStream.MANAGER_FLIGHT_STRIPS_CREATE,
     ("GET", "/api/flight-strips/"): EventStream.MANAGER_FLIGHT_STRIPS_LIST,
@@ -53,69 +54,93 @@ ROUTE_EVENT_MAPPINGS: Dict[Tuple[str, str], str] = {
 }
 
 
-def get_event_stream_for_request(method: str, path: str) -> str | None:
-    """
-    Get the event stream name for a given HTTP method and path
+# Prefix the API is served under; route templates are matched without it
+API_PREFIX = "/api"
 
-    Args:
-        method: HTTP method (GET, POST, PUT, DELETE, etc.)
-        path: Request path
+_WILDCARD = "*"
 
-    Returns:
-        Event stream name if found, None otherwise
-    """
-    # First try exact match
-    exact_key = (method.upper(), path)
-    if exact_key in ROUTE_EVENT_MAPPINGS:
-        return ROUTE_EVENT_MAPPINGS[exact_key]
-
-    if not path.startswith("/api/"):
-        exact_key = (method.upper(), "/api" + path)
-        if exact_key in ROUTE_EVENT_MAPPINGS:
-            return ROUTE_EVENT_MAPPINGS[exact_key]
-
-    # Try pattern matching for parameterized routes
-    for (
-        route_method,
-        route_pattern,
-    ), event_stream in ROUTE_EVENT_MAPPINGS.items():
-        if (
-            method.upper() == route_method
-            and _matches_pattern(path, route_pattern)
-            or (
-                not path.startswith("/api/")
-                and method.upper() == route_method
-                and _matches_pattern("/api" + path, route_pattern)
-            )
-        ):
-            return event_stream
 
+class _TrieNode:
+    """Path segment node; `{param}` segments share one wildcard child"""
+
+    __slots__ = ("children", "events")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.events: Dict[str, str] = {}
+
+
+def _strip_prefix(path: str) -> str:
+    if path == API_PREFIX or path.startswith(API_PREFIX + "/"):
+        return path[len(API_PREFIX):] or "/"
+    return path
+
+
+def _segments(path: str) -> List[str]:
+    return path.split("/")[1:]
+
+
+def _compile(
+    mappings: Dict[Tuple[str, str], str],
+) -> Tuple[Dict[Tuple[str, str], str], _TrieNode]:
+    """Template lookup table and path trie, built once at import"""
+    by_template = {}
+    trie = _TrieNode()
+    for (method, pattern), event_stream in mappings.items():
+        template = _strip_prefix(pattern)
+        by_template[(method.upper(), template)] = event_stream
+
+        node = trie
+        for segment in _segments(template):
+            if segment.startswith("{") and segment.endswith("}"):
+                segment = _WILDCARD
+            node = node.children.setdefault(segment, _TrieNode())
+        node.events[method.upper()] = event_stream
+    return by_template, trie
+
+
+_EVENTS_BY_TEMPLATE, _EVENTS_TRIE = _compile(ROUTE_EVENT_MAPPINGS)
+
+
+def _match_path(method: str, path: str) -> Optional[str]:
+    """Walk the trie, preferring literal segments over parameters"""
+    nodes = [_EVENTS_TRIE]
+    for segment in _segments(_strip_prefix(path)):
+        next_nodes = []
+        for node in nodes:
+            child = node.children.get(segment)
+            if child is not None:
+                next_nodes.append(child)
+            wildcard = node.children.get(_WILDCARD)
+            if wildcard is not None and segment:
+                next_nodes.append(wildcard)
+        if not next_nodes:
+            return None
+        nodes = next_nodes
+
+    for node in nodes:
+        event_stream = node.events.get(method)
+        if event_stream is not None:
+            return event_stream
     return None
 
 
-def _matches_pattern(path: str, pattern: str) -> bool:
+def get_event_stream_for_request(
+    method: str, path: str, route_template: Optional[str] = None
+) -> Optional[str]:
     """
-    Check if a path matches a FastAPI route pattern
+    Get the event stream name for a given HTTP method and path
 
     Args:
-        path: Actual request path
-        pattern: Route pattern with {param} placeholders
+        method: HTTP method (GET, POST, PUT, DELETE, etc.)
+        path: Request path
+        route_template: Template of the route that served the request,
+            as resolved by the router, when there is one
 
     Returns:
-        True if path matches pattern, False otherwise
+        Event stream name if found, None otherwise
     """
-    # Simple pattern matching for FastAPI path parameters
-    # Convert {param} to a regex pattern and match
-    import re
-
-    # Escape special regex characters except for our placeholders
-    escaped_pattern = re.escape(pattern)
-
-    # Replace escaped placeholders with regex patterns
-    # \{param_name\} -> [^/]+ (match any non-slash characters)
-    regex_pattern = re.sub(r"\\{[^}]+\\}", r"[^/]+", escaped_pattern)
-
-    # Ensure exact match
-    regex_pattern = f"^{regex_pattern}$"
-
-    return bool(re.match(regex_pattern, path))
+    method = method.upper()
+    if route_template is not None:
+        return _EVENTS_BY_TEMPLATE.get((method, route_template))
+    return _match_path(method, path)
@@ -1,6 +1,6 @@
 # Domain entities - core business objects
 from typing import List
-from domain.flights import Flight
+from domain.flights import BatchFlight, Flight, FlightStateChange
 from pydantic import BaseModel
 from datetime import datetime
 
@@ -35,3 +35,22 @@ class AirspaceFlights(BaseModel):
 
     timestamp: datetime
     flights: List[Flight] = []
+
+
+class AirspaceFlightsBatch(BaseModel):
+    """Active flights across several rectangles - pure domain entity"""
+
+    timestamp: datetime
+    flights: List[BatchFlight] = []
+
+
+class AirspaceFlightsDelta(BaseModel):
+    """Changes to the active flights since a cursor - pure domain entity"""
+
+    timestamp: datetime
+    cursor: str
+    # True when `since` was unknown and `added` holds every flight
+    full: bool = False
+    added: List[Flight] = []
+    removed: List[str] = []
+    changed: List[FlightStateChange] = []
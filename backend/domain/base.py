@@ -81,20 +81,26 @@ class Volume3D(BaseModel):
     altitude_lower: Altitude
     altitude_upper: Altitude
 
-    @model_validator(mode="before")
-    def check_fields(cls, values):
-        if not values.get("outline_circle") and not values.get(
-            "outline_polygon"
-        ):
+    # Checked after validation: a "before" validator would make pydantic
+    # build the raw outline as Python objects when validating from JSON
+    @model_validator(mode="after")
+    def check_fields(self):
+        # A model is always truthy, so an empty `outline_circle: {}` has to
+        # be told apart by its fields, as the raw empty dict used to be
+        circle = self.outline_circle
+        has_circle = circle is not None and (
+            circle.center is not None or circle.radius is not None
+        )
+        if not has_circle and not self.outline_polygon:
             raise ValueError(
                 "Either outline_circle or outline_polygon must be provided."
             )
-        if values.get("outline_circle") and values.get("outline_polygon"):
+        if has_circle and self.outline_polygon:
             raise ValueError(
                 "Only one of outline_circle or outline_polygon can be"
                 " provided."
             )
-        return values
+        return self
 
 
 class Volume4D(BaseModel):
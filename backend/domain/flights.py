@@ -1,9 +1,28 @@
-from typing import Optional
+from typing import List, Optional
+
+from pydantic import BaseModel
 
 from domain.external.dss.remoteid import IdentificationServiceArea
-from domain.external.uss.remoteid import RIDFlight, RIDFlightDetails
+from domain.external.uss.remoteid import (
+    RIDAircraftState,
+    RIDFlight,
+    RIDFlightDetails,
+)
 
 
 class Flight(RIDFlight):
     identification_service_area: IdentificationServiceArea
     details: Optional[RIDFlightDetails]
+
+
+class BatchFlight(Flight):
+    """Flight tagged with the indices of the query rectangles it falls in"""
+
+    rectangles: List[int] = []
+
+
+class FlightStateChange(BaseModel):
+    """New current state of a flight the client already knows"""
+
+    id: str
+    current_state: Optional[RIDAircraftState] = None
@@ -0,0 +1,174 @@
+"""Outline simplification for low-detail views of airspace volumes"""
+
+import math
+from typing import List, Sequence, Tuple
+
+from domain.base import Polygon, Volume4D
+
+# Metres per degree of latitude, also used for longitude at the equator
+METERS_PER_DEGREE = 111_320.0
+
+# How many times to halve the tolerance before keeping the original
+_MAX_ATTEMPTS = 4
+
+_Point = Tuple[float, float]
+
+
+def tolerance_bucket(tolerance_m: float) -> float:
+    """
+    Round a tolerance down to a power of two metres, so nearby zoom
+    levels share the same simplified geometry.
+    """
+    return 2.0 ** math.floor(math.log2(tolerance_m))
+
+
+def _project(polygon: Polygon) -> List[_Point]:
+    """Vertices in metres on a plane tangent at the polygon's latitude"""
+    vertices = polygon.vertices
+    mean_lat = sum(vertex.lat for vertex in vertices) / len(vertices)
+    scale_x = METERS_PER_DEGREE * math.cos(math.radians(mean_lat))
+    return [
+        (vertex.lng * scale_x, vertex.lat * METERS_PER_DEGREE)
+        for vertex in vertices
+    ]
+
+
+def _segment_distance(point: _Point, start: _Point, end: _Point) -> float:
+    dx, dy = end[0] - start[0], end[1] - start[1]
+    length = dx * dx + dy * dy
+    if length == 0:
+        return math.hypot(point[0] - start[0], point[1] - start[1])
+
+    t = ((point[0] - start[0]) * dx + (point[1] - start[1]) * dy) / length
+    t = max(0.0, min(1.0, t))
+    return math.hypot(
+        point[0] - (start[0] + t * dx), point[1] - (start[1] + t * dy)
+    )
+
+
+def _douglas_peucker(
+    points: Sequence[_Point], first: int, last: int, tolerance: float
+) -> List[int]:
+    """Indices kept between `first` and `last` (inclusive), in order"""
+    keep = {first, last}
+    stack = [(first, last)]
+    while stack:
+        start, end = stack.pop()
+        farthest, distance = start, 0.0
+        for index in range(start + 1, end):
+            d = _segment_distance(points[index], points[start], points[end])
+            if d > distance:
+                farthest, distance = index, d
+
+        if distance > tolerance:
+            keep.add(farthest)
+            stack.append((start, farthest))
+            stack.append((farthest, end))
+
+    return sorted(keep)
+
+
+def _simplify_ring(points: List[_Point], tolerance: float) -> List[int]:
+    """Douglas-Peucker over a closed ring, anchored at two far vertices"""
+    origin = points[0]
+    far = max(
+        range(len(points)),
+        key=lambda i: math.hypot(
+            points[i][0] - origin[0], points[i][1] - origin[1]
+        ),
+    )
+
+    # Close the ring so the second half runs back to the first vertex
+    ring = points + [origin]
+    head = _douglas_peucker(ring, 0, far, tolerance)
+    tail = _douglas_peucker(ring, far, len(points), tolerance)
+    return head[:-1] + tail[:-1]
+
+
+def _cross(o: _Point, a: _Point, b: _Point) -> float:
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def _segments_cross(a: _Point, b: _Point, c: _Point, d: _Point) -> bool:
+    d1, d2 = _cross(c, d, a), _cross(c, d, b)
+    d3, d4 = _cross(a, b, c), _cross(a, b, d)
+    if ((d1 > 0) != (d2 > 0)) and ((d3 > 0) != (d4 > 0)):
+        return d1 != 0 and d2 != 0 and d3 != 0 and d4 != 0
+    return False
+
+
+def _is_simple(ring: List[_Point]) -> bool:
+    """Whether no two non-adjacent edges of a closed ring cross"""
+    count = len(ring)
+    if count < 3:
+        return False
+
+    edges = sorted(
+        (
+            min(ring[i][0], ring[(i + 1) % count][0]),
+            max(ring[i][0], ring[(i + 1) % count][0]),
+            i,
+        )
+        for i in range(count)
+    )
+
+    # Sweep along x so only edges with overlapping extents are compared
+    for position, (_, max_x, i) in enumerate(edges):
+        for other_min_x, _, j in edges[position + 1:]:
+            if other_min_x > max_x:
+                break
+            if abs(i - j) in (1, count - 1):
+                continue
+            if _segments_cross(
+                ring[i],
+                ring[(i + 1) % count],
+                ring[j],
+                ring[(j + 1) % count],
+            ):
+                return False
+    return True
+
+
+def simplify_polygon(polygon: Polygon, tolerance_m: float) -> Polygon:
+    """
+    Simplified copy of a polygon whose outline stays within `tolerance_m`
+    metres of the original. The tolerance is halved whenever the result
+    would self-intersect or collapse, and the original is returned if no
+    valid simplification is found.
+    """
+    vertices = list(polygon.vertices)
+    if len(vertices) > 3 and vertices[0] == vertices[-1]:
+        vertices = vertices[:-1]
+    if len(vertices) <= 4:
+        return polygon
+
+    points = _project(Polygon(vertices=vertices))
+    tolerance = tolerance_m
+    for _ in range(_MAX_ATTEMPTS):
+        kept = _simplify_ring(points, tolerance)
+        if len(kept) >= 3 and _is_simple([points[i] for i in kept]):
+            if len(kept) == len(vertices):
+                return polygon
+            return Polygon(vertices=[vertices[i] for i in kept])
+        tolerance /= 2
+
+    return polygon
+
+
+def simplify_volume(volume: Volume4D, tolerance_m: float) -> Volume4D:
+    """Copy of a volume with a simplified outline, leaving it untouched"""
+    outline = volume.volume.outline_polygon
+    if outline is None:
+        return volume
+
+    simplified = simplify_polygon(outline, tolerance_m)
+    if simplified is outline:
+        return volume
+
+    return volume.model_copy(
+        update={
+            "volume": volume.volume.model_copy(
+                update={"outline_polygon": simplified}
+            )
+        }
+    )
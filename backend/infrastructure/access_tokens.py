@@ -0,0 +1,100 @@
+"""Validation of access tokens presented by peers calling our USS API"""
+
+import asyncio
+import logging
+from http import HTTPStatus
+from typing import Any, Dict, Optional, Union
+from urllib.parse import urlsplit
+
+import jwt
+
+from config.config import Settings
+from schemas.api import ApiException
+from schemas.enums import Authority, RIDAuthority
+
+Scope = Union[Authority, RIDAuthority]
+
+
+class AccessTokenValidator:
+    """
+    Checks the bearer token of an incoming request: signature against the
+    auth server's keys, expiry, audience equal to our host and scope.
+    """
+
+    def __init__(self, settings: Settings):
+        self.audience = settings.USS_TOKEN_AUDIENCE or (
+            urlsplit(settings.USS_BASE_URL).hostname
+            if settings.USS_BASE_URL
+            else None
+        )
+        self.issuer = settings.USS_TOKEN_ISSUER
+        self.algorithms = settings.USS_TOKEN_ALGORITHMS
+        self.leeway = settings.USS_TOKEN_LEEWAY
+        self._public_key = settings.USS_TOKEN_PUBLIC_KEY
+        self._jwks = (
+            jwt.PyJWKClient(settings.USS_TOKEN_JWKS_URL)
+            if settings.USS_TOKEN_JWKS_URL
+            else None
+        )
+
+    async def _signing_key(self, token: str) -> Any:
+        if self._public_key:
+            return self._public_key
+        if self._jwks is not None:
+            # Keys are cached by the client; fetching them blocks
+            signing_key = await asyncio.to_thread(
+                self._jwks.get_signing_key_from_jwt, token
+            )
+            return signing_key.key
+
+        logging.error(
+            "No USS_TOKEN_JWKS_URL or USS_TOKEN_PUBLIC_KEY configured,"
+            " rejecting incoming access token"
+        )
+        raise jwt.InvalidKeyError("No key configured to verify tokens")
+
+    async def validate(
+        self, authorization: Optional[str], *scopes: Scope
+    ) -> Dict[str, Any]:
+        """
+        Claims of a valid bearer token granting any of `scopes`. Raises a
+        401 ApiException for a missing or invalid token and a 403 one when
+        the token lacks the scope.
+        """
+        scheme, _, token = (authorization or "").partition(" ")
+        if scheme.lower() != "bearer" or not token.strip():
+            raise ApiException(
+                status_code=HTTPStatus.UNAUTHORIZED,
+                message="Missing bearer access token",
+            )
+
+        try:
+            claims = jwt.decode(
+                token.strip(),
+                await self._signing_key(token.strip()),
+                algorithms=self.algorithms,
+                audience=self.audience,
+                issuer=self.issuer,
+                leeway=self.leeway,
+                options={"require": ["exp", "aud"]},
+            )
+        except jwt.PyJWTError as e:
+            raise ApiException(
+                status_code=HTTPStatus.UNAUTHORIZED,
+                message="Invalid access token",
+                details=str(e),
+            )
+
+        granted = str(claims.get("scope", "")).split()
+        if not any(scope.value in granted for scope in scopes):
+            raise ApiException(
+                status_code=HTTPStatus.FORBIDDEN,
+                message="Access token lacks the required scope",
+                details={"required": [scope.value for scope in scopes]},
+            )
+
+        return claims
+
+
+# Global validator for incoming USS requests
+access_tokens = AccessTokenValidator(Settings())
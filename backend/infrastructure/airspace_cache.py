@@ -0,0 +1,144 @@
+"""Push-based updates of the airspace reference and detail caches"""
+
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from domain.base import Volume4D
+from infrastructure.cache import detail_cache, detail_key
+from infrastructure.spatial_tiles import (
+    Bounds,
+    Tile,
+    reference_grid,
+    reference_tiles,
+    volume_bounds,
+)
+
+
+@dataclass
+class _Coverage:
+    bounds: Bounds
+    kind: str
+    expires_at: float
+
+
+class SubscriptionCoverage:
+    """
+    Areas currently covered by our DSS subscriptions. Cached references
+    inside a covered area are kept fresh by notifications, so they may
+    live longer than references that can only be refreshed by polling.
+    """
+
+    def __init__(self):
+        self._subscriptions: Dict[str, _Coverage] = {}
+
+    def add(
+        self, subscription_id: str, kind: str, bounds: Bounds, ttl: float
+    ) -> None:
+        self._subscriptions[subscription_id] = _Coverage(
+            bounds=bounds, kind=kind, expires_at=time.monotonic() + ttl
+        )
+
+    def remove(self, subscription_id: str) -> None:
+        self._subscriptions.pop(subscription_id, None)
+
+    def owns(self, subscription_id) -> bool:
+        """Whether a subscription id is one of ours and still active"""
+        coverage = self._subscriptions.get(str(subscription_id))
+        return coverage is not None and time.monotonic() < coverage.expires_at
+
+    def covers(self, kind: str, bounds: Bounds) -> bool:
+        """Whether an active subscription of `kind` contains the bounds"""
+        now = time.monotonic()
+        south, west, north, east = bounds
+        return any(
+            coverage.kind == kind
+            and now < coverage.expires_at
+            and coverage.bounds[0] <= south
+            and coverage.bounds[1] <= west
+            and coverage.bounds[2] >= north
+            and coverage.bounds[3] >= east
+            for coverage in self._subscriptions.values()
+        )
+
+
+def _utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _overlaps(volume: Volume4D, key) -> bool:
+    """Whether a volume overlaps the tile and window of a tile cache key"""
+    _, x, y, time_start, time_end, altitude_lower, altitude_upper = key
+
+    bounds = volume_bounds(volume.volume)
+    tile = Tile(x=x, y=y, size=reference_grid.tile_degrees)
+    if bounds is None or not tile.intersects(bounds):
+        return False
+
+    if (
+        _utc(volume.time_end.value) < time_start
+        or _utc(volume.time_start.value) > time_end
+    ):
+        return False
+
+    return not (
+        volume.volume.altitude_upper.value < altitude_lower
+        or volume.volume.altitude_lower.value > altitude_upper
+    )
+
+
+def update_reference_tiles(
+    kind: str,
+    entity_id,
+    reference=None,
+    volumes: Optional[List[Volume4D]] = None,
+) -> int:
+    """
+    Apply a changed (or deleted, when `reference` is None) entity to the
+    fresh tile cache entries of `kind`, returning how many changed.
+    """
+    entity_id = str(entity_id)
+    updated = 0
+
+    for key in reference_tiles.keys():
+        if key[0] != kind:
+            continue
+
+        references = reference_tiles.get_stale(key)
+        remaining = [ref for ref in references if str(ref.id) != entity_id]
+        if reference is not None and any(
+            _overlaps(volume, key) for volume in volumes or []
+        ):
+            remaining.append(reference)
+
+        if remaining != references and reference_tiles.replace(
+            key, remaining
+        ):
+            updated += 1
+
+    return updated
+
+
+def update_details(kind: str, entity_id, entity=None) -> None:
+    """Replace the cached details of an entity, or drop them if deleted"""
+    entity_id = str(entity_id)
+    detail_cache.delete_where(
+        lambda key: key[0] == kind and key[1] == entity_id
+    )
+
+    if entity is not None:
+        key = detail_key(
+            kind,
+            entity.reference.id,
+            entity.reference.version,
+            entity.reference.ovn,
+        )
+        if key is not None:
+            detail_cache.set(key, entity)
+
+
+# Global coverage of our DSS subscriptions
+subscription_coverage = SubscriptionCoverage()
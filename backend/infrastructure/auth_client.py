@@ -1,9 +1,11 @@
+import asyncio
 import httpx
 import jwt
-from typing import Any
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
 from http import HTTPStatus
 from fastapi import HTTPException
-from datetime import datetime
 from threading import Lock
 from config.config import Settings
 from schemas.enums import Authority
@@ -20,6 +22,17 @@ class BaseClient(httpx.AsyncClient):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         kwargs.setdefault("timeout", httpx.Timeout(30.0, connect=5.0))
         super().__init__(*args, **kwargs)
+        self.log_max_body_bytes = Settings().REQUEST_LOG_MAX_BODY_BYTES
+
+    def _truncate(self, content: bytes) -> str:
+        """Response body for the logs, capped like request logging"""
+        text = content[: self.log_max_body_bytes].decode(
+            "utf-8", errors="replace"
+        )
+        remaining = len(content) - self.log_max_body_bytes
+        if remaining > 0:
+            text += f"... [{remaining} more bytes]"
+        return text
 
     async def request(
         self, method: str, url: httpx.URL | str, **kwargs: Any
@@ -32,16 +45,23 @@ class BaseClient(httpx.AsyncClient):
             #     headers["X-Correlation-ID"] = correlation_id
             #     kwargs["headers"] = headers
 
-            logging.info(
+            logging.debug(
                 f"[EXTERNAL REQUEST] {method} {self.base_url}{url}"
-                f". Args: {kwargs}"
             )
+            started = time.perf_counter()
             res = await super().request(method, url, **kwargs)
             res.raise_for_status()
             logging.info(
-                f"[EXTERNAL RESPONSE] {method} {self.base_url}{url}."
-                f" {res.status_code} {res.text.strip()}"
+                f"[EXTERNAL RESPONSE] {method} {self.base_url}{url}"
+                f" {res.status_code}"
+                f" {(time.perf_counter() - started) * 1000:.1f}ms"
+                f" {len(res.content)}B"
             )
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(
+                    f"[EXTERNAL RESPONSE BODY] {method} {self.base_url}{url}"
+                    f" {self._truncate(res.content)}"
+                )
             return res
         except ConnectionRefusedError as e:
             logging.error(f"Connection refused: {e}")
@@ -115,22 +135,42 @@ class AuthHandler(httpx.Auth):
             HTTPStatus.UNAUTHORIZED,
             HTTPStatus.FORBIDDEN,
         ):
-            await auth.refresh_token(aud=self._aud, scope=self._scope)
-            token = await auth.get_token(aud=self._aud, scope=self._scope)
+            token = await auth.refresh_token(
+                aud=self._aud, scope=self._scope, stale_token=token
+            )
             request.headers["Authorization"] = f"Bearer {token}"
             yield request
 
 
+@dataclass
+class CachedToken:
+    """Access token together with its decoded expiry (epoch seconds)"""
+
+    value: str
+    expires_at: float
+
+
 class AuthService:
+    """
+    Process-wide token manager.
+
+    Tokens are cached per (aud, scope) with their decoded expiry, refreshed
+    in the background shortly before they expire and refreshed at most once
+    at a time per (aud, scope), however many requests are waiting on them.
+    """
+
     _instance = None
     _lock = Lock()
 
     def __init__(self):
         settings = Settings()
 
-        self._tokens = {}
+        self._tokens: Dict[Tuple[str, str], CachedToken] = {}
+        self._refreshes: Dict[Tuple[str, str], asyncio.Task] = {}
         self._base_url = settings.BRUTM_BASE_URL
         self._auth_key = settings.BRUTM_KEY
+        self._clock_skew = settings.AUTH_TOKEN_CLOCK_SKEW
+        self._refresh_ahead = settings.AUTH_TOKEN_REFRESH_AHEAD
 
         if not self._base_url or not self._auth_key:
             raise ValueError(
@@ -148,23 +188,91 @@ class AuthService:
                     cls._instance = cls()
         return cls._instance
 
+    @staticmethod
+    def _key(aud: str, scope: Authority) -> Tuple[str, str]:
+        return aud, scope.value
+
     async def get_token(
         self,
         aud: str,
         scope: Authority = Authority.CONSTRAINT_PROCESSING,
     ) -> str:
-        if (
-            aud not in self._tokens
-            or scope not in self._tokens[aud]
-            or not self._is_token_valid(self._tokens[aud][scope])
-        ):
-            await self.refresh_token(aud=aud, scope=scope)
+        cached = self._tokens.get(self._key(aud, scope))
+        now = time.time()
+
+        if cached and now < cached.expires_at - self._clock_skew:
+            # Still valid: renew ahead of expiry without blocking the caller
+            if now >= cached.expires_at - self._refresh_ahead:
+                self._start_refresh(aud, scope)
+            return cached.value
 
-        return self._tokens[aud][scope]
+        return await self.refresh_token(aud=aud, scope=scope)
 
     async def refresh_token(
-        self, aud: str, scope: Authority = Authority.CONSTRAINT_PROCESSING
-    ):
+        self,
+        aud: str,
+        scope: Authority = Authority.CONSTRAINT_PROCESSING,
+        stale_token: Optional[str] = None,
+    ) -> str:
+        """
+        Fetch a new token, joining any refresh already in flight.
+
+        When `stale_token` is given and a newer token has been stored in the
+        meantime, that token is returned without another round-trip.
+        """
+        cached = self._tokens.get(self._key(aud, scope))
+        if stale_token and cached and cached.value != stale_token:
+            return cached.value
+
+        # Shield so a cancelled waiter does not cancel the shared refresh
+        return await asyncio.shield(self._start_refresh(aud, scope))
+
+    async def prewarm(
+        self, audiences: Iterable[str], scopes: Iterable[Authority]
+    ) -> None:
+        """Fetch tokens for every (aud, scope) pair ahead of first use"""
+        pairs = [(aud, scope) for aud in audiences for scope in scopes]
+        results = await asyncio.gather(
+            *[
+                self.refresh_token(aud=aud, scope=scope)
+                for aud, scope in pairs
+            ],
+            return_exceptions=True,
+        )
+
+        for (aud, scope), result in zip(pairs, results):
+            if isinstance(result, Exception):
+                logging.warning(
+                    f"Could not pre-warm token for {aud} ({scope.value}):"
+                    f" {result}"
+                )
+
+    def _start_refresh(self, aud: str, scope: Authority) -> asyncio.Task:
+        """Get the in-flight refresh for (aud, scope), starting one if idle"""
+        key = self._key(aud, scope)
+        task = self._refreshes.get(key)
+
+        if task is None:
+            task = asyncio.create_task(self._fetch_token(aud, scope))
+            self._refreshes[key] = task
+            task.add_done_callback(
+                lambda done: self._on_refresh_done(key, done)
+            )
+
+        return task
+
+    def _on_refresh_done(self, key: Tuple[str, str], task: asyncio.Task):
+        if self._refreshes.get(key) is task:
+            del self._refreshes[key]
+
+        # Background refreshes may have no awaiter left to see the error
+        if not task.cancelled() and task.exception() is not None:
+            logging.error(
+                f"Token refresh failed for {key[0]} ({key[1]}):"
+                f" {task.exception()}"
+            )
+
+    async def _fetch_token(self, aud: str, scope: Authority) -> str:
         params = {
             "intended_audience": aud,
             "scope": scope.value,
@@ -183,20 +291,23 @@ class AuthService:
                 details=response.json() if response.content else None,
             )
 
-        if aud not in self._tokens:
-            self._tokens[aud] = {}
+        token = response.json().get("access_token")
+        self._tokens[self._key(aud, scope)] = CachedToken(
+            value=token, expires_at=self._decode_expiry(token)
+        )
 
-        self._tokens[aud][scope] = response.json().get("access_token")
+        return token
+
+    @staticmethod
+    def _decode_expiry(token: str) -> float:
+        """Decode the token expiry once, treating unknown expiry as expired"""
+        try:
+            payload = jwt.decode(token, options={"verify_signature": False})
+        except jwt.PyJWTError:
+            return 0.0
 
-    def _is_token_valid(self, token: str) -> bool:
-        payload = jwt.decode(token, options={"verify_signature": False})
         exp = payload.get("exp", None)
         if exp is None:
-            return False
-        exp = datetime.fromtimestamp(exp)
-        now = datetime.now()
-
-        if exp >= now:
-            return True
+            return 0.0
 
-        return False
+        return float(exp)
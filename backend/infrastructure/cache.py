@@ -1,8 +1,12 @@
 # Simple in-memory cache for airspace data
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from typing import Callable, Dict, Any, Hashable, List, Optional
 from datetime import datetime, timedelta
 import hashlib
 import json
+import time
+
+from config.config import Settings
 
 
 class InMemoryCache:
@@ -70,6 +74,108 @@ class InMemoryCache:
         self._cache.clear()
 
 
+class LRUCache:
+    """Bounded in-memory cache with least-recently-used eviction"""
+
+    def __init__(
+        self, max_entries: int, ttl_seconds: Optional[float] = None
+    ):
+        self._entries: OrderedDict = OrderedDict()
+        self.max_entries = max_entries
+        self.default_ttl = ttl_seconds
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get value and mark it as recently used, if present and fresh"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at is not None and time.monotonic() > expires_at:
+            # Expired entries stay around for get_stale until evicted
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def get_stale(self, key: Hashable) -> Optional[Any]:
+        """Get value even if it has expired (e.g. as an error fallback)"""
+        entry = self._entries.get(key)
+        return entry[0] if entry is not None else None
+
+    def set(
+        self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None
+    ) -> None:
+        """Set value, evicting the least recently used entries if full"""
+        ttl = ttl_seconds or self.default_ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def replace(self, key: Hashable, value: Any) -> bool:
+        """Swap the value of a fresh entry, keeping its expiry and rank"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+
+        expires_at = entry[1]
+        if expires_at is not None and time.monotonic() > expires_at:
+            return False
+
+        self._entries[key] = (value, expires_at)
+        return True
+
+    def keys(self) -> List[Hashable]:
+        """Snapshot of the current keys, fresh or expired"""
+        return list(self._entries)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a single entry"""
+        self._entries.pop(key, None)
+
+    def delete_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove every entry whose key matches and return the count"""
+        keys = [key for key in self._entries if predicate(key)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Clear all cache entries"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def detail_key(
+    kind: str, entity_id, version, ovn: Optional[str] = None
+) -> Optional[Hashable]:
+    """Detail cache key for a reference, or None if it has no version"""
+    if entity_id is None or (version is None and ovn is None):
+        return None
+    return (kind, str(entity_id), version, ovn)
+
+
+_settings = Settings()
+
 # Global cache instance
 cache = InMemoryCache()
 
+# USS details keyed by (entity type, id, version, ovn)
+detail_cache = LRUCache(max_entries=_settings.DETAIL_CACHE_MAX_ENTRIES)
+
+# Simplified USS details keyed by detail key plus tolerance bucket
+simplified_cache = LRUCache(
+    max_entries=_settings.SIMPLIFIED_GEOMETRY_CACHE_MAX_ENTRIES
+)
+
+# Remote ID flight details keyed by (USS base URL, flight id)
+flight_details_cache = LRUCache(
+    max_entries=_settings.FLIGHT_DETAILS_CACHE_MAX_ENTRIES,
+    ttl_seconds=_settings.FLIGHT_DETAILS_TTL,
+)
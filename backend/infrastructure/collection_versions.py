@@ -0,0 +1,60 @@
+"""Per-collection data versions used as cheap change validators"""
+
+import asyncio
+import logging
+
+from pymongo import ReturnDocument
+from pymongo.errors import PyMongoError
+
+from infrastructure.mongodb_client import mongodb_client
+
+BUMP_ATTEMPTS = 3
+BUMP_RETRY_DELAY = 0.1
+
+
+class CollectionVersions:
+    """
+    Monotonic version counter per MongoDB collection, bumped on every
+    write, so readers can tell whether a collection changed with a
+    single indexed lookup instead of re-reading it.
+    """
+
+    collection_name = "collection_versions"
+
+    @property
+    def collection(self):
+        """Get the MongoDB collection"""
+        return mongodb_client.get_collection(self.collection_name)
+
+    async def get(self, name: str) -> int:
+        """Current version of a collection (0 if it was never written)"""
+        doc = await self.collection.find_one({"_id": name})
+        return doc["version"] if doc else 0
+
+    async def bump(self, name: str) -> int:
+        """
+        Record a write to a collection and return its new version. The bump
+        is retried and, if it still fails, raised so the caller's write
+        fails instead of readers getting 304s on a stale version.
+        """
+        for attempt in range(1, BUMP_ATTEMPTS + 1):
+            try:
+                doc = await self.collection.find_one_and_update(
+                    {"_id": name},
+                    {"$inc": {"version": 1}},
+                    upsert=True,
+                    return_document=ReturnDocument.AFTER,
+                )
+                return doc["version"]
+            except PyMongoError as e:
+                logging.error(
+                    f"Error bumping version of {name}"
+                    f" (attempt {attempt}/{BUMP_ATTEMPTS}): {e}"
+                )
+                if attempt == BUMP_ATTEMPTS:
+                    raise
+                await asyncio.sleep(BUMP_RETRY_DELAY * attempt)
+
+
+# Global instance
+collection_versions = CollectionVersions()
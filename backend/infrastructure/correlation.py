@@ -6,7 +6,7 @@ that can be used to trace requests across multiple services and log entries.
 """
 
 import uuid
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
 from typing import Optional
 import logging
 
@@ -23,9 +23,14 @@ class CorrelationIdManager:
         return str(uuid.uuid4())
     
     @staticmethod
-    def set_correlation_id(correlation_id: str) -> None:
+    def set_correlation_id(correlation_id: str) -> Token:
         """Set the correlation ID for the current request context."""
-        _correlation_id.set(correlation_id)
+        return _correlation_id.set(correlation_id)
+
+    @staticmethod
+    def reset_correlation_id(token: Token) -> None:
+        """Restore the correlation ID that was set before `token`."""
+        _correlation_id.reset(token)
     
     @staticmethod
     def get_correlation_id() -> Optional[str]:
@@ -52,32 +57,10 @@ class CorrelationIdFilter(logging.Filter):
     
     def filter(self, record: logging.LogRecord) -> bool:
         """Add correlation ID to the log record."""
-        record.correlation_id = CorrelationIdManager.get_correlation_id() or "N/A"
+        # Keep an id captured earlier, e.g. before the record was queued
+        if getattr(record, "correlation_id", None) is None:
+            record.correlation_id = (
+                CorrelationIdManager.get_correlation_id() or "N/A"
+            )
         return True
 
-
-def setup_correlation_logging() -> None:
-    """
-    Setup logging configuration to include correlation IDs in all log messages.
-    
-    This function configures the root logger to include correlation IDs
-    in the log format and adds the correlation filter to all handlers.
-    """
-    # Create correlation filter
-    correlation_filter = CorrelationIdFilter()
-    
-    # Get root logger
-    root_logger = logging.getLogger()
-    
-    # Add filter to all existing handlers
-    for handler in root_logger.handlers:
-        handler.addFilter(correlation_filter)
-    
-    # Update log format to include correlation ID
-    log_format = "[%(correlation_id)s] %(levelname)s:%(name)s:%(message)s"
-    
-    # Apply new format to all handlers
-    for handler in root_logger.handlers:
-        if hasattr(handler, 'setFormatter'):
-            formatter = logging.Formatter(log_format)
-            handler.setFormatter(formatter)
\ No newline at end of file
@@ -0,0 +1,109 @@
+"""Durable MongoDB outbox for events waiting to reach the event API"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+from bson import ObjectId
+
+from config.config import Settings
+from infrastructure.mongodb_client import mongodb_client
+
+
+class EventOutbox:
+    """
+    Append-only collection of events, delivered in insertion order.
+
+    Senders claim the oldest undelivered events with a short lease, so
+    several processes can share the outbox and events claimed by a
+    process that died are picked up again once the lease expires. The
+    holder renews its lease while delivering, and acknowledges or
+    releases events only under its own claim, so events re-claimed by
+    another sender are left alone.
+    Delivered events are acknowledged in bulk and removed by a TTL index.
+    """
+
+    collection_name = "event_outbox"
+
+    def __init__(self, lease_seconds: float):
+        self.lease = timedelta(seconds=lease_seconds)
+
+    @property
+    def collection(self):
+        """Get the MongoDB collection"""
+        return mongodb_client.get_collection(self.collection_name)
+
+    async def append(self, event: Dict[str, Any]) -> None:
+        """Store an event with a single insert"""
+        now = datetime.now(timezone.utc)
+        await self.collection.insert_one(
+            {
+                **event,
+                "created_at": now,
+                "lease_until": now,
+                "delivered_at": None,
+            }
+        )
+
+    async def claim(self, limit: int) -> List[Dict[str, Any]]:
+        """Lease up to `limit` of the oldest undelivered events"""
+        now = datetime.now(timezone.utc)
+        candidates = (
+            await self.collection.find(
+                {"delivered_at": None, "lease_until": {"$lte": now}},
+                {"_id": 1},
+            )
+            .sort("_id", 1)
+            .limit(limit)
+            .to_list(limit)
+        )
+        if not candidates:
+            return []
+
+        # Only events no other sender leased in the meantime are taken
+        claim = uuid.uuid4().hex
+        await self.collection.update_many(
+            {
+                "_id": {"$in": [doc["_id"] for doc in candidates]},
+                "lease_until": {"$lte": now},
+            },
+            {"$set": {"lease_until": now + self.lease, "claim": claim}},
+        )
+        return (
+            await self.collection.find({"claim": claim})
+            .sort("_id", 1)
+            .to_list(limit)
+        )
+
+    async def renew(self, claim: str) -> int:
+        """Extend the lease of a claim, returning how many events it holds"""
+        now = datetime.now(timezone.utc)
+        result = await self.collection.update_many(
+            {"claim": claim, "delivered_at": None},
+            {"$set": {"lease_until": now + self.lease}},
+        )
+        return result.matched_count
+
+    async def ack(self, claim: str, ids: List[ObjectId]) -> None:
+        """Mark events delivered, leaving their removal to the TTL index"""
+        if ids:
+            await self.collection.update_many(
+                {"_id": {"$in": ids}, "claim": claim},
+                {"$set": {"delivered_at": datetime.now(timezone.utc)}},
+            )
+
+    async def release(self, claim: str, ids: List[ObjectId]) -> None:
+        """Give events back so they are retried before newer ones"""
+        if ids:
+            await self.collection.update_many(
+                {"_id": {"$in": ids}, "claim": claim},
+                {"$set": {"lease_until": datetime.now(timezone.utc)}},
+            )
+
+    async def pending(self) -> int:
+        """Number of events not delivered yet"""
+        return await self.collection.count_documents({"delivered_at": None})
+
+
+# Global outbox instance
+event_outbox = EventOutbox(Settings().EVENT_OUTBOX_LEASE)
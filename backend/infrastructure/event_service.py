@@ -2,12 +2,30 @@
 
 import asyncio
 import logging
-from typing import Optional, Dict, Any
-from dataclasses import dataclass
+import random
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from http import HTTPStatus
+from typing import Any, Deque, Dict, List, Optional
+
 import httpx
+from fastapi import HTTPException
+
 from config.config import Settings
 from infrastructure.auth_client import BaseClient
 from infrastructure.correlation import CorrelationIdManager
+from infrastructure.event_outbox import EventOutbox, event_outbox
+from infrastructure.http_clients import http_clients
+
+EVENTS_PATH = "/api/v1/events/"
+USER_AGENT = "UTM-Manager/1.0.0"
+DROP_POLICIES = ("drop_oldest", "drop_newest")
+
+# Outcomes of a single delivery attempt
+_DELIVERED = "delivered"
+_REJECTED = "rejected"
+_RETRY = "retry"
 
 
 @dataclass
@@ -20,19 +38,127 @@ class EventPayload:
 
 
 class EventService:
-    """Service for dispatching events to external event API"""
+    """
+    Service for dispatching events to external event API.
 
-    def __init__(self, settings: Settings):
+    Events are appended to the MongoDB outbox, so they survive restarts
+    and outages of the event API, and delivered in order by a single
+    background worker in batches over the pooled client for the event
+    API. Failed deliveries are retried with jittered exponential backoff.
+
+    Without the outbox (disabled, or MongoDB unavailable or slow) events
+    are queued in memory, up to EVENT_QUEUE_SIZE. A slow event API fills
+    the queue, and further events are then dropped according to
+    EVENT_DROP_POLICY, so the work kept per request stays bounded.
+    """
+
+    def __init__(
+        self, settings: Settings, outbox: Optional[EventOutbox] = None
+    ):
         self.settings = settings
         self.event_api_url = getattr(settings, "EVENT_API_URL", None)
         self.timeout = getattr(settings, "EVENT_API_TIMEOUT", 5.0)
+        self.batch_path = settings.EVENT_API_BATCH_PATH
+        self.queue_size = settings.EVENT_QUEUE_SIZE
+        self.batch_size = settings.EVENT_BATCH_SIZE
+        self.batch_linger = settings.EVENT_BATCH_LINGER
+        self.max_retries = settings.EVENT_MAX_RETRIES
+        self.retry_base_delay = settings.EVENT_RETRY_BASE_DELAY
+        self.retry_max_delay = settings.EVENT_RETRY_MAX_DELAY
+        self.drain_timeout = settings.EVENT_DRAIN_TIMEOUT
+        self.drop_policy = settings.EVENT_DROP_POLICY
+        if self.drop_policy not in DROP_POLICIES:
+            raise ValueError(
+                f"Unknown event drop policy {self.drop_policy!r},"
+                f" expected one of {DROP_POLICIES}"
+            )
+        self.outbox = outbox if settings.EVENT_OUTBOX_ENABLED else None
+        self.outbox_poll_interval = settings.EVENT_OUTBOX_POLL_INTERVAL
+        self.outbox_append_timeout = settings.EVENT_OUTBOX_APPEND_TIMEOUT
+        self.outbox_retry_after = settings.EVENT_OUTBOX_RETRY_AFTER
         self.logger = logging.getLogger(__name__)
 
+        self._queue: Deque[EventPayload] = deque()
+        self._wake: Optional[asyncio.Event] = None
+        self._closed: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._closing = False
+        # Appends skip the outbox until then after one failed
+        self._outbox_retry_at = 0.0
+        self._in_flight = 0
+
+        self.persisted = 0
+        self.dispatched = 0
+        self.failed = 0
+        self.retried = 0
+        self.dropped = 0
+
+    async def stats(self) -> Dict[str, Any]:
+        """Outbox and queue depth and delivery counters"""
+        outbox_pending = None
+        if self.outbox is not None:
+            try:
+                outbox_pending = await self.outbox.pending()
+            except Exception as e:
+                self.logger.warning(f"Error counting outbox events: {e}")
+
+        return {
+            "outbox_enabled": self.outbox is not None,
+            "outbox_pending": outbox_pending,
+            "persisted": self.persisted,
+            "queued": len(self._queue),
+            "capacity": self.queue_size,
+            "in_flight": self._in_flight,
+            "dispatched": self.dispatched,
+            "failed": self.failed,
+            "retried": self.retried,
+            "dropped": self.dropped,
+            "drop_policy": self.drop_policy,
+        }
+
+    async def start(self) -> None:
+        """Start the background delivery worker"""
+        if not self.event_api_url or self._worker is not None:
+            return
+
+        self._closing = False
+        self._wake = asyncio.Event()
+        self._closed = asyncio.Event()
+        if self._queue:
+            self._wake.set()
+        self._worker = asyncio.create_task(self._run())
+
+    async def aclose(self) -> None:
+        """Deliver queued events, for up to EVENT_DRAIN_TIMEOUT, and stop"""
+        if self._worker is None:
+            return
+
+        self._closing = True
+        self._closed.set()
+        self._wake.set()
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(self._worker), self.drain_timeout
+            )
+        except asyncio.TimeoutError:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self.logger.warning(
+                "Event drain timed out with"
+                f" {len(self._queue) + self._in_flight} events undelivered"
+            )
+        self._worker = None
+        self._in_flight = 0
+
     async def dispatch_event(
         self, event_stream: str, correlation_id: str = ""
     ) -> bool:
         """
-        Dispatch an event to the external event API
+        Dispatch an event to the external event API right away, with
+        retries, bypassing the queue
 
         Args:
             event_stream: The event stream name (e.g., "MANAGER_FLIGHT_STRIPS_CREATE")
@@ -47,61 +173,55 @@ class EventService:
             )
             return False
 
-        # Use provided correlation_id or get from current context
-        if not correlation_id:
-            correlation_id = CorrelationIdManager.get_correlation_id() or ""
+        payload = self._payload(event_stream, correlation_id)
+        pending = await self._deliver([payload])
+        self.failed += len(pending)
+        return not pending
 
-        payload = EventPayload(
-            stream=event_stream, correlation_id=correlation_id
-        )
+    async def publish(
+        self, event_stream: str, correlation_id: str = ""
+    ) -> None:
+        """
+        Record an event for background delivery with a single outbox
+        insert, falling back to the in-memory queue when the insert
+        fails or takes longer than EVENT_OUTBOX_APPEND_TIMEOUT
 
-        try:
-            async with BaseClient(timeout=self.timeout) as client:
-                headers = {
-                    "Content-Type": "application/json",
-                    "User-Agent": "UTM-Manager/1.0.0",
-                }
-
-                # Add correlation ID to headers for external API tracking
-                if payload.correlation_id:
-                    headers["X-Correlation-ID"] = payload.correlation_id
-
-                response = await client.post(
-                    f"{self.event_api_url}/api/v1/events/",
-                    json={
-                        "stream": payload.stream,
-                        "version": payload.version,
-                        "correlation_id": payload.correlation_id,
-                    },
-                    headers=headers,
-                )
+        Args:
+            event_stream: The event stream name
+            correlation_id: Optional correlation ID (if empty, uses
+                current context)
+        """
+        if not self.event_api_url:
+            return
 
-                if response.status_code in (200, 201, 202):
-                    self.logger.info(
-                        f"Event dispatched successfully: {event_stream}"
-                    )
-                    return True
-                else:
-                    self.logger.warning(
-                        "Event dispatch failed with status"
-                        f" {response.status_code}: {event_stream}"
-                    )
-                    return False
+        payload = self._payload(event_stream, correlation_id)
+        if self._outbox_available():
+            try:
+                await asyncio.wait_for(
+                    self.outbox.append(asdict(payload)),
+                    self.outbox_append_timeout,
+                )
+                self.persisted += 1
+                self._notify()
+                return
+            except Exception as e:
+                # Stop waiting on the outbox for a while, so an outage
+                # costs one timeout instead of one per request
+                self._outbox_retry_at = (
+                    time.monotonic() + self.outbox_retry_after
+                )
+                self.logger.warning(
+                    "Event outbox unavailable, queueing in memory for"
+                    f" {self.outbox_retry_after}s: {e!r}"
+                )
 
-        except httpx.TimeoutException:
-            self.logger.warning(f"Event dispatch timeout for: {event_stream}")
-            return False
-        except Exception as e:
-            self.logger.error(
-                f"Event dispatch error for {event_stream}: {str(e)}"
-            )
-            return False
+        self._enqueue(payload)
 
     def dispatch_event_async(
         self, event_stream: str, correlation_id: str = ""
     ) -> None:
         """
-        Fire-and-forget event dispatch (non-blocking)
+        Queue an event for background delivery (non-blocking)
 
         Args:
             event_stream: The event stream name
@@ -110,9 +230,283 @@ class EventService:
         if not self.event_api_url:
             return
 
+        self._enqueue(self._payload(event_stream, correlation_id))
+
+    def _enqueue(self, payload: EventPayload) -> None:
+        if len(self._queue) >= self.queue_size:
+            self.dropped += 1
+            self.logger.debug(
+                f"Event queue full, applying {self.drop_policy}"
+            )
+            if self.drop_policy == "drop_newest":
+                return
+            self._queue.popleft()
+
+        self._queue.append(payload)
+        self._notify()
+
+    def _outbox_available(self) -> bool:
+        return (
+            self.outbox is not None
+            and time.monotonic() >= self._outbox_retry_at
+        )
+
+    def _notify(self) -> None:
+        if self._wake is not None:
+            self._wake.set()
+
+    @staticmethod
+    def _payload(event_stream: str, correlation_id: str) -> EventPayload:
         # Use provided correlation_id or get from current context
         if not correlation_id:
             correlation_id = CorrelationIdManager.get_correlation_id() or ""
+        return EventPayload(
+            stream=event_stream, correlation_id=correlation_id
+        )
+
+    async def _run(self) -> None:
+        """Deliver queued events, then the outbox, one batch at a time"""
+        while True:
+            # Cleared first, so events recorded while a batch is out
+            # are picked up right after it
+            self._wake.clear()
+            try:
+                if self._queue:
+                    await self._flush_queue()
+                elif self._outbox_available() and await self._flush_outbox():
+                    continue
+                elif self._closing:
+                    return
+                else:
+                    await self._idle()
+            except Exception as e:
+                self.logger.error(f"Event delivery error: {str(e)}")
+                await asyncio.sleep(self.outbox_poll_interval)
+
+    async def _idle(self) -> None:
+        """Wait for new events, polling the outbox for ones left behind"""
+        timeout = self.outbox_poll_interval if self.outbox else None
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _flush_queue(self) -> None:
+        """Deliver a batch from the in-memory queue"""
+        if len(self._queue) < self.batch_size and not self._closing:
+            # Let a burst of events fill the batch
+            await asyncio.sleep(self.batch_linger)
+
+        count = min(self.batch_size, len(self._queue))
+        batch = [self._queue.popleft() for _ in range(count)]
+        self._in_flight = count
+        try:
+            pending = await self._deliver(batch)
+        except Exception:
+            self.failed += count
+            raise
+        finally:
+            self._in_flight = 0
+
+        if pending:
+            self.failed += len(pending)
+            self.logger.warning(
+                f"Giving up on {len(pending)} events after"
+                f" {self.max_retries} retries"
+            )
+
+    async def _pause(self, delay: float) -> None:
+        """Sleep for `delay` seconds, waking up early on close"""
+        try:
+            await asyncio.wait_for(self._closed.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _flush_outbox(self) -> bool:
+        """
+        Deliver the oldest outbox events in order; False when there are
+        none, or when closing with events left to retry
+        """
+        documents = await self.outbox.claim(self.batch_size)
+        if not documents:
+            return False
+
+        events = [
+            EventPayload(
+                stream=document["stream"],
+                version=document.get("version", "1"),
+                correlation_id=document.get("correlation_id", ""),
+            )
+            for document in documents
+        ]
+        claim = documents[0]["claim"]
+        lease_lost = asyncio.Event()
+        keeper = asyncio.create_task(
+            self._keep_lease(claim, len(documents), lease_lost)
+        )
+        self._in_flight = len(events)
+        try:
+            pending = await self._deliver_in_order(events, lease_lost)
+        finally:
+            self._in_flight = 0
+            keeper.cancel()
+            await asyncio.gather(keeper, return_exceptions=True)
+
+        # Rejected events are acknowledged too; the first event still
+        # worth retrying and everything after it go back to the outbox
+        done = len(events) - len(pending)
+        await self.outbox.ack(
+            claim, [document["_id"] for document in documents[:done]]
+        )
+        if lease_lost.is_set():
+            # Another sender holds the rest now and delivers it in order
+            self.logger.warning(
+                f"Lost the outbox lease with {len(pending)} events left"
+            )
+            return True
+        if pending:
+            await self.outbox.release(
+                claim, [document["_id"] for document in documents[done:]]
+            )
+            self.logger.warning(
+                f"{len(pending)} events stay in the outbox after"
+                f" {self.max_retries} retries"
+            )
+            if self._closing:
+                # They are delivered after the next start
+                return False
+            await self._pause(self.retry_max_delay)
+        return True
+
+    async def _keep_lease(
+        self, claim: str, count: int, lease_lost: asyncio.Event
+    ) -> None:
+        """
+        Renew the outbox lease of a claim while its events are delivered,
+        flagging `lease_lost` once it no longer holds all of them
+        """
+        interval = self.outbox.lease.total_seconds() / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                held = await self.outbox.renew(claim)
+            except Exception as e:
+                self.logger.warning(f"Error renewing outbox lease: {e}")
+                continue
+            if held < count:
+                lease_lost.set()
+                return
+
+    async def _deliver_in_order(
+        self, events: List[EventPayload], lease_lost: asyncio.Event
+    ) -> List[EventPayload]:
+        """
+        Deliver events one after the other, stopping at the first one
+        that cannot be delivered, or once the lease on them is lost, and
+        return it with those after it
+        """
+        if self.batch_path:
+            # A single request, delivered or retried as a whole
+            return await self._deliver(events)
+
+        for index, event in enumerate(events):
+            if lease_lost.is_set() or await self._deliver([event]):
+                return events[index:]
+        return []
+
+    async def _deliver(
+        self, events: List[EventPayload]
+    ) -> List[EventPayload]:
+        """
+        Deliver events, retrying failures with jittered backoff, and
+        return those still undelivered
+        """
+        pending = events
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.retried += len(pending)
+                await asyncio.sleep(self._backoff(attempt))
+
+            pending = await self._attempt(pending)
+            if not pending:
+                break
+        return pending
+
+    def _backoff(self, attempt: int) -> float:
+        """Full jitter over an exponentially growing, capped delay"""
+        cap = min(
+            self.retry_max_delay, self.retry_base_delay * 2 ** (attempt - 1)
+        )
+        return random.uniform(0, cap)
+
+    async def _attempt(
+        self, events: List[EventPayload]
+    ) -> List[EventPayload]:
+        """Post events once, returning those worth retrying"""
+        client = http_clients.get_client(self.event_api_url)
+        if self.batch_path:
+            outcome = await self._post(
+                client, self.batch_path, [asdict(e) for e in events]
+            )
+            outcomes = [outcome] * len(events)
+        else:
+            outcomes = await asyncio.gather(
+                *(
+                    self._post(
+                        client, EVENTS_PATH, asdict(e), e.correlation_id
+                    )
+                    for e in events
+                )
+            )
+
+        retry = []
+        for event, outcome in zip(events, outcomes):
+            if outcome == _DELIVERED:
+                self.dispatched += 1
+                self.logger.debug(
+                    f"Event dispatched successfully: {event.stream}"
+                )
+            elif outcome == _RETRY:
+                retry.append(event)
+            else:
+                self.failed += 1
+        return retry
+
+    async def _post(
+        self,
+        client: BaseClient,
+        path: str,
+        body: Any,
+        correlation_id: str = "",
+    ) -> str:
+        headers = {"User-Agent": USER_AGENT}
+        # Add correlation ID to headers for external API tracking
+        if correlation_id:
+            headers["X-Correlation-ID"] = correlation_id
+
+        try:
+            await client.post(
+                path, json=body, headers=headers, timeout=self.timeout
+            )
+            return _DELIVERED
+        except httpx.TimeoutException:
+            self.logger.warning(f"Event dispatch timeout for: {path}")
+            return _RETRY
+        except httpx.TransportError as e:
+            self.logger.warning(f"Event dispatch error for {path}: {e}")
+            return _RETRY
+        except HTTPException as e:
+            # BaseClient raises for every error status
+            if (
+                e.status_code == HTTPStatus.TOO_MANY_REQUESTS.value
+                or e.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR.value
+            ):
+                return _RETRY
+            self.logger.warning(
+                f"Event dispatch rejected with status {e.status_code}"
+            )
+            return _REJECTED
+
 
-        # Create a task that runs in the background without blocking the request
-        asyncio.create_task(self.dispatch_event(event_stream, correlation_id))
+# Global event service used by the request context middleware
+event_service = EventService(Settings(), outbox=event_outbox)
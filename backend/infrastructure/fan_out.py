@@ -0,0 +1,82 @@
+"""Bounded concurrent fan-out for upstream USS/DSS calls"""
+
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+)
+from urllib.parse import urlsplit
+
+from config.config import Settings
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class FanOut:
+    """
+    Runs upstream calls concurrently under a process-wide concurrency cap
+    and a per-host cap, so a single slow USS cannot monopolise the
+    available slots and the total latency follows the slowest host.
+    """
+
+    def __init__(self, max_concurrency: int, max_per_host: int):
+        self._global = asyncio.Semaphore(max_concurrency)
+        self._max_per_host = max_per_host
+        self._per_host: Dict[str, asyncio.Semaphore] = {}
+
+    def _host_semaphore(self, host: str) -> asyncio.Semaphore:
+        """Get (or lazily create) the semaphore guarding a host"""
+        semaphore = self._per_host.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._max_per_host)
+            self._per_host[host] = semaphore
+        return semaphore
+
+    @staticmethod
+    def host_of(url: Optional[str]) -> str:
+        """Normalise a base URL into the key used for per-host limits"""
+        if not url:
+            return ""
+        return urlsplit(url).netloc.lower()
+
+    async def run(self, host: str, call: Callable[[], Awaitable[R]]) -> R:
+        """Run a single call once both the host and global slots are free"""
+        async with self._host_semaphore(host):
+            async with self._global:
+                return await call()
+
+    async def map(
+        self,
+        fn: Callable[[T], Awaitable[R]],
+        items: Iterable[T],
+        host: Callable[[T], Optional[str]],
+    ) -> List[Any]:
+        """
+        Apply `fn` to every item concurrently.
+
+        Results keep the order of `items`; failed calls are returned as
+        the raised exception instead of cancelling their siblings.
+        """
+        return await asyncio.gather(
+            *[
+                self.run(self.host_of(host(item)), lambda item=item: fn(item))
+                for item in items
+            ],
+            return_exceptions=True,
+        )
+
+
+_settings = Settings()
+
+# Global fan-out instance shared by every request
+fan_out = FanOut(
+    max_concurrency=_settings.FAN_OUT_MAX_CONCURRENCY,
+    max_per_host=_settings.FAN_OUT_MAX_PER_HOST,
+)
@@ -0,0 +1,95 @@
+"""Cursor-based tracking of what each client already knows of the flights"""
+
+import itertools
+import secrets
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from config.config import Settings
+from domain.airspace import AirspaceFlightsDelta
+from domain.flights import Flight, FlightStateChange
+from infrastructure.cache import LRUCache
+
+# Fields that move on every poll and travel in `changed` instead
+_MOVING_FIELDS = {"current_state", "recent_positions"}
+
+
+class FlightDeltaTracker:
+    """
+    Remembers, per issued cursor, the flight states sent to the client so
+    the next response only carries added, removed and moved flights. A
+    flight whose other fields changed, like its details or ISA, is sent
+    whole in `added` again.
+
+    Cursors are opaque, expire after a while and are unique to this
+    process; an unknown cursor simply yields a full response.
+    """
+
+    def __init__(self, max_cursors: int, cursor_ttl: float):
+        self._sent = LRUCache(max_entries=max_cursors, ttl_seconds=cursor_ttl)
+        self._epoch = secrets.token_hex(4)
+        self._counter = itertools.count(1)
+
+    def diff(
+        self,
+        since: Optional[str],
+        flights: List[Flight],
+        timestamp: datetime,
+    ) -> AirspaceFlightsDelta:
+        """Delta between the flights known at `since` and `flights`"""
+        current = {flight.id: flight for flight in flights}
+        known: Optional[Dict[str, Tuple[object, int]]] = (
+            self._sent.get(since) if since else None
+        )
+
+        sent = {
+            flight_id: (flight.current_state, self._static_hash(flight))
+            for flight_id, flight in current.items()
+        }
+        cursor = f"{self._epoch}.{next(self._counter)}"
+        self._sent.set(cursor, sent)
+
+        if known is None:
+            return AirspaceFlightsDelta(
+                timestamp=timestamp,
+                cursor=cursor,
+                full=True,
+                added=list(current.values()),
+            )
+
+        return AirspaceFlightsDelta(
+            timestamp=timestamp,
+            cursor=cursor,
+            added=[
+                flight
+                for flight_id, flight in current.items()
+                if flight_id not in known
+                or known[flight_id][1] != sent[flight_id][1]
+            ],
+            removed=[
+                flight_id for flight_id in known if flight_id not in current
+            ],
+            changed=[
+                FlightStateChange(
+                    id=flight_id, current_state=flight.current_state
+                )
+                for flight_id, flight in current.items()
+                if flight_id in known
+                and known[flight_id][1] == sent[flight_id][1]
+                and known[flight_id][0] != flight.current_state
+            ],
+        )
+
+    @staticmethod
+    def _static_hash(flight: Flight) -> int:
+        """Hash of the fields of a flight that `changed` does not carry"""
+        return hash(flight.model_dump_json(exclude=_MOVING_FIELDS))
+
+
+_settings = Settings()
+
+# Global delta tracker instance
+flight_deltas = FlightDeltaTracker(
+    max_cursors=_settings.FLIGHT_DELTA_MAX_CURSORS,
+    cursor_ttl=_settings.FLIGHT_DELTA_CURSOR_TTL,
+)
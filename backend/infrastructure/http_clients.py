@@ -0,0 +1,131 @@
+"""Process-wide registry of pooled HTTP clients for upstream hosts"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from config.config import Settings
+from infrastructure.auth_client import AuthClient, BaseClient
+
+
+@dataclass
+class _RegistryEntry:
+    """Pooled client plus the last time it was handed out"""
+
+    client: BaseClient
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class HttpClientRegistry:
+    """
+    Hands out one long-lived client (and connection pool) per upstream
+    base URL so keep-alive connections are reused across requests.
+
+    Authenticated clients are additionally keyed by audience, since the
+    same base URL can be reached with plain and token-bearing clients.
+    Clients that have not been used for a while are evicted and closed.
+    """
+
+    def __init__(self, settings: Settings):
+        self._settings = settings
+        self._entries: Dict[Tuple[str, str, str], _RegistryEntry] = {}
+        self._sweeper: Optional[asyncio.Task] = None
+
+    def _limits_for(self, base_url: str) -> httpx.Limits:
+        """Connection limits for a host, honouring per-host overrides"""
+        host = urlsplit(base_url).netloc.lower()
+        max_connections = self._settings.HTTP_HOST_MAX_CONNECTIONS.get(
+            host, self._settings.HTTP_MAX_CONNECTIONS_PER_HOST
+        )
+        return httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(
+                max_connections,
+                self._settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            keepalive_expiry=self._settings.HTTP_KEEPALIVE_EXPIRY,
+        )
+
+    def _get(self, key: Tuple[str, str, str], factory) -> BaseClient:
+        entry = self._entries.get(key)
+        if entry is None or entry.client.is_closed:
+            entry = _RegistryEntry(client=factory())
+            self._entries[key] = entry
+        entry.last_used = time.monotonic()
+        return entry.client
+
+    def get_client(self, base_url: str) -> BaseClient:
+        """Get the shared unauthenticated client for a base URL"""
+        return self._get(
+            ("base", base_url, ""),
+            lambda: BaseClient(
+                base_url=base_url, limits=self._limits_for(base_url)
+            ),
+        )
+
+    def get_auth_client(self, base_url: str, aud: str) -> AuthClient:
+        """Get the shared authenticated client for a base URL and audience"""
+        return self._get(
+            ("auth", base_url, aud),
+            lambda: AuthClient(
+                aud=aud,
+                base_url=base_url,
+                limits=self._limits_for(base_url),
+            ),
+        )
+
+    async def evict_idle(self) -> int:
+        """Close clients idle for longer than the configured TTL"""
+        cutoff = time.monotonic() - self._settings.HTTP_CLIENT_IDLE_TTL
+        idle_keys = [
+            key
+            for key, entry in self._entries.items()
+            if entry.last_used < cutoff
+        ]
+
+        for key in idle_keys:
+            entry = self._entries.pop(key)
+            await entry.client.aclose()
+
+        if idle_keys:
+            logging.debug(f"Evicted {len(idle_keys)} idle HTTP clients")
+
+        return len(idle_keys)
+
+    async def _sweep(self) -> None:
+        interval = max(self._settings.HTTP_CLIENT_IDLE_TTL / 2, 1.0)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.evict_idle()
+            except Exception as e:
+                logging.error(f"Error evicting idle HTTP clients: {e}")
+
+    async def start(self) -> None:
+        """Start the background idle-client sweeper"""
+        if self._sweeper is None:
+            self._sweeper = asyncio.create_task(self._sweep())
+
+    async def aclose(self) -> None:
+        """Stop the sweeper and close every pooled client"""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+            self._sweeper = None
+
+        entries = list(self._entries.values())
+        self._entries.clear()
+        for entry in entries:
+            await entry.client.aclose()
+
+
+# Global registry instance
+http_clients = HttpClientRegistry(Settings())
@@ -0,0 +1,105 @@
+"""Push-maintained set of ISAs for the areas we hold RID subscriptions on"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from config.config import Settings
+from domain.base import Volume4D
+from domain.external.dss.remoteid import IdentificationServiceArea
+from infrastructure.spatial_tiles import Bounds, Tile, TileGrid, volume_bounds
+
+
+@dataclass
+class _LiveCell:
+    """ISAs known in one subscribed cell, kept current by notifications"""
+
+    subscription_id: str
+    expires_at: float
+    isas: Dict[str, IdentificationServiceArea] = field(default_factory=dict)
+
+
+class LiveIsaSet:
+    """
+    In-memory ISA set per subscribed grid cell. Cells are seeded from the
+    subscription response and then updated by DSS notifications, so ISA
+    lookups inside them never have to search the DSS.
+    """
+
+    def __init__(self, cell_degrees: float):
+        self.grid = TileGrid(cell_degrees)
+        self._cells: Dict[Tile, _LiveCell] = {}
+
+    def activate(
+        self,
+        cell: Tile,
+        subscription_id: str,
+        isas: Iterable[IdentificationServiceArea],
+        ttl: float,
+    ) -> None:
+        """Start (or renew) serving a cell from its subscription"""
+        self._cells[cell] = _LiveCell(
+            subscription_id=subscription_id,
+            expires_at=time.monotonic() + ttl,
+            isas={isa.id: isa for isa in isas},
+        )
+
+    def deactivate(self, cell: Tile) -> None:
+        self._cells.pop(cell, None)
+
+    def owns(self, subscription_id) -> bool:
+        """Whether a subscription id is one of our active cells"""
+        return any(
+            live.subscription_id == str(subscription_id)
+            for live in self._live_cells()
+        )
+
+    def apply(
+        self,
+        subscription_ids: Iterable,
+        isa_id: str,
+        isa: Optional[IdentificationServiceArea],
+        extents: Optional[Volume4D],
+    ) -> int:
+        """
+        Apply a changed or deleted (when `isa` is None) ISA to every cell
+        of the notified subscriptions, returning how many cells changed.
+        """
+        notified = {str(subscription) for subscription in subscription_ids}
+        bounds = volume_bounds(extents.volume) if extents else None
+
+        updated = 0
+        for cell, live in self._cells.items():
+            if live.subscription_id not in notified:
+                continue
+
+            live.isas.pop(isa_id, None)
+            inside = bounds is None or cell.intersects(bounds)
+            if isa is not None and inside:
+                live.isas[isa_id] = isa
+            updated += 1
+
+        return updated
+
+    def lookup(
+        self, bounds: Bounds
+    ) -> Optional[Dict[Tile, List[IdentificationServiceArea]]]:
+        """ISAs per cell of an area, or None unless every cell is live"""
+        now = time.monotonic()
+        cells: Dict[Tile, List[IdentificationServiceArea]] = {}
+
+        for cell in self.grid.tiles_for_bounds(bounds):
+            live = self._cells.get(cell)
+            if live is None or live.expires_at <= now:
+                return None
+            cells[cell] = list(live.isas.values())
+
+        return cells
+
+    def _live_cells(self) -> List[_LiveCell]:
+        now = time.monotonic()
+        return [live for live in self._cells.values() if live.expires_at > now]
+
+
+# Global live ISA set
+live_isas = LiveIsaSet(Settings().RID_SUBSCRIPTION_CELL_DEGREES)
@@ -0,0 +1,150 @@
+"""Shared background polling of live traffic for every watched tile"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from config.config import Settings
+from infrastructure.spatial_tiles import Tile, TileGrid
+
+# Polls several tiles at once, returning the flights of each tile
+Fetch = Callable[[List[Tile]], Awaitable[Tuple[Dict[Tile, list], List[dict]]]]
+
+
+@dataclass
+class TileSnapshot:
+    """Latest result of polling one tile"""
+
+    flights: list
+    errors: List[dict]
+    taken_at: float = field(default_factory=time.monotonic)
+
+
+class _WatchedTile:
+    """Latest snapshot of a tile plus when a request last touched it"""
+
+    def __init__(self):
+        self.snapshot: Optional[TileSnapshot] = None
+        self.ready = asyncio.Event()
+        self.last_watched = time.monotonic()
+
+
+class LiveTrafficPoller:
+    """
+    Keeps the traffic of every tile clients are watching fresh with one
+    polling loop, so each cycle shares a single upstream query across all
+    watched tiles and clients looking at the same area share a snapshot.
+
+    A tile joins the loop on its first request and is polled right away;
+    it leaves once no request has touched it for the idle timeout.
+    """
+
+    def __init__(self, settings: Settings):
+        self.grid = TileGrid(settings.LIVE_TRAFFIC_TILE_DEGREES)
+        self.interval = settings.LIVE_TRAFFIC_INTERVAL
+        self.idle_timeout = settings.LIVE_TRAFFIC_IDLE_TIMEOUT
+        self.max_tiles = settings.LIVE_TRAFFIC_MAX_TILES
+        self._tiles: Dict[Tile, _WatchedTile] = {}
+        self._fetch: Optional[Fetch] = None
+        self._added = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def active_tiles(self) -> int:
+        return len(self._tiles)
+
+    async def snapshots(
+        self, tiles: List[Tile], fetch: Fetch
+    ) -> Dict[Tile, TileSnapshot]:
+        """Latest snapshot of each tile, adding new tiles to the loop"""
+        self._fetch = fetch
+        now = time.monotonic()
+
+        watched = []
+        for tile in tiles:
+            entry = self._tiles.get(tile)
+            if entry is None:
+                entry = self._tiles[tile] = _WatchedTile()
+                self._added.set()
+            entry.last_watched = now
+            watched.append(entry)
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        await asyncio.gather(*[entry.ready.wait() for entry in watched])
+        return {tile: entry.snapshot for tile, entry in zip(tiles, watched)}
+
+    async def _run(self) -> None:
+        next_cycle = time.monotonic()
+        try:
+            while self._tiles:
+                now = time.monotonic()
+                for tile, entry in list(self._tiles.items()):
+                    if now - entry.last_watched >= self.idle_timeout:
+                        del self._tiles[tile]
+
+                self._added.clear()
+                if now >= next_cycle:
+                    due = list(self._tiles)
+                    next_cycle = now + self.interval
+                else:
+                    # Tiles added since the last cycle get a first snapshot
+                    # straight away instead of waiting for the next one
+                    due = [
+                        tile
+                        for tile, entry in self._tiles.items()
+                        if not entry.ready.is_set()
+                    ]
+                if due:
+                    await self._poll(due)
+
+                try:
+                    await asyncio.wait_for(
+                        self._added.wait(),
+                        max(next_cycle - time.monotonic(), 0),
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for entry in self._tiles.values():
+                if not entry.ready.is_set():
+                    # Unblock waiters if the loop dies before their poll
+                    entry.snapshot = TileSnapshot(
+                        [], [{"error": "Poller stopped"}]
+                    )
+                    entry.ready.set()
+            logging.debug("Stopped live traffic poller")
+
+    async def _poll(self, tiles: List[Tile]) -> None:
+        """Refresh the snapshots of several tiles with one fetch"""
+        try:
+            flights, errors = await self._fetch(tiles)
+        except Exception as e:
+            logging.error(f"Error polling traffic for {len(tiles)} tiles: {e}")
+            flights, errors = None, [{"error": str(e)}]
+
+        for tile in tiles:
+            entry = self._tiles.get(tile)
+            if entry is None:
+                continue
+            if flights is not None:
+                entry.snapshot = TileSnapshot(flights.get(tile, []), errors)
+            else:
+                # Keep serving the last flights alongside the error
+                previous = entry.snapshot.flights if entry.snapshot else []
+                entry.snapshot = TileSnapshot(previous, errors)
+            entry.ready.set()
+
+    async def aclose(self) -> None:
+        """Stop the polling loop"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._tiles.clear()
+
+
+# Global poller instance shared by every request
+live_traffic = LiveTrafficPoller(Settings())
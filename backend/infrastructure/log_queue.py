@@ -0,0 +1,144 @@
+"""
+Non-blocking log pipeline: records are queued by the request path and
+serialized and written by a background thread, so slow log output never
+stalls the event loop.
+"""
+
+import copy
+import json
+import logging
+import queue
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from config.config import Settings
+from infrastructure.correlation import CorrelationIdFilter
+
+TEXT_FORMAT = "[%(correlation_id)s] %(levelname)s:%(name)s:%(message)s"
+
+# Chatty libraries kept at INFO even when the app logs at DEBUG
+_QUIET_LOGGERS = ("pymongo", "motor", "httpcore", "asyncio")
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, with the request's correlation id"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": datetime.fromtimestamp(
+                record.created, timezone.utc
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "correlation_id": getattr(record, "correlation_id", None),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exception"] = record.exc_text
+        return json.dumps(payload, default=str)
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Queue handler that drops records instead of blocking when full"""
+
+    def __init__(self, max_size: int):
+        super().__init__(queue.Queue(maxsize=max_size))
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Resolve what cannot safely cross threads (arguments, tracebacks)
+        and leave the formatting to the listener thread.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(
+                record.exc_info
+            )
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogQueue:
+    """Routes the root logger through a bounded queue to one writer"""
+
+    def __init__(self, max_size: int):
+        self.handler = BoundedQueueHandler(max_size)
+        # The correlation id lives in a context variable, so it must be
+        # captured before the record leaves the request's task
+        self.handler.addFilter(CorrelationIdFilter())
+        self.output: Optional[logging.Handler] = None
+        self._listener: Optional[QueueListener] = None
+
+    @property
+    def dropped(self) -> int:
+        return self.handler.dropped
+
+    @property
+    def pending(self) -> int:
+        return self.handler.queue.qsize()
+
+    def start(self, output: logging.Handler) -> None:
+        """Send every root logger record through the queue to `output`"""
+        if self._listener is not None:
+            return
+
+        self.output = output
+        self._listener = QueueListener(
+            self.handler.queue, self.output, respect_handler_level=True
+        )
+        self._listener.start()
+
+        root = logging.getLogger()
+        root.handlers = [self.handler]
+
+    def stop(self) -> None:
+        """Flush queued records and write directly from then on"""
+        if self._listener is None:
+            return
+
+        self._listener.stop()
+        self._listener = None
+
+        root = logging.getLogger()
+        root.handlers = [self.output]
+        self.output.addFilter(CorrelationIdFilter())
+
+
+def log_level(settings: Settings) -> str:
+    """Configured level, or DEBUG in development and INFO elsewhere"""
+    if settings.LOG_LEVEL:
+        return settings.LOG_LEVEL.upper()
+    return "DEBUG" if settings.ENV == "dev" else "INFO"
+
+
+def setup_logging(settings: Settings) -> None:
+    """Configure levels and formats and start the background writer"""
+    output = logging.StreamHandler(sys.stdout)
+    if settings.LOG_FORMAT == "json":
+        output.setFormatter(JsonFormatter())
+    else:
+        output.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+    logging.getLogger().setLevel(log_level(settings))
+    for name in _QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(logging.INFO)
+    logging.getLogger("api.access").setLevel(settings.REQUEST_LOG_LEVEL)
+
+    log_queue.start(output)
+
+
+# Global log queue shared by every logger
+log_queue = LogQueue(Settings().LOG_QUEUE_SIZE)
@@ -126,6 +126,15 @@ class MongoDBClient:
             # Compound index for soft delete queries
             await drone_mappings.create_index([("deleted_at", 1), ("id", 1)])
 
+            # Event outbox: oldest undelivered first, delivered ones expire
+            event_outbox = self._database.event_outbox
+            await event_outbox.create_index([("delivered_at", 1), ("_id", 1)])
+            await event_outbox.create_index("claim")
+            await event_outbox.create_index(
+                "delivered_at",
+                expireAfterSeconds=Settings().EVENT_OUTBOX_RETENTION,
+            )
+
             logging.info("MongoDB indexes created successfully")
 
         except Exception as e:
@@ -0,0 +1,165 @@
+"""Fixed geographic tile grid used to share and cache area queries"""
+
+import math
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
+from config.config import Settings
+from domain.base import (
+    LatLngPoint,
+    Polygon,
+    Time,
+    Volume3D,
+    Volume4D,
+)
+from infrastructure.cache import LRUCache
+
+# Approximate length of one degree of latitude, in meters
+METERS_PER_DEGREE = 111_320.0
+
+EARTH_RADIUS_KM = 6371.0
+
+# (south, west, north, east) in degrees
+Bounds = Tuple[float, float, float, float]
+
+
+@dataclass(frozen=True)
+class Tile:
+    """One cell of a TileGrid, addressed by its integer column and row"""
+
+    x: int
+    y: int
+    size: float
+
+    @property
+    def bounds(self) -> Bounds:
+        south = self.y * self.size
+        west = self.x * self.size
+        return south, west, south + self.size, west + self.size
+
+    def polygon(self) -> Polygon:
+        """Tile outline as a domain polygon"""
+        south, west, north, east = self.bounds
+        return Polygon(
+            vertices=[
+                LatLngPoint(lat=north, lng=west),
+                LatLngPoint(lat=north, lng=east),
+                LatLngPoint(lat=south, lng=east),
+                LatLngPoint(lat=south, lng=west),
+            ]
+        )
+
+    def intersects(self, bounds: Bounds) -> bool:
+        south, west, north, east = self.bounds
+        return not (
+            bounds[2] < south
+            or bounds[0] > north
+            or bounds[3] < west
+            or bounds[1] > east
+        )
+
+
+def distance_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance between two points"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+
+    a = (
+        math.sin(d_phi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def volume_bounds(volume: Volume3D) -> Optional[Bounds]:
+    """Bounding box of a volume outline, or None if it has no outline"""
+    if volume.outline_polygon and volume.outline_polygon.vertices:
+        lats = [vertex.lat for vertex in volume.outline_polygon.vertices]
+        lngs = [vertex.lng for vertex in volume.outline_polygon.vertices]
+        return min(lats), min(lngs), max(lats), max(lngs)
+
+    circle = volume.outline_circle
+    if circle and circle.center and circle.radius:
+        d_lat = circle.radius.value / METERS_PER_DEGREE
+        d_lng = d_lat / max(math.cos(math.radians(circle.center.lat)), 1e-6)
+        return (
+            circle.center.lat - d_lat,
+            circle.center.lng - d_lng,
+            circle.center.lat + d_lat,
+            circle.center.lng + d_lng,
+        )
+
+    return None
+
+
+class TileGrid:
+    """Regular lat/lng grid with square tiles of `tile_degrees`"""
+
+    def __init__(self, tile_degrees: float):
+        self.tile_degrees = tile_degrees
+
+    def tiles_for_bounds(self, bounds: Bounds) -> List[Tile]:
+        """Every tile overlapping the bounding box"""
+        south, west, north, east = bounds
+        size = self.tile_degrees
+
+        x_range = range(math.floor(west / size), math.floor(east / size) + 1)
+        y_range = range(
+            math.floor(south / size), math.floor(north / size) + 1
+        )
+
+        return [Tile(x=x, y=y, size=size) for y in y_range for x in x_range]
+
+    def tiles_for_volume(self, volume: Volume3D) -> List[Tile]:
+        """Every tile overlapping the outline of a volume"""
+        bounds = volume_bounds(volume)
+        if bounds is None:
+            return []
+        return self.tiles_for_bounds(bounds)
+
+
+def bucket_time_window(
+    area: Volume4D, bucket_seconds: float
+) -> Tuple[datetime, datetime]:
+    """Widen the time window of an area to whole time buckets"""
+    start = area.time_start.value.timestamp()
+    end = area.time_end.value.timestamp()
+
+    start = math.floor(start / bucket_seconds) * bucket_seconds
+    end = math.ceil(end / bucket_seconds) * bucket_seconds
+
+    return (
+        datetime.fromtimestamp(start, tz=timezone.utc),
+        datetime.fromtimestamp(end, tz=timezone.utc),
+    )
+
+
+def tile_volume(
+    tile: Tile, area: Volume4D, time_start: datetime, time_end: datetime
+) -> Volume4D:
+    """Volume covering a whole tile with the altitudes of `area`"""
+    return Volume4D(
+        volume=Volume3D(
+            outline_polygon=tile.polygon(),
+            altitude_lower=area.volume.altitude_lower,
+            altitude_upper=area.volume.altitude_upper,
+        ),
+        time_start=Time(value=time_start),
+        time_end=Time(value=time_end),
+    )
+
+
+_settings = Settings()
+
+# Grid and per-tile cache for DSS reference queries
+reference_grid = TileGrid(_settings.DSS_TILE_DEGREES)
+reference_tiles = LRUCache(
+    max_entries=_settings.DSS_TILE_CACHE_MAX_ENTRIES,
+    ttl_seconds=_settings.DSS_TILE_TTL,
+)
+
+# Grid and per-tile cache for remote ID ISA discovery
+isa_grid = TileGrid(_settings.RID_ISA_TILE_DEGREES)
+isa_tiles = LRUCache(max_entries=_settings.RID_ISA_CACHE_MAX_ENTRIES)
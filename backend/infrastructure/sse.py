@@ -0,0 +1,144 @@
+"""Server-Sent Events helpers for pushing live data to clients"""
+
+import asyncio
+import logging
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+# Headers that keep proxies (nginx included) from buffering the stream
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
+
+class ChannelClosed(Exception):
+    """Raised by LatestValueChannel.get once the producer is done"""
+
+
+class LatestValueChannel(Generic[T]):
+    """
+    Single-slot channel between a producer and one consumer.
+
+    A value put before the previous one was consumed replaces it, so a
+    slow consumer skips intermediate frames instead of queueing them.
+    """
+
+    def __init__(self):
+        self._value: Optional[T] = None
+        self._pending = False
+        self._closed = False
+        self._event = asyncio.Event()
+        self.coalesced = 0
+
+    def put(self, value: T) -> None:
+        if self._pending:
+            self.coalesced += 1
+        self._value = value
+        self._pending = True
+        self._event.set()
+
+    def close(self) -> None:
+        self._closed = True
+        self._event.set()
+
+    async def get(self, timeout: Optional[float] = None) -> T:
+        """Wait for the latest value; raises asyncio.TimeoutError on idle"""
+        if not self._pending and not self._closed:
+            await asyncio.wait_for(self._event.wait(), timeout)
+
+        if self._pending:
+            value = self._value
+            self._value = None
+            self._pending = False
+            self._event.clear()
+            return value
+
+        raise ChannelClosed()
+
+
+def format_event(
+    data: Optional[str] = None,
+    event: Optional[str] = None,
+    event_id: Optional[str] = None,
+    retry: Optional[int] = None,
+) -> str:
+    """Encode one SSE message"""
+    lines = []
+    if event:
+        lines.append(f"event: {event}")
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if retry is not None:
+        lines.append(f"retry: {retry}")
+    if data is not None:
+        lines.extend(f"data: {line}" for line in data.splitlines() or [""])
+    return "\n".join(lines) + "\n\n"
+
+
+async def event_stream(
+    frames: AsyncIterator[T],
+    encode: Callable[[T], Tuple[Optional[str], Optional[str], str]],
+    is_disconnected: Callable[[], Awaitable[bool]],
+    heartbeat: float,
+    retry_ms: int,
+) -> AsyncIterator[str]:
+    """
+    Turn an async iterator of frames into SSE messages.
+
+    Frames are produced in a background task and handed over through a
+    LatestValueChannel; `encode` maps a frame to (event, id, data). A
+    comment line is sent whenever the stream is idle for `heartbeat`
+    seconds so proxies and clients keep the connection open.
+    """
+    channel: LatestValueChannel[T] = LatestValueChannel()
+
+    async def produce():
+        try:
+            async for frame in frames:
+                channel.put(frame)
+        except Exception as e:
+            logging.error(f"Error producing stream frames: {e}")
+        finally:
+            channel.close()
+
+    producer = asyncio.create_task(produce())
+
+    try:
+        yield format_event(retry=retry_ms)
+
+        while True:
+            try:
+                frame = await channel.get(timeout=heartbeat)
+            except asyncio.TimeoutError:
+                frame = None
+            except ChannelClosed:
+                break
+
+            # Checked on every iteration, not only when idle, so a busy
+            # stream stops producing as soon as the client goes away
+            if await is_disconnected():
+                break
+
+            if frame is None:
+                yield ": heartbeat\n\n"
+                continue
+
+            event, event_id, data = encode(frame)
+            yield format_event(data, event=event, event_id=event_id)
+    finally:
+        producer.cancel()
+        if channel.coalesced:
+            logging.debug(
+                f"Stream closed after coalescing {channel.coalesced} frames"
+            )
@@ -0,0 +1,58 @@
+"""
+Validation of upstream (DSS/USS) JSON payloads straight from the response
+bytes, without building an intermediate dict first.
+"""
+
+import asyncio
+from functools import lru_cache
+from typing import Any, Type, TypeVar
+
+import httpx
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import from_json
+
+from config.config import Settings
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=None)
+def _type_adapter(target: Any) -> TypeAdapter:
+    """Validators for non-model types are built once per type"""
+    return TypeAdapter(target)
+
+
+def validate_json(target: Type[T], content: bytes) -> T:
+    """Parse and validate `content` as `target` in a single pass"""
+    if isinstance(target, type) and issubclass(target, BaseModel):
+        return target.model_validate_json(content)
+    return _type_adapter(target).validate_json(content)
+
+
+class UpstreamDecoder:
+    """
+    Decodes upstream responses, moving large payloads to a worker thread
+    so validating them does not stall the event loop.
+    """
+
+    def __init__(self, thread_threshold: int):
+        self.thread_threshold = thread_threshold
+
+    async def _run(self, content: bytes, function, *args):
+        if len(content) >= self.thread_threshold:
+            return await asyncio.to_thread(function, *args)
+        return function(*args)
+
+    async def decode(self, response: httpx.Response, target: Type[T]) -> T:
+        """Body of `response` validated as `target`"""
+        content = response.content
+        return await self._run(content, validate_json, target, content)
+
+    async def decode_raw(self, response: httpx.Response) -> Any:
+        """Body of `response` as plain JSON values, for untyped payloads"""
+        content = response.content
+        return await self._run(content, from_json, content)
+
+
+# Global decoder shared by the upstream adapters
+upstream_decoder = UpstreamDecoder(Settings().UPSTREAM_DECODE_THREAD_BYTES)
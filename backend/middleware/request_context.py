@@ -0,0 +1,135 @@
+"""
+Request context middleware for FastAPI applications.
+
+A single plain ASGI layer that handles what used to take three stacked
+BaseHTTPMiddleware layers:
+1. Correlation IDs: read from X-Correlation-ID or generated, stored in the
+   request context and echoed on the response
+2. Error mapping: unexpected exceptions become a JSON 500 response
+3. Event emission: successful requests dispatch their mapped event
+
+Messages are passed straight through, so streamed bodies are never
+buffered and no extra task is spawned per request.
+"""
+
+import logging
+from http import HTTPStatus
+from typing import Optional
+
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from config.event_mappings import get_event_stream_for_request
+from infrastructure.correlation import CorrelationIdManager
+from infrastructure.event_service import EventService
+
+logger = logging.getLogger(__name__)
+
+CORRELATION_ID_HEADER = "X-Correlation-ID"
+_HEADER_KEY = CORRELATION_ID_HEADER.lower().encode("latin-1")
+
+
+class RequestContextMiddleware:
+    """Correlation ids, error mapping and event emission in one layer"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        event_service: Optional[EventService] = None,
+        dispatch_events: bool = True,
+    ):
+        self.app = app
+        self.event_service = event_service
+        self.dispatch_events = dispatch_events and event_service is not None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        correlation_id = self._correlation_id(scope)
+        token = CorrelationIdManager.set_correlation_id(correlation_id)
+        header = (_HEADER_KEY, correlation_id.encode("latin-1"))
+        status: Optional[int] = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message["headers"] = [
+                    *message.get("headers", []),
+                    header,
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+            # A 304 answers a conditional GET that still counts as served
+            if self.dispatch_events and status and (
+                200 <= status < 300 or status == HTTPStatus.NOT_MODIFIED
+            ):
+                await self._dispatch_event(scope, correlation_id)
+        except Exception as e:
+            if status is not None:
+                # Headers are already out; let the server close the
+                # connection
+                raise
+            logger.exception(
+                f"Unhandled error in {scope['method']} {scope['path']}: {e}"
+            )
+            await self._error_response(e)(scope, receive, send_wrapper)
+            return
+        finally:
+            CorrelationIdManager.reset_correlation_id(token)
+
+    @staticmethod
+    def _correlation_id(scope: Scope) -> str:
+        for name, value in scope.get("headers", []):
+            if name == _HEADER_KEY and value:
+                correlation_id = value.decode("latin-1")
+                logger.debug(
+                    f"Using provided correlation ID: {correlation_id}"
+                )
+                return correlation_id
+
+        correlation_id = CorrelationIdManager.generate_correlation_id()
+        logger.debug(f"Generated new correlation ID: {correlation_id}")
+        return correlation_id
+
+    @staticmethod
+    def _error_response(error: Exception) -> JSONResponse:
+        """Same body shape as ApiException, for errors nothing handled"""
+        status_code = getattr(error, "status_code", None)
+        if isinstance(status_code, int):
+            detail = getattr(error, "detail", str(error))
+            return JSONResponse({"detail": detail}, status_code=status_code)
+
+        return JSONResponse(
+            {"detail": {"message": str(error), "details": None}},
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR.value,
+        )
+
+    async def _dispatch_event(
+        self, scope: Scope, correlation_id: str
+    ) -> None:
+        # Don't let event dispatch errors affect the main response
+        try:
+            # The router records the matched route in the scope, so
+            # mapped routes are found by template without matching paths
+            route = scope.get("route")
+            event_stream = get_event_stream_for_request(
+                method=scope["method"],
+                path=scope["path"],
+                route_template=getattr(route, "path", None),
+            )
+            if event_stream:
+                # The response is already sent; this is one outbox insert
+                await self.event_service.publish(
+                    event_stream, correlation_id
+                )
+                logger.debug(
+                    f"Event dispatched: {event_stream} for"
+                    f" {scope['method']} {scope['path']}"
+                )
+        except Exception as e:
+            logger.error(f"Error in event dispatch: {str(e)}")
@@ -0,0 +1,171 @@
+"""
+Request/response logging middleware for FastAPI applications.
+
+Implemented as a plain ASGI middleware so responses stream straight
+through: bodies are only observed as they pass, up to a size cap, and
+never buffered or rebuilt.
+"""
+
+import logging
+import random
+import time
+from typing import Callable, Iterable, List, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("api.access")
+
+REDACTED = "[redacted]"
+
+# Response bodies worth logging; anything else is summarised by size
+_TEXT_CONTENT_TYPES = (
+    "application/json",
+    "application/problem",
+    "text/plain",
+)
+
+
+def no_request_log(endpoint: Callable) -> Callable:
+    """Route decorator opting an endpoint out of request logging"""
+    endpoint.skip_request_log = True
+    return endpoint
+
+
+class _Capture:
+    """First bytes of a body plus its total size"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.size = 0
+        self.chunks: List[bytes] = []
+        self._kept = 0
+
+    def add(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self._kept < self.limit and chunk:
+            part = chunk[: self.limit - self._kept]
+            self.chunks.append(part)
+            self._kept += len(part)
+
+    def text(self) -> str:
+        body = b"".join(self.chunks).decode("utf-8", errors="replace")
+        if self.size > self._kept:
+            body += f"... [{self.size - self._kept} more bytes]"
+        return body
+
+
+class RequestLoggingMiddleware:
+    """
+    Logs one line per sampled request with its status, duration and body
+    sizes. Redacted headers and truncated bodies are added when the
+    access logger is at DEBUG. Failed requests are always logged.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = 1.0,
+        max_body_bytes: int = 2048,
+        redact_headers: Iterable[str] = (),
+        exclude_paths: Iterable[str] = (),
+    ):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.max_body_bytes = max_body_bytes
+        self.redact_headers = {name.lower() for name in redact_headers}
+        self.exclude_paths = tuple(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"].startswith(
+            self.exclude_paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        sampled = random.random() < self.sample_rate
+        verbose = logger.isEnabledFor(logging.DEBUG)
+        capture_bodies = verbose and self.max_body_bytes > 0
+        request_body = _Capture(self.max_body_bytes if capture_bodies else 0)
+        response_body = _Capture(0)
+        response_start: Optional[Message] = None
+        started = time.perf_counter()
+
+        async def receive_wrapper() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                request_body.add(message.get("body", b""))
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_start, response_body
+            if message["type"] == "http.response.start":
+                response_start = message
+                if capture_bodies and self._is_text(message):
+                    response_body = _Capture(self.max_body_bytes)
+            elif message["type"] == "http.response.body":
+                response_body.add(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        except Exception:
+            self._log(
+                scope, 500, started, request_body, response_body, verbose
+            )
+            raise
+
+        status = response_start["status"] if response_start else 500
+        if sampled or status >= 500:
+            self._log(
+                scope, status, started, request_body, response_body, verbose
+            )
+
+    @staticmethod
+    def _is_text(message: Message) -> bool:
+        for name, value in message.get("headers", []):
+            if name.lower() == b"content-type":
+                content_type = value.decode("latin-1")
+                return content_type.startswith(_TEXT_CONTENT_TYPES)
+        return False
+
+    def _headers(self, scope: Scope) -> dict:
+        return {
+            name.decode("latin-1"): (
+                REDACTED
+                if name.decode("latin-1").lower() in self.redact_headers
+                else value.decode("latin-1")
+            )
+            for name, value in scope.get("headers", [])
+        }
+
+    def _log(
+        self,
+        scope: Scope,
+        status: int,
+        started: float,
+        request_body: _Capture,
+        response_body: _Capture,
+        verbose: bool,
+    ) -> None:
+        endpoint = scope.get("endpoint")
+        if endpoint is not None and getattr(
+            endpoint, "skip_request_log", False
+        ):
+            return
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        line = (
+            f"[API] {scope['method']} {scope['path']} {status}"
+            f" {elapsed_ms:.1f}ms in={request_body.size}B"
+            f" out={response_body.size}B"
+        )
+        level = logging.ERROR if status >= 500 else logging.INFO
+
+        if verbose:
+            line += f" - Headers: {self._headers(scope)}"
+            if request_body.size:
+                line += f", Body: {request_body.text()}"
+            if response_body.chunks:
+                line += f", Response: {response_body.text()}"
+
+        logger.log(level, line)
@@ -63,3 +63,7 @@ class DroneMappingRepository(ABC):
         """Create multiple drone mappings at once"""
         pass
 
+    @abstractmethod
+    async def get_version(self) -> int:
+        """Data version, increased on every write to drone mappings"""
+        pass
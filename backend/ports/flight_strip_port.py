@@ -96,3 +96,7 @@ class FlightStripRepositoryPort(ABC):
         """Check if flight strip exists by database ID"""
         pass
 
+    @abstractmethod
+    async def get_version(self) -> int:
+        """Data version, increased on every write to flight strips"""
+        pass
@@ -2,7 +2,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Tuple
 
-from domain.flights import Flight
+from domain.flights import BatchFlight, Flight
 from schemas.requests.flights import QueryFlightsRequest
 
 
@@ -14,3 +14,9 @@ class FlightDataPort(ABC):
         self, area: QueryFlightsRequest
     ) -> Tuple[List[Flight], List[dict]]:
         pass
+
+    @abstractmethod
+    async def get_active_flights_batch(
+        self, areas: List[QueryFlightsRequest]
+    ) -> Tuple[List[BatchFlight], List[dict]]:
+        pass
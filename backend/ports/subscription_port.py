@@ -0,0 +1,50 @@
+# Ports - interfaces for DSS subscription management
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from domain.external.dss.remoteid import (
+    CreateSubscriptionParameters,
+    PutSubscriptionResponse,
+)
+from domain.external.dss.subscriptions import (
+    PutSubscriptionParameters,
+    Subscription,
+)
+
+
+class AirspaceSubscriptionPort(ABC):
+    """Port for keeping DSS subscriptions on areas of interest"""
+
+    @abstractmethod
+    async def put_subscription(
+        self,
+        subscription_id: str,
+        params: PutSubscriptionParameters,
+        version: Optional[str] = None,
+    ) -> Subscription:
+        pass
+
+    @abstractmethod
+    async def delete_subscription(
+        self, subscription_id: str, version: str, for_constraints: bool
+    ) -> None:
+        pass
+
+
+class RemoteIDSubscriptionPort(ABC):
+    """Port for keeping Remote ID subscriptions on areas of interest"""
+
+    @abstractmethod
+    async def put_subscription(
+        self,
+        subscription_id: str,
+        params: CreateSubscriptionParameters,
+        version: Optional[str] = None,
+    ) -> PutSubscriptionResponse:
+        pass
+
+    @abstractmethod
+    async def delete_subscription(
+        self, subscription_id: str, version: str
+    ) -> None:
+        pass
@@ -1,28 +1,64 @@
 # New airspace routes with better naming and hexagonal architecture
+from functools import lru_cache
 from http import HTTPStatus
-from fastapi import APIRouter, Body, Depends
+from typing import Optional
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    Query,
+    Request,
+)
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
 
 from application.airspace_use_case import AirspaceQueryUseCase
 from adapters.dss_adapter import DSSAdapter
 from adapters.uss_adapter import USSAdapter
 from adapters.flights_adapter import FlightsAdapter
+from adapters.live_traffic_adapter import LiveTrafficAdapter
+from config.config import Settings
+from routes.uss_notifications import (
+    get_airspace_subscription_use_case,
+    get_remote_id_subscription_use_case,
+)
+from domain.airspace import AirspaceFlights
 from domain.base import Volume4D
+from infrastructure.sse import SSE_HEADERS, event_stream
 from schemas.api import ApiResponse
-from schemas.requests.flights import QueryFlightsRequest
+from utils.etag import (
+    etag_from_content,
+    etag_headers,
+    etag_matches,
+    not_modified,
+)
+from utils.flight_encoding import JSON_MEDIA_TYPE, encode_flights, negotiate
+from utils.responses import ModelResponse, api_response, render_api_response
+from schemas.requests.flights import (
+    QueryFlightsBatchRequest,
+    QueryFlightsRequest,
+)
 
 router = APIRouter(tags=["Airspace"], prefix="/airspace")
 
+# JSON flight responses depend on the negotiated media type
+_VARY_ACCEPT = {"Vary": "Accept"}
+
 
+@lru_cache
 def get_airspace_query_use_case() -> AirspaceQueryUseCase:
     """Dependency injection for airspace query use case"""
     dss_adapter = DSSAdapter()
     uss_adapter = USSAdapter()
-    flights_adapter = FlightsAdapter()
+    flights_adapter = LiveTrafficAdapter(FlightsAdapter())
 
     return AirspaceQueryUseCase(
         airspace_references_port=dss_adapter,
         airspace_details_port=uss_adapter,
         flight_port=flights_adapter,
+        subscriptions=get_airspace_subscription_use_case(),
+        rid_subscriptions=get_remote_id_subscription_use_case(),
     )
 
 
@@ -34,6 +70,8 @@ def get_airspace_query_use_case() -> AirspaceQueryUseCase:
 )
 async def get_airspace_snapshot(
     area_of_interest: Volume4D = Body(),
+    tolerance: Optional[float] = Query(default=None, gt=0, le=100000),
+    if_none_match: Optional[str] = Header(default=None),
     use_case: AirspaceQueryUseCase = Depends(get_airspace_query_use_case),
 ):
     """
@@ -41,17 +79,32 @@ async def get_airspace_snapshot(
     - Constraints (no-fly zones, restrictions)
     - Operational intents (planned flights)
     - Identification service areas (remote ID coverage)
+
+    With `tolerance` (metres, e.g. the map's metres per pixel) volume
+    outlines are simplified for zoomed-out views.
+
+    The response carries a content ETag; sending it back in
+    If-None-Match returns 304 when the allocations did not change.
     """
-    snapshot = await use_case.get_airspace_allocations(area_of_interest)
+    snapshot = await use_case.get_airspace_allocations(
+        area_of_interest, tolerance
+    )
 
-    return ApiResponse(
-        message=(
+    body = render_api_response(
+        (
             "Airspace snapshot retrieved with"
             f" {snapshot.total_volumes} volumes"
         ),
-        data=snapshot,
+        snapshot,
     )
 
+    # The snapshot timestamp changes on every call, so leave it out
+    etag = etag_from_content(body.replace(to_json(snapshot.timestamp), b"", 1))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    return ModelResponse(body, headers=etag_headers(etag))
+
 
 @router.post(
     "/flights",
@@ -61,15 +114,95 @@ async def get_airspace_snapshot(
 )
 async def get_active_flights(
     area: QueryFlightsRequest = Body(),
+    since: Optional[str] = Query(default=None),
+    accept: Optional[str] = Header(default=None),
     use_case: AirspaceQueryUseCase = Depends(get_airspace_query_use_case),
 ):
     """
     Get live flight data for drones
-    currently active in the specified area
+    currently active in the specified area.
+
+    With `since` (empty on the first call) only the changes since that
+    cursor are returned, together with the cursor for the next call.
+
+    Accept `application/vnd.utm.flights.columnar+json` or
+    `application/msgpack` for the compact columnar layout.
+    """
+    if since is not None:
+        flights_response = await use_case.get_active_flights_delta(
+            area, since
+        )
+    else:
+        flights_response = await use_case.get_active_flights(area)
+
+    message = "Active flight data retrieved"
+    media_type = negotiate(accept)
+    if media_type != JSON_MEDIA_TYPE:
+        return encode_flights(message, flights_response, media_type)
+
+    return api_response(message, flights_response, headers=_VARY_ACCEPT)
+
+
+@router.get(
+    "/flights/stream",
+    response_description="Stream active flights in an area",
+    response_class=StreamingResponse,
+)
+async def stream_active_flights(
+    request: Request,
+    area: QueryFlightsRequest = Depends(),
+    use_case: AirspaceQueryUseCase = Depends(get_airspace_query_use_case),
+):
+    """
+    Push live flight data for the area as Server-Sent Events,
+    keeping only the latest snapshot for slow clients
     """
-    flights_response = await use_case.get_active_flights(area)
+    settings = Settings()
+
+    # Every frame is a full snapshot, so a reconnecting client simply
+    # starts again from the next one
+    def encode(snapshot: AirspaceFlights):
+        return "flights", None, snapshot.model_dump_json()
+
+    frames = use_case.stream_active_flights(
+        area, interval=settings.FLIGHT_STREAM_INTERVAL
+    )
 
-    return ApiResponse(
-        message="Active flight data retrieved",
-        data=flights_response,
+    return StreamingResponse(
+        event_stream(
+            frames,
+            encode,
+            is_disconnected=request.is_disconnected,
+            heartbeat=settings.FLIGHT_STREAM_HEARTBEAT,
+            retry_ms=settings.FLIGHT_STREAM_RETRY_MS,
+        ),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
     )
+
+
+@router.post(
+    "/flights/batch",
+    response_description="Get active flights in several areas",
+    response_model=ApiResponse,
+    status_code=HTTPStatus.OK.value,
+)
+async def get_active_flights_batch(
+    request: QueryFlightsBatchRequest = Body(),
+    accept: Optional[str] = Header(default=None),
+    use_case: AirspaceQueryUseCase = Depends(get_airspace_query_use_case),
+):
+    """
+    Get live flight data for several rectangles in a single call,
+    each flight tagged with the rectangles it belongs to
+    """
+    flights_response = await use_case.get_active_flights_batch(
+        request.rectangles
+    )
+
+    message = "Active flight data retrieved"
+    media_type = negotiate(accept)
+    if media_type != JSON_MEDIA_TYPE:
+        return encode_flights(message, flights_response, media_type)
+
+    return api_response(message, flights_response, headers=_VARY_ACCEPT)
@@ -1,4 +1,5 @@
 # Constraint management routes with hexagonal architecture
+from functools import lru_cache
 from http import HTTPStatus
 from typing import List, Any
 from fastapi import APIRouter, Body, Depends
@@ -12,6 +13,7 @@ from schemas.api import ApiResponse, ApiException
 router = APIRouter(tags=["Constraints"], prefix="/constraints")
 
 
+@lru_cache
 def get_constraint_management_use_case() -> ConstraintManagementUseCase:
     """Dependency injection for constraint management use case"""
     constraint_adapter = ConstraintManagementAdapter()
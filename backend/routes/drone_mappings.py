@@ -1,7 +1,15 @@
 """Drone Mapping API Routes"""
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query, Path, HTTPException
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Path,
+    Query,
+    Response,
+)
 from http import HTTPStatus
 
 from application.drone_mapping_use_case import DroneMappingUseCase
@@ -12,6 +20,12 @@ from schemas.requests.drone_mapping import (
     BulkCreateDroneMappingsRequest,
     UpdateDroneMappingRequest,
 )
+from utils.etag import (
+    etag_from_version,
+    etag_matches,
+    not_modified,
+    set_etag,
+)
 from schemas.responses.drone_mapping import (
     DroneMappingResponse,
     DroneMappingCreatedResponse,
@@ -225,11 +239,21 @@ async def restore_drone_mapping(
     description="List all active drone mappings",
 )
 async def list_drone_mappings(
+    response: Response,
     offset: int = Query(0, ge=0, description="Number of results to skip"),
+    if_none_match: Optional[str] = Header(default=None),
     use_case: DroneMappingUseCase = Depends(get_drone_mapping_use_case),
 ) -> DroneMappingListResponse:
     """List all active drone mappings"""
 
+    # Unchanged data answers 304 without querying the drone mappings
+    etag = etag_from_version(
+        "drone-mappings", await use_case.get_data_version(), offset
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+
     drone_mappings = await use_case.list_all_drone_mappings()
 
     return DroneMappingListResponse(
@@ -1,7 +1,7 @@
 """Flight Strip API Routes - Simplified REST endpoints matching frontend UI"""
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query, Path
+from fastapi import APIRouter, Depends, Header, Query, Path, Response
 from http import HTTPStatus
 
 from application.flight_strip_use_case import FlightStripUseCase
@@ -13,6 +13,12 @@ from schemas.requests.flight_strip import (
     SearchFlightStripsRequest,
     FlightArea,
 )
+from utils.etag import (
+    etag_from_version,
+    etag_matches,
+    not_modified,
+    set_etag,
+)
 from schemas.responses.flight_strip import (
     FlightStripResponse,
     FlightStripListResponse,
@@ -159,6 +165,7 @@ async def update_flight_strip(
     description="List all flight strips or search with filters",
 )
 async def list_flight_strips(
+    response: Response,
     flight_area: Optional[FlightArea] = Query(
         None, description="Filter by flight area"
     ),
@@ -169,10 +176,24 @@ async def list_flight_strips(
         None, description="Filter takeoff time to (HH:MM)"
     ),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
+    if_none_match: Optional[str] = Header(default=None),
     use_case: FlightStripUseCase = Depends(get_flight_strip_use_case),
 ) -> FlightStripListResponse:
     """List or search flight strips"""
 
+    # Unchanged data answers 304 without querying the flight strips
+    etag = etag_from_version(
+        "flight-strips",
+        await use_case.get_data_version(),
+        flight_area,
+        takeoff_time_start,
+        takeoff_time_end,
+        offset,
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+
     if flight_area or takeoff_time_start or takeoff_time_end:
         # Search with filters
         flight_strips = await use_case.search_flight_strips(
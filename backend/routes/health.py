@@ -1,6 +1,9 @@
 from http import HTTPStatus
 from fastapi import APIRouter, Depends
 from utils.correlation import correlation_id_dependency
+from middleware.request_logging import no_request_log
+from infrastructure.event_service import event_service
+from infrastructure.log_queue import log_queue
 from schemas.api import ApiException, ApiResponse
 import logging
 
@@ -14,9 +17,35 @@ router = APIRouter(tags=["Health"], prefix="/healthy")
     response_model=ApiResponse,
     status_code=HTTPStatus.OK.value,
 )
+@no_request_log
 async def health_check(correlation_id: str = Depends(correlation_id_dependency)):
     logger.info("Health check endpoint called")
     return ApiResponse(
         message="OK",
         data={"correlation_id": correlation_id}
     )
+
+
+@router.get(
+    "/logs",
+    response_model=ApiResponse,
+    status_code=HTTPStatus.OK.value,
+)
+@no_request_log
+async def log_queue_stats():
+    """Records waiting in the log queue and dropped because it was full"""
+    return ApiResponse(
+        message="OK",
+        data={"pending": log_queue.pending, "dropped": log_queue.dropped},
+    )
+
+
+@router.get(
+    "/events",
+    response_model=ApiResponse,
+    status_code=HTTPStatus.OK.value,
+)
+@no_request_log
+async def event_queue_stats():
+    """Event queue depth and delivery, retry and drop counters"""
+    return ApiResponse(message="OK", data=await event_service.stats())
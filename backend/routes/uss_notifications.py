@@ -0,0 +1,122 @@
+# USS callback routes - notifications sent by peers for our subscriptions
+from functools import lru_cache
+from http import HTTPStatus
+from typing import Optional
+from fastapi import APIRouter, Body, Depends, Header, Response
+
+from application.airspace_subscription_use_case import (
+    AirspaceSubscriptionUseCase,
+)
+from application.remote_id_subscription_use_case import (
+    RemoteIDSubscriptionUseCase,
+)
+from adapters.dss_subscription_adapter import (
+    DSSRemoteIDSubscriptionAdapter,
+    DSSSubscriptionAdapter,
+)
+from domain.external.uss.constraints import PutConstraintDetailsParameters
+from domain.external.uss.operational_intents import (
+    PutOperationalIntentDetailsParameters,
+)
+from domain.external.uss.remoteid import (
+    PutIdentificationServiceAreaNotificationParameters,
+)
+from infrastructure.access_tokens import Scope, access_tokens
+from schemas.enums import Authority, RIDAuthority
+
+router = APIRouter(tags=["USS Notifications"], prefix="/uss/v1")
+
+# Remote ID callbacks live under the unversioned /uss prefix
+rid_router = APIRouter(tags=["USS Notifications"], prefix="/uss")
+
+
+@lru_cache
+def get_airspace_subscription_use_case() -> AirspaceSubscriptionUseCase:
+    """Dependency injection for the airspace subscription use case"""
+    return AirspaceSubscriptionUseCase(
+        subscription_port=DSSSubscriptionAdapter(),
+    )
+
+
+@lru_cache
+def get_remote_id_subscription_use_case() -> RemoteIDSubscriptionUseCase:
+    """Dependency injection for the Remote ID subscription use case"""
+    return RemoteIDSubscriptionUseCase(
+        subscription_port=DSSRemoteIDSubscriptionAdapter(),
+    )
+
+
+def _require_scope(*scopes: Scope):
+    """Dependency rejecting callers without a valid token for `scopes`"""
+
+    async def check(authorization: Optional[str] = Header(default=None)):
+        await access_tokens.validate(authorization, *scopes)
+
+    return Depends(check)
+
+
+@router.post(
+    "/operational_intents",
+    response_description="Notify of operational intent changes",
+    status_code=HTTPStatus.NO_CONTENT.value,
+    dependencies=[_require_scope(Authority.STRATEGIC_COORDINATION)],
+)
+async def notify_operational_intent(
+    params: PutOperationalIntentDetailsParameters = Body(),
+    use_case: AirspaceSubscriptionUseCase = Depends(
+        get_airspace_subscription_use_case
+    ),
+):
+    """
+    Receive a new, changed or removed operational intent
+    in an area one of our subscriptions covers
+    """
+    await use_case.notify_operational_intent(params)
+    return Response(status_code=HTTPStatus.NO_CONTENT.value)
+
+
+@router.post(
+    "/constraints",
+    response_description="Notify of constraint changes",
+    status_code=HTTPStatus.NO_CONTENT.value,
+    # ASTM F3548 peers send constraint_processing tokens here
+    dependencies=[
+        _require_scope(
+            Authority.STRATEGIC_COORDINATION,
+            Authority.CONSTRAINT_PROCESSING,
+        )
+    ],
+)
+async def notify_constraint(
+    params: PutConstraintDetailsParameters = Body(),
+    use_case: AirspaceSubscriptionUseCase = Depends(
+        get_airspace_subscription_use_case
+    ),
+):
+    """
+    Receive a new, changed or removed constraint
+    in an area one of our subscriptions covers
+    """
+    await use_case.notify_constraint(params)
+    return Response(status_code=HTTPStatus.NO_CONTENT.value)
+
+
+@rid_router.post(
+    "/identification_service_areas/{id}",
+    response_description="Notify of identification service area changes",
+    status_code=HTTPStatus.NO_CONTENT.value,
+    dependencies=[_require_scope(RIDAuthority.SERVICE_PROVIDER)],
+)
+async def notify_identification_service_area(
+    id: str,
+    params: PutIdentificationServiceAreaNotificationParameters = Body(),
+    use_case: RemoteIDSubscriptionUseCase = Depends(
+        get_remote_id_subscription_use_case
+    ),
+):
+    """
+    Receive a new, changed or removed identification service area
+    in an area one of our Remote ID subscriptions covers
+    """
+    await use_case.notify_identification_service_area(id, params)
+    return Response(status_code=HTTPStatus.NO_CONTENT.value)
@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from typing import List
+
+from pydantic import BaseModel, Field
 
 
 class QueryFlightsRequest(BaseModel):
@@ -10,3 +12,13 @@ class QueryFlightsRequest(BaseModel):
     east: float
     south: float
     west: float
+
+
+class QueryFlightsBatchRequest(BaseModel):
+    """
+    Data model for querying flights in several rectangles at once.
+    """
+
+    rectangles: List[QueryFlightsRequest] = Field(
+        ..., min_length=1, max_length=16
+    )
@@ -0,0 +1,54 @@
+"""
+Helpers for ETag validators and conditional (If-None-Match) requests.
+"""
+
+import hashlib
+from typing import Any, Dict, Optional
+
+from http import HTTPStatus
+
+from fastapi import Response
+
+
+def etag_from_content(content: bytes) -> str:
+    """Strong ETag derived from the exact response body"""
+    return f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+
+
+def etag_from_version(resource: str, version: int, *params: Any) -> str:
+    """
+    Strong ETag derived from a data version and the request parameters
+    that shape the response, so it can be checked before any work.
+    """
+    key = repr((resource, version, params)).encode()
+    digest = hashlib.blake2b(key, digest_size=8).hexdigest()
+    return f'"{resource}-{version}-{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def etag_headers(etag: str) -> Dict[str, str]:
+    """The validator, asking clients to revalidate every time"""
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response carrying the validator"""
+    return Response(
+        status_code=HTTPStatus.NOT_MODIFIED.value,
+        headers=etag_headers(etag),
+    )
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """Attach the validator and ask clients to revalidate every time"""
+    response.headers.update(etag_headers(etag))
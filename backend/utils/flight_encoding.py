@@ -0,0 +1,189 @@
+"""
+Compact wire formats for live flight responses, chosen by the Accept header.
+
+The columnar layout sends the per-tick flight state as parallel arrays and
+interns the fields that do not change between ticks (aircraft type, ISA,
+details) in tables referenced by index. It is served as JSON or packed
+with MessagePack; plain JSON of the domain models stays the default.
+"""
+
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, Hashable, List, Optional, Union
+
+import msgpack
+from fastapi import Response
+
+from domain.airspace import (
+    AirspaceFlights,
+    AirspaceFlightsBatch,
+    AirspaceFlightsDelta,
+)
+from domain.flights import Flight
+
+JSON_MEDIA_TYPE = "application/json"
+COLUMNAR_MEDIA_TYPE = "application/vnd.utm.flights.columnar+json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+_MEDIA_TYPES = {
+    JSON_MEDIA_TYPE: JSON_MEDIA_TYPE,
+    COLUMNAR_MEDIA_TYPE: COLUMNAR_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE: MSGPACK_MEDIA_TYPE,
+    "application/x-msgpack": MSGPACK_MEDIA_TYPE,
+}
+
+# Per-tick state, one array per field
+STATE_COLUMNS = ("id", "lat", "lng", "alt", "track", "speed", "timestamp")
+
+
+def negotiate(accept: Optional[str]) -> str:
+    """Best supported media type for an Accept header, JSON by default"""
+    if not accept:
+        return JSON_MEDIA_TYPE
+
+    best, best_quality = JSON_MEDIA_TYPE, 0.0
+    for part in accept.split(","):
+        media_type, *params = [item.strip() for item in part.split(";")]
+        media_type = _MEDIA_TYPES.get(media_type.lower())
+        if media_type is None:
+            continue
+
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+
+        # Ties keep the order of the header
+        if quality > best_quality:
+            best, best_quality = media_type, quality
+
+    return best
+
+
+def _epoch_ms(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1000)
+
+
+class _ColumnarEncoder:
+    """Builds the columnar layout, interning static fields as it goes"""
+
+    def __init__(self):
+        self.isas: List[dict] = []
+        self.static: List[dict] = []
+        self._isa_index: Dict[str, int] = {}
+        self._static_index: Dict[Hashable, int] = {}
+
+    def state_columns(self, flights) -> Dict[str, list]:
+        """Parallel arrays of the current state of each flight"""
+        columns: Dict[str, list] = {name: [] for name in STATE_COLUMNS}
+        for flight in flights:
+            state = flight.current_state
+            position = state.position if state else None
+            columns["id"].append(flight.id)
+            columns["lat"].append(position.lat if position else None)
+            columns["lng"].append(position.lng if position else None)
+            columns["alt"].append(position.alt if position else None)
+            columns["track"].append(state.track if state else None)
+            columns["speed"].append(state.speed if state else None)
+            columns["timestamp"].append(
+                _epoch_ms(state.timestamp.value) if state else None
+            )
+        return columns
+
+    def flight_columns(self, flights: List[Flight]) -> Dict[str, list]:
+        """State columns plus the index of each flight's static record"""
+        columns = self.state_columns(flights)
+        columns["static"] = [self._static_ref(flight) for flight in flights]
+        return columns
+
+    def _isa_ref(self, flight: Flight) -> int:
+        isa = flight.identification_service_area
+        index = self._isa_index.get(isa.id)
+        if index is None:
+            index = self._isa_index[isa.id] = len(self.isas)
+            self.isas.append(isa.model_dump(mode="json"))
+        return index
+
+    def _static_ref(self, flight: Flight) -> int:
+        isa = self._isa_ref(flight)
+        details = flight.details
+        key = (
+            flight.aircraft_type.value,
+            flight.simulated,
+            isa,
+            details.id if details else None,
+            # Operating areas are rare and not worth comparing
+            flight.id if flight.operating_area else None,
+        )
+
+        index = self._static_index.get(key)
+        if index is None:
+            index = self._static_index[key] = len(self.static)
+            self.static.append({
+                "aircraft_type": flight.aircraft_type.value,
+                "simulated": flight.simulated,
+                "isa": isa,
+                "details": (
+                    details.model_dump(mode="json") if details else None
+                ),
+                "operating_area": (
+                    flight.operating_area.model_dump(mode="json")
+                    if flight.operating_area
+                    else None
+                ),
+            })
+        return index
+
+    def tables(self) -> Dict[str, List[dict]]:
+        return {"static": self.static, "isas": self.isas}
+
+
+def to_columns(snapshot) -> Dict[str, Any]:
+    """Columnar layout of a flights snapshot, batch or delta"""
+    encoder = _ColumnarEncoder()
+    data: Dict[str, Any] = {"timestamp": snapshot.timestamp.isoformat()}
+
+    if isinstance(snapshot, AirspaceFlightsDelta):
+        # Static fields only travel with the flights the client lacks
+        data["cursor"] = snapshot.cursor
+        data["full"] = snapshot.full
+        data["added"] = encoder.flight_columns(snapshot.added)
+        data["changed"] = encoder.state_columns(snapshot.changed)
+        data["removed"] = snapshot.removed
+    else:
+        data["flights"] = encoder.flight_columns(snapshot.flights)
+        if isinstance(snapshot, AirspaceFlightsBatch):
+            data["flights"]["rectangles"] = [
+                flight.rectangles for flight in snapshot.flights
+            ]
+
+    data.update(encoder.tables())
+    return data
+
+
+def encode_flights(
+    message: str,
+    snapshot: Union[
+        AirspaceFlights, AirspaceFlightsBatch, AirspaceFlightsDelta
+    ],
+    media_type: str,
+) -> Response:
+    """API response body of a flights snapshot in a compact media type"""
+    body = {"message": message, "data": to_columns(snapshot)}
+
+    if media_type == MSGPACK_MEDIA_TYPE:
+        content = msgpack.packb(body, use_bin_type=True)
+    else:
+        content = json.dumps(body, separators=(",", ":")).encode()
+
+    return Response(
+        content=content,
+        media_type=media_type,
+        headers={"Vary": "Accept"},
+    )
@@ -0,0 +1,50 @@
+"""
+JSON responses rendered straight from already-validated pydantic models.
+
+Returning a response from a route bypasses FastAPI's `response_model`
+handling, which would dump the model, validate the dump again and walk it
+once more through `jsonable_encoder` before encoding it. Here pydantic-core
+serializes the model tree to bytes in a single pass.
+"""
+
+from http import HTTPStatus
+from typing import Any, Mapping, Optional
+
+from fastapi import Response
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from schemas.api import ApiResponse
+
+
+class ModelResponse(Response):
+    """Response whose content is a pydantic model, serialized in Rust"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return to_json(content)
+
+
+def render_api_response(message: Optional[str], data: Any = None) -> bytes:
+    """Body of an ApiResponse; `data` is trusted to be validated already"""
+    envelope = ApiResponse.model_construct(message=message, data=data)
+    return envelope.__pydantic_serializer__.to_json(envelope)
+
+
+def api_response(
+    message: Optional[str],
+    data: Any = None,
+    status_code: int = HTTPStatus.OK.value,
+    headers: Optional[Mapping[str, str]] = None,
+) -> ModelResponse:
+    """ApiResponse envelope around `data`, rendered without re-validation"""
+    return ModelResponse(
+        render_api_response(message, data),
+        status_code=status_code,
+        headers=headers,
+    )
@@ -125,18 +125,15 @@ export const MapDataService = () => {
     rectangles: Rectangle[],
   ) => {
     try {
-      const allFlights: Flight[] = [];
-      for (const rectangle of rectangles) {
-        const area: Rectangle = {
+      const res = await FlightsService.queryBatch({
+        rectangles: rectangles.map((rectangle) => ({
           north: rectangle.north,
           south: rectangle.south,
           east: rectangle.east,
           west: rectangle.west,
-        };
-        const res = await FlightsService.query(area);
-        allFlights.push(...res.flights);
-      }
-      setFlights(allFlights);
+        })),
+      });
+      setFlights(res.flights);
       setMapState(MapState.ONLINE);
     } catch (e) {
       if (e.code === "ERR_NETWORK") {
@@ -155,6 +152,21 @@ export const MapDataService = () => {
     }
   };
 
+  // Roughly the metres covered by one pixel of the map, below which
+  // outline detail cannot be seen
+  const outlineTolerance = (rectangle: Rectangle) => {
+    const METERS_PER_DEGREE = 111320;
+    const pixels = viewer?.canvas.clientWidth || 1024;
+    const latitude = Cesium.Math.toRadians(
+      (rectangle.north + rectangle.south) / 2,
+    );
+    const width =
+      (rectangle.east - rectangle.west) *
+      METERS_PER_DEGREE *
+      Math.cos(latitude);
+    return width / pixels;
+  };
+
   const fetchVolumes = async (rectangle: Rectangle) => {
     if (!controller.current) return;
 
@@ -200,7 +212,10 @@ export const MapDataService = () => {
     };
 
     try {
-      const res = await AllocationsService.query(boundingVolume);
+      const res = await AllocationsService.query(
+        boundingVolume,
+        outlineTolerance(rectangle),
+      );
 
       const fetchedVolumes: Array<
         OperationalIntent | Constraint | IdentificationServiceAreaFull
@@ -6,9 +6,34 @@ import { api } from "./api";
 
 const RESOURCE_PATH = "/airspace";
 
+// Last allocations received, replayed when the server answers 304
+let lastQuery: {
+  key: string;
+  etag: string;
+  data: QueryAllocationsResponse;
+} | null = null;
+
 export const AllocationsService = {
-  query: async (params: QueryAllocationsRequest): Promise<QueryAllocationsResponse> => {
-    const res = await api.post(`${RESOURCE_PATH}/allocations`, params);
+  query: async (
+    params: QueryAllocationsRequest,
+    tolerance?: number,
+  ): Promise<QueryAllocationsResponse> => {
+    const key = JSON.stringify([params, tolerance ?? null]);
+    const cached = lastQuery?.key === key ? lastQuery : null;
+
+    // Tolerance in metres simplifies volume outlines for zoomed-out views
+    const res = await api.post(`${RESOURCE_PATH}/allocations`, params, {
+      params: tolerance ? { tolerance } : undefined,
+      headers: cached ? { "If-None-Match": cached.etag } : undefined,
+      validateStatus: (status) =>
+        (status >= 200 && status < 300) || status === 304,
+    });
+    if (res.status === 304 && cached) {
+      return cached.data;
+    }
+
+    const etag = res.headers["etag"];
+    lastQuery = etag ? { key, etag, data: res.data.data } : null;
     return res.data.data;
   },
 };
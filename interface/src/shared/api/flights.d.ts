@@ -11,3 +11,12 @@ export interface QueryFlightsResponse {
   timestamp: string;
   flights: Flight[];
 }
+
+export interface QueryFlightsBatchRequest {
+  rectangles: QueryFlightsRequest[];
+}
+
+export interface QueryFlightsBatchResponse {
+  timestamp: string;
+  flights: (Flight & { rectangles: number[] })[];
+}
@@ -1,4 +1,6 @@
 import type {
+  QueryFlightsBatchRequest,
+  QueryFlightsBatchResponse,
   QueryFlightsRequest,
   QueryFlightsResponse
 } from "./flights.d";
@@ -11,4 +13,10 @@ export const FlightsService = {
     const res = await api.post(`${RESOURCE_PATH}/flights`, params);
     return res.data.data;
   },
+  queryBatch: async (
+    params: QueryFlightsBatchRequest,
+  ): Promise<QueryFlightsBatchResponse> => {
+    const res = await api.post(`${RESOURCE_PATH}/flights/batch`, params);
+    return res.data.data;
+  },
 };